@@ -1,16 +1,23 @@
+import operator
 import os
+import re
 import sys
+import weakref
+from collections import OrderedDict
+from functools import partial
 from pathlib import Path
 from typing import Optional
 
-from PySide6.QtCore import Qt, QSize, QSettings, QTimer, QRect
-from PySide6.QtGui import QAction, QActionGroup, QKeySequence, QPainter, QColor, QBrush, QPalette, QFont, QFontMetrics
+from PySide6.QtCore import Qt, QIODevice, QObject, QRunnable, QSize, QSaveFile, QSettings, QThreadPool, QTimer, QRect, QRectF, Signal
+from PySide6.QtGui import QAction, QActionGroup, QKeySequence, QPainter, QColor, QBrush, QPen, QPalette, QFont, QFontMetrics
 from PySide6.QtWidgets import (
     QApplication,
     QFileDialog,
     QPlainTextEdit,
     QInputDialog,
+    QGraphicsRectItem,
     QGraphicsScene,
+    QGraphicsSimpleTextItem,
     QGraphicsView,
     QFrame,
     QHBoxLayout,
@@ -18,6 +25,7 @@ from PySide6.QtWidgets import (
     QMenu,
     QMainWindow,
     QMessageBox,
+    QProgressDialog,
     QSplitter,
     QSplitterHandle,
     QStatusBar,
@@ -39,10 +47,47 @@ from PySide6.QtWidgets import (
     QWidget,
 )
 
-from .rfm_model import RfmDocument, RfmElement
-from .rfm_parser import parse_rfm_content
+from .rfm_model import RfmDocument, RfmElement, RfmFrame
+from .rfm_parser import parse_frame_tail, parse_rfm_content, parse_tail_keyword
 from .rfm_renderer import RfmRenderer
-from .rfm_serializer import serialize_rfm
+from .rfm_serializer import format_backdrop_tag, serialize_rfm, serialize_rfm_iter
+
+
+# Read-only element attributes shown in the Properties panel, fetched with one attrgetter call each
+_IMAGE_RO_FIELDS = ("tint", "atint", "btint", "ctint", "dtint", "bolt", "bbolt")
+_IMAGE_RO_GETTER = operator.attrgetter(*_IMAGE_RO_FIELDS)
+_IMAGE_CMD_LABELS = ("next", "prev", "cvar", "cvari", "inc", "mod")
+_IMAGE_CMD_GETTER = operator.attrgetter("next_cmd", "prev_cmd", "cvar", "cvari", "inc", "mod")
+_GHOUL_RO_FIELDS = ("tint", "atint", "btint", "ctint", "dtint", "bolt", "bbolt", "cvar", "cvari", "inc", "mod", "align")
+_GHOUL_RO_GETTER = operator.attrgetter(*_GHOUL_RO_FIELDS)
+
+
+# First argument of a <text ...>/<image ...> tag body, for in-place rewrites from the Properties panel
+_TEXT_TAG_ARG_RE = re.compile(r"\s*text(\s+)(\"[^\"]*\"|[^>\s]+)?(.*)$", re.IGNORECASE)
+_IMAGE_TAG_ARG_RE = re.compile(r"\s*image(\s+)(\"[^\"]*\"|[^>\s]+)?(.*)$", re.IGNORECASE)
+
+# Splits "<base>_<N>" frame names for unique-name generation
+_FRAME_SUFFIX_RE = re.compile(r"^(.*?)_(\d+)$")
+
+# Shared by every file dialog; see _file_dialog
+_FILE_DIALOG_OPTIONS = QFileDialog.Option.DontUseCustomDirectoryIcons
+
+# Chunk size for QSaveFile writes
+_SAVE_CHUNK = 1 << 20
+
+
+def _write_text_atomic(target: Path | str, text: str) -> None:
+    # Write through QSaveFile so a failed save never leaves a truncated file behind
+    f = QSaveFile(str(target))
+    if not f.open(QIODevice.OpenModeFlag.WriteOnly):
+        raise OSError(f.errorString())
+    data = text.encode("utf-8")
+    for i in range(0, len(data), _SAVE_CHUNK):
+        if f.write(data[i:i + _SAVE_CHUNK]) < 0:
+            f.cancelWriting()
+            raise OSError(f.errorString())
+    if not f.commit():
+        raise OSError(f.errorString())
 
 
 class _NoVScrollGraphicsView(QGraphicsView):
@@ -438,17 +483,8 @@ class _OutlineTree(QTreeWidget):
                 wnd = self.window()
                 if hasattr(wnd, '_reorder_elements_by_segment_indices_for_doc'):
                     # Use the source doc for element moves
-                    changed = wnd._reorder_elements_by_segment_indices_for_doc(src_doc, new_order)
-                    if changed:
-                        try:
-                            from .rfm_serializer import serialize_rfm
-                            from .rfm_parser import parse_rfm_content
-                            doc = wnd.documents_by_key.get(src_doc)
-                            if doc is not None:
-                                text = serialize_rfm(doc)
-                                wnd.documents_by_key[src_doc] = parse_rfm_content(text, file_path=doc.file_path)
-                        except Exception:
-                            pass
+                    # Segment indices are shifted in place by the host; no reparse needed
+                    wnd._reorder_elements_by_segment_indices_for_doc(src_doc, new_order)
                     # Ensure active document pointer is updated if needed
                     try:
                         if getattr(wnd, 'active_doc_key', None) == src_doc:
@@ -569,7 +605,6 @@ class MenuDirBrowserDialog(QDialog):
         root_layout.addWidget(header)
 
         # Controls row
-        from PySide6.QtWidgets import QHBoxLayout
         controls = QHBoxLayout()
         self.only_with_subframes = QCheckBox("Only files with sub-frames")
         self.only_with_subframes.stateChanged.connect(self._rebuild_view)
@@ -635,7 +670,6 @@ class MenuDirBrowserDialog(QDialog):
                 if p.is_file():
                     candidates.append(p)
 
-        from .rfm_parser import parse_rfm_content
         for path in candidates:
             try:
                 rel = path.relative_to(self.menu_root)
@@ -809,10 +843,47 @@ class _OutlineItemDelegate(QStyledItemDelegate):
             painter.restore()
 
 
+class _ExportSignals(QObject):
+    # Lives on the GUI thread so emissions from the pool thread are queued back to it
+    finished = Signal(str)
+    failed = Signal(str)
+
+
+class _ExportWorker(QRunnable):
+    """Runs RmfParser.parse_and_pack + generate_cfg_output off the GUI thread."""
+
+    def __init__(self, parser_cls, text: str, seed_label: str) -> None:
+        super().__init__()
+        self.parser_cls = parser_cls
+        self.text = text
+        self.seed_label = seed_label
+        self.cancelled = False
+        self.signals = _ExportSignals()
+
+    def run(self) -> None:
+        try:
+            parser = self.parser_cls()
+            cvars = parser.parse_and_pack(self.text, self.seed_label)
+            cfg_text = parser.generate_cfg_output(cvars)
+        except Exception as e:  # noqa: BLE001
+            self.signals.failed.emit(str(e))
+            return
+        self.signals.finished.emit(cfg_text)
+
+
 class RfmEditorMainWindow(QMainWindow):
+    # Cross-check in-place segment reindexing against a full serialize/parse round-trip
+    _VERIFY_REINDEX = False
+
     def __init__(self) -> None:
         super().__init__()
         self.setWindowTitle("RFM Viewer & WYSIWYG Editor (beta)")
+        # Deferred refresh requests; set by _schedule_* and cleared by the real refresh
+        self._pending_outline = False
+        self._pending_scene = False
+        self._pending_recent = False
+        # In-flight .cfg export, if any
+        self._export_worker: Optional[_ExportWorker] = None
         self.resize(1200, 800)
 
         self.current_path: Optional[Path] = None
@@ -826,6 +897,11 @@ class RfmEditorMainWindow(QMainWindow):
         self.active_frame_name: Optional[str] = None
         self.dirty: bool = False
         self.renderer = RfmRenderer()
+        # Serialized text per document, reused while doc._rev is unchanged
+        self._serialize_cache: dict[int, tuple[weakref.ref, int, str]] = {}
+        # Resolved image paths for the Properties panel; cleared when search roots change
+        self._resolve_image_cache: dict[str, Optional[str]] = {}
+        self._resolve_image = self.renderer._resolve_image_path
         # Persistent settings for menu directory and resource directory
         self.settings = QSettings("dynamic_sof_apps", "rfm_editor")
         mrd = self.settings.value("menu_root_dir", "")
@@ -857,6 +933,8 @@ class RfmEditorMainWindow(QMainWindow):
 
     def _init_menu(self) -> None:
         file_menu = self.menuBar().addMenu("File")
+        # Keep a direct handle so the recent-files code never has to search the menu bar
+        self._file_menu = file_menu
 
         self.new_action = QAction("New", self)
         self.new_action.setShortcut(QKeySequence("Ctrl+N"))
@@ -1173,8 +1251,7 @@ class RfmEditorMainWindow(QMainWindow):
             center_wrap.setContentsMargins(0, 0, 0, 0)
         except Exception:
             pass
-        from PySide6.QtWidgets import QVBoxLayout as _QVBoxLayout
-        center_v = _QVBoxLayout(center_wrap)
+        center_v = QVBoxLayout(center_wrap)
         center_v.setContentsMargins(0, 0, 0, 0)
         center_v.setSpacing(0)
         center_v.addStretch(1)
@@ -1202,12 +1279,23 @@ class RfmEditorMainWindow(QMainWindow):
             center_v.addWidget(self.view)
         self.selection_overlay = None  # QGraphicsRectItem
         self.selection_label_item = None  # QGraphicsSimpleTextItem
+        # Selection label colors keyed by lowercased backfill token
+        self._label_color_cache: dict[str, QColor] = {}
+        # Last highlighted selection, used to skip rebuilding an identical overlay
+        self._last_highlight_key = None
+        self._last_highlight_rect = None
 
         # Right: Property editor and raw source view
         self.props = QTreeWidget(splitter)
         self.props.setHeaderLabels(["Property", "Value"]) 
         self.props.setMinimumWidth(64)
         self.props.itemChanged.connect(self.on_prop_item_changed)
+        # Detached property rows kept for reuse across selections
+        self._prop_item_pool: list[QTreeWidgetItem] = []
+        # Debounce for _autosize_props_panel
+        self._autosize_timer = QTimer(self)
+        self._autosize_timer.setSingleShot(True)
+        self._autosize_timer.timeout.connect(self._autosize_props_panel_impl)
 
         self.raw_view = QPlainTextEdit(splitter)
         self.raw_view.setReadOnly(True)
@@ -1306,9 +1394,8 @@ class RfmEditorMainWindow(QMainWindow):
             if getattr(self, 'document', None):
                 self.refresh_scene()
             else:
-                from PySide6.QtCore import QRectF as _QRectF
                 self.view.resetTransform()
-                self.scene.setSceneRect(_QRectF(0, 0, float(getattr(self.renderer, 'max_screen_width', 640) or 640), float(getattr(self.renderer, 'max_screen_height', 480) or 480)))
+                self.scene.setSceneRect(QRectF(0, 0, float(getattr(self.renderer, 'max_screen_width', 640) or 640), float(getattr(self.renderer, 'max_screen_height', 480) or 480)))
         except Exception:
             pass
         try:
@@ -1377,10 +1464,9 @@ class RfmEditorMainWindow(QMainWindow):
                         _, doc_key, seg_idx = payload
                         doc = self.documents_by_key.get(doc_key)
                         if doc:
-                            from .rfm_model import RfmElement
-                            elem = next((e for e in doc.elements if e.segment_index == seg_idx), None)
+                            elem = doc._element_by_segment.get(seg_idx)
                             raw = getattr(elem, 'raw_tag', '') if isinstance(elem, RfmElement) else ''
-                            elem_part = raw[1:-1] if isinstance(raw, str) and raw.startswith('<') and raw.endswith('>') else raw
+                            elem_part = raw[1:-1] if isinstance(raw, str) and raw[:1] == '<' and raw[-1:] == '>' else raw
                     elif tag == 'frame':
                         _, doc_key, frame_name = payload
                         doc = self.documents_by_key.get(doc_key)
@@ -1388,11 +1474,11 @@ class RfmEditorMainWindow(QMainWindow):
                             f = doc.frames.get(frame_name)
                             if f:
                                 full = f.to_tag_str()
-                                elem_part = full[1:-1] if full.startswith('<') and full.endswith('>') else full
+                                elem_part = full[1:-1] if full[:1] == '<' and full[-1:] == '>' else full
                 elif hasattr(payload, 'raw_tag'):
                     raw = getattr(payload, 'raw_tag')
                     if isinstance(raw, str):
-                        elem_part = raw[1:-1] if raw.startswith('<') and raw.endswith('>') else raw
+                        elem_part = raw[1:-1] if raw[:1] == '<' and raw[-1:] == '>' else raw
             except Exception:
                 pass
 
@@ -1551,9 +1637,8 @@ class RfmEditorMainWindow(QMainWindow):
                 replace_includes = True
             if replace_includes:
                 # Expand regular includes (already part of model) AND exinclude based on current toggle
-                base_serialized = serialize_rfm(self.document)
                 expanded_doc = parse_rfm_content(
-                    base_serialized,
+                    serialize_rfm_iter(self.document),
                     file_path=getattr(self.document, 'file_path', None),
                     expand_include=True,
                     expand_exinclude=True,
@@ -1567,9 +1652,9 @@ class RfmEditorMainWindow(QMainWindow):
                     try:
                         text = Path(fp).read_text(encoding="utf-8", errors="ignore")
                     except Exception:
-                        text = serialize_rfm(self.document)
+                        text = self._serialized(self.document)
                 else:
-                    text = serialize_rfm(self.document)
+                    text = self._serialized(self.document)
         except Exception:
             text = ""
         self.raw_view.setPlainText(text)
@@ -1646,11 +1731,23 @@ class RfmEditorMainWindow(QMainWindow):
         except Exception:
             pass
 
+    def _file_dialog(self, kind: str, title: str, start: str, name_filter: str = "") -> str:
+        # Custom directory icons cost a stat/icon lookup per entry, which stalls on network mounts
+        # and large folders; skipping them loses only per-folder icons. Native dialogs stay enabled.
+        opts = _FILE_DIALOG_OPTIONS
+        if kind == "dir":
+            return QFileDialog.getExistingDirectory(
+                self, title, start, opts | QFileDialog.Option.ShowDirsOnly
+            )
+        getter = QFileDialog.getSaveFileName if kind == "save" else QFileDialog.getOpenFileName
+        path, _ = getter(self, title, start, name_filter, options=opts)
+        return path
+
     # Actions
     def on_open(self) -> None:
         start_dir = str(self.menu_root or (self.current_path.parent if self.current_path else Path.cwd()))
-        path_str, _ = QFileDialog.getOpenFileName(
-            self,
+        path_str = self._file_dialog(
+            "open",
             "Open RFM file",
             start_dir,
             "Raven Menu Format (*.rmf);;All Files (*)",
@@ -1762,6 +1859,7 @@ class RfmEditorMainWindow(QMainWindow):
     def _reset_workspace(self) -> None:
         # Clear all open docs and UI state for a fresh start
         self.documents_by_key.clear()
+        self._serialize_cache.clear()
         self.doc_display_names.clear()
         self.main_doc_key = None
         self.active_doc_key = None
@@ -1772,7 +1870,7 @@ class RfmEditorMainWindow(QMainWindow):
         self.dirty = False
         try:
             self.outline.clear()
-            self.scene.clear()
+            self.renderer.clear_scene(self.scene)
             self._clear_selection_overlay()
         except Exception:
             pass
@@ -1865,7 +1963,37 @@ class RfmEditorMainWindow(QMainWindow):
         except Exception:
             return True
 
+    def _schedule_refresh_outline(self) -> None:
+        # Coalesce outline rebuilds requested within one event-loop turn into a single pass
+        if not self._pending_outline:
+            self._pending_outline = True
+            QTimer.singleShot(0, self._flush_outline)
+
+    def _flush_outline(self) -> None:
+        # Skip if a direct refresh_outline() already ran since scheduling
+        if self._pending_outline:
+            self.refresh_outline()
+
+    def _schedule_refresh_scene(self) -> None:
+        if not self._pending_scene:
+            self._pending_scene = True
+            QTimer.singleShot(0, self._flush_scene)
+
+    def _flush_scene(self) -> None:
+        if self._pending_scene:
+            self.refresh_scene()
+
+    def _schedule_rebuild_recent_menu(self) -> None:
+        if not self._pending_recent:
+            self._pending_recent = True
+            QTimer.singleShot(0, self._flush_recent)
+
+    def _flush_recent(self) -> None:
+        if self._pending_recent:
+            self._rebuild_recent_menu()
+
     def refresh_outline(self) -> None:
+        self._pending_outline = False
         # Snapshot current expansion state
         expanded_keys = self._snapshot_expanded_keys()
         self.outline.clear()
@@ -1886,11 +2014,8 @@ class RfmEditorMainWindow(QMainWindow):
             eff_doc = doc
             try:
                 if not doc.frames:
-                    from .rfm_serializer import serialize_rfm  # late import to avoid cycles
-                    from .rfm_parser import parse_rfm_content
-                    base_serialized = serialize_rfm(doc)
                     expanded = parse_rfm_content(
-                        base_serialized,
+                        serialize_rfm_iter(doc),
                         file_path=getattr(doc, 'file_path', None),
                         expand_include=True,
                         expand_exinclude=True,
@@ -2084,11 +2209,13 @@ class RfmEditorMainWindow(QMainWindow):
         self._restore_expanded_keys(expanded_keys)
 
     def refresh_scene(self) -> None:
-        # Remove selection overlay first to avoid removing a deleted item after scene.clear()
+        self._pending_scene = False
+        # Remove selection overlay first; the renderer owns every other item in the scene
         self._clear_selection_overlay()
-        self.scene.clear()
         if not self.document:
+            self.renderer.clear_scene(self.scene)
             return
+        # The renderer replaces only what changed since its last render into this scene
         # Ensure renderer knows the currently selected frame for labeling
         try:
             self.renderer.active_frame_name = self.active_frame_name
@@ -2240,15 +2367,11 @@ class RfmEditorMainWindow(QMainWindow):
                         pass
                     # Preload page .rmf files for frames revealed by the current exinclude mode across all open documents
                     try:
-                        from .rfm_serializer import serialize_rfm
-                        from .rfm_parser import parse_rfm_content
-                        from pathlib import Path as _Path
                         # Iterate a snapshot since we'll mutate documents_by_key
                         for base_key, base_doc in list(self.documents_by_key.items()):
                             try:
-                                base_serial = serialize_rfm(base_doc)
                                 eff = parse_rfm_content(
-                                    base_serial,
+                                    serialize_rfm_iter(base_doc),
                                     file_path=getattr(base_doc, 'file_path', None),
                                     expand_include=True,
                                     expand_exinclude=True,
@@ -2265,7 +2388,7 @@ class RfmEditorMainWindow(QMainWindow):
                                     continue
                                 cand = self._resolve_page_candidate_from_base(page_name, base_key)
                                 try:
-                                    sub_key = str(_Path(cand).resolve())
+                                    sub_key = str(Path(cand).resolve())
                                 except Exception:
                                     sub_key = str(cand)
                                 if sub_key in self.documents_by_key:
@@ -2293,7 +2416,7 @@ class RfmEditorMainWindow(QMainWindow):
                                 # Label as a named frame document in the outline
                                 try:
                                     if getattr(fr, 'name', None):
-                                        self.doc_display_names[sub_key] = f"Frame {fr.name} - {_Path(cand).name}"
+                                        self.doc_display_names[sub_key] = f"Frame {fr.name} - {Path(cand).name}"
                                 except Exception:
                                     pass
                                 # Recursively preload pages referenced by the new document
@@ -2414,11 +2537,8 @@ class RfmEditorMainWindow(QMainWindow):
                     frame = base_doc.frames.get(frame_name)
                 if frame is None and base_doc is not None:
                     try:
-                        from .rfm_serializer import serialize_rfm
-                        from .rfm_parser import parse_rfm_content
-                        serial = serialize_rfm(base_doc)
                         exp = parse_rfm_content(
-                            serial,
+                            serialize_rfm_iter(base_doc),
                             file_path=getattr(base_doc, 'file_path', None),
                             expand_include=True,
                             expand_exinclude=True,
@@ -2452,7 +2572,7 @@ class RfmEditorMainWindow(QMainWindow):
                     pass
                 # Find element by segment index
                 doc = self.documents_by_key[doc_key]
-                elem = next((e for e in doc.elements if e.segment_index == seg_index), None)
+                elem = doc._element_by_segment.get(seg_index)
                 if elem:
                     self.populate_props(elem)
                     self._highlight_payload(elem)
@@ -2467,7 +2587,6 @@ class RfmEditorMainWindow(QMainWindow):
         self._highlight_payload(payload)
         # Try to select the corresponding outline row for visibility
         try:
-            from .rfm_model import RfmFrame, RfmElement
             if isinstance(payload, RfmFrame) and self.document and self.document.file_path:
                 self._select_frame_item(self.document.file_path, payload.name)
             elif isinstance(payload, RfmElement) and self.document and self.document.file_path:
@@ -2724,16 +2843,16 @@ class RfmEditorMainWindow(QMainWindow):
                 # Recurse into it
                 self._autopreload_pages(key, visited)
                 continue
-            # Create missing files on demand as empty <stm> shells
-            if not candidate.exists():
+            # Load; create missing files on demand as empty <stm> shells
+            try:
+                text = candidate.read_text(encoding='utf-8')
+            except FileNotFoundError:
                 try:
                     candidate.parent.mkdir(parents=True, exist_ok=True)
                     candidate.write_text("<stm>\n\n</stm>\n", encoding='utf-8')
-                except Exception:
+                    text = "<stm>\n\n</stm>\n"
+                except OSError:
                     continue
-            # Load
-            try:
-                text = candidate.read_text(encoding='utf-8')
             except Exception:
                 continue
             subdoc = parse_rfm_content(text, file_path=str(candidate))
@@ -2755,12 +2874,6 @@ class RfmEditorMainWindow(QMainWindow):
         - Registers loaded docs into documents_by_key and labels with frame name
         - Recursively preloads pages referenced by new documents
         """
-        try:
-            from .rfm_serializer import serialize_rfm
-            from .rfm_parser import parse_rfm_content
-            from pathlib import Path as _Path
-        except Exception:
-            return
         keys = list(doc_keys) if doc_keys else list(self.documents_by_key.keys())
         for base_key in list(keys):
             base_doc = self.documents_by_key.get(base_key)
@@ -2768,9 +2881,8 @@ class RfmEditorMainWindow(QMainWindow):
                 continue
             # Build expanded view honoring current exinclude mode
             try:
-                base_serial = serialize_rfm(base_doc)
                 eff = parse_rfm_content(
-                    base_serial,
+                    serialize_rfm_iter(base_doc),
                     file_path=getattr(base_doc, 'file_path', None),
                     expand_include=True,
                     expand_exinclude=True,
@@ -2788,21 +2900,21 @@ class RfmEditorMainWindow(QMainWindow):
                     continue
                 cand = self._resolve_page_candidate_from_base(page_name, base_key)
                 try:
-                    sub_key = str(_Path(cand).resolve())
+                    sub_key = str(Path(cand).resolve())
                 except Exception:
                     sub_key = str(cand)
                 if sub_key in self.documents_by_key:
                     continue
-                # Create minimal file if missing
-                if not cand.exists():
+                # Load and register; create a minimal file if missing
+                try:
+                    text = cand.read_text(encoding='utf-8', errors='ignore')
+                except FileNotFoundError:
                     try:
                         cand.parent.mkdir(parents=True, exist_ok=True)
                         cand.write_text("<stm>\n\n</stm>\n", encoding='utf-8')
-                    except Exception:
+                        text = "<stm>\n\n</stm>\n"
+                    except OSError:
                         continue
-                # Load and register
-                try:
-                    text = cand.read_text(encoding='utf-8', errors='ignore')
                 except Exception:
                     continue
                 try:
@@ -2815,7 +2927,7 @@ class RfmEditorMainWindow(QMainWindow):
                 # Friendly label
                 try:
                     if getattr(fr, 'name', None):
-                        self.doc_display_names[sub_key] = f"Frame {fr.name} - {_Path(cand).name}"
+                        self.doc_display_names[sub_key] = f"Frame {fr.name} - {Path(cand).name}"
                 except Exception:
                     pass
                 # Recurse into the newly loaded doc for standard (non-exinclude) page references
@@ -2827,207 +2939,20 @@ class RfmEditorMainWindow(QMainWindow):
     def populate_props(self, payload: object) -> None:
         self.props.blockSignals(True)
         try:
-            self.props.clear()
+            self._release_prop_items()
             if payload is None:
                 return
-            from .rfm_model import RfmFrame, RfmElement
-
-            if isinstance(payload, RfmFrame):
-                # Pseudo property: all (full raw tag for frame)
+            # Collect rows and insert them in one batch to avoid per-item view updates
+            items: list[QTreeWidgetItem] = []
+            handler = self._PROPS_BY_TYPE.get(type(payload))
+            if handler is not None:
+                handler(self, items, payload)
+            if items:
+                self.props.setUpdatesEnabled(False)
                 try:
-                    full = payload.to_tag_str()
-                    all_item = QTreeWidgetItem(["all", full[1:-1] if full.startswith('<') and full.endswith('>') else full])
-                    all_item.setFlags(all_item.flags() & ~Qt.ItemFlag.ItemIsEditable)
-                    all_item.setToolTip(1, full)
-                    self.props.addTopLevelItem(all_item)
-                except Exception:
-                    pass
-                name_item = QTreeWidgetItem(["name", payload.name])
-                name_item.setFlags(name_item.flags() | Qt.ItemFlag.ItemIsEditable)
-                name_item.setData(0, Qt.ItemDataRole.UserRole, ("frame", "name", payload.name))
-
-                w_item = QTreeWidgetItem(["width", str(payload.width)])
-                w_item.setFlags(w_item.flags() | Qt.ItemFlag.ItemIsEditable)
-                w_item.setData(0, Qt.ItemDataRole.UserRole, ("frame", "width", payload.name))
-
-                h_item = QTreeWidgetItem(["height", str(payload.height)])
-                h_item.setFlags(h_item.flags() | Qt.ItemFlag.ItemIsEditable)
-                h_item.setData(0, Qt.ItemDataRole.UserRole, ("frame", "height", payload.name))
-
-                tail_item = QTreeWidgetItem(["tail", payload.raw_tail])
-                tail_item.setFlags(tail_item.flags() | Qt.ItemFlag.ItemIsEditable)
-                tail_item.setData(0, Qt.ItemDataRole.UserRole, ("frame", "tail", payload.name))
-
-                self.props.addTopLevelItem(name_item)
-                self.props.addTopLevelItem(w_item)
-                self.props.addTopLevelItem(h_item)
-                self.props.addTopLevelItem(tail_item)
-            elif isinstance(payload, RfmElement):
-                type_item = QTreeWidgetItem(["tag", payload.name])
-                type_item.setFlags(type_item.flags() & ~Qt.ItemFlag.ItemIsEditable)
-                self.props.addTopLevelItem(type_item)
-                # Pseudo property: all (full raw tag contents between < and >)
-                try:
-                    raw_tag = getattr(payload, 'raw_tag', '')
-                    raw_inner = ''
-                    if isinstance(raw_tag, str) and raw_tag.startswith('<') and raw_tag.endswith('>'):
-                        raw_inner = raw_tag[1:-1]
-                    all_item = QTreeWidgetItem(["all", raw_inner])
-                    all_item.setFlags(all_item.flags() & ~Qt.ItemFlag.ItemIsEditable)
-                    # Show full string on hover
-                    all_item.setToolTip(1, raw_inner)
-                    self.props.addTopLevelItem(all_item)
-                except Exception:
-                    pass
-                # Editable properties based on element type
-                if payload.name == "text":
-                    text_val = payload.text_content or ""
-                    txt_item = QTreeWidgetItem(["text", text_val])
-                    txt_item.setFlags(txt_item.flags() | Qt.ItemFlag.ItemIsEditable)
-                    txt_item.setData(0, Qt.ItemDataRole.UserRole, ("element", "text", payload.segment_index))
-                    self.props.addTopLevelItem(txt_item)
-                if payload.name == "image":
-                    img_val = payload.image_path or ""
-                    img_item = QTreeWidgetItem(["image", img_val])
-                    img_item.setFlags(img_item.flags() | Qt.ItemFlag.ItemIsEditable)
-                    img_item.setData(0, Qt.ItemDataRole.UserRole, ("element", "image", payload.segment_index))
-                    self.props.addTopLevelItem(img_item)
-                    # Image attributes
-                    def _add_ro(label: str, value: str | None) -> None:
-                        if not value:
-                            return
-                        it = QTreeWidgetItem([label, value])
-                        it.setFlags(it.flags() & ~Qt.ItemFlag.ItemIsEditable)
-                        self.props.addTopLevelItem(it)
-                    _add_ro("tint", getattr(payload, 'tint', None))
-                    _add_ro("atint", getattr(payload, 'atint', None))
-                    _add_ro("btint", getattr(payload, 'btint', None))
-                    _add_ro("ctint", getattr(payload, 'ctint', None))
-                    _add_ro("dtint", getattr(payload, 'dtint', None))
-                    _add_ro("bolt", getattr(payload, 'bolt', None))
-                    _add_ro("bbolt", getattr(payload, 'bbolt', None))
-                    if getattr(payload, 'key_name', None) or getattr(payload, 'key_command', None):
-                        _add_ro("key", f"{payload.key_name or ''}")
-                        _add_ro("command", f"{payload.key_command or ''}")
-                    if getattr(payload, 'ckey_var', None):
-                        _add_ro("ckey", f"{payload.ckey_var or ''}")
-                        if getattr(payload, 'ckey_false_command', None):
-                            _add_ro("false", f"{payload.ckey_false_command}")
-                        if getattr(payload, 'ckey_true_command', None):
-                            _add_ro("true", f"{payload.ckey_true_command}")
-                    if getattr(payload, 'ikey_action', None):
-                        _add_ro("ikey", f"{payload.ikey_action}")
-                        if getattr(payload, 'ikey_command', None):
-                            _add_ro("command", f"{payload.ikey_command}")
-                    _add_ro("tip", getattr(payload, 'tip_text', None))
-                    if any(getattr(payload, f, False) for f in ("noshade", "noscale", "noborder")):
-                        flags = []
-                        if getattr(payload, 'noshade', False):
-                            flags.append('noshade')
-                        if getattr(payload, 'noscale', False):
-                            flags.append('noscale')
-                        if getattr(payload, 'noborder', False):
-                            flags.append('noborder')
-                        _add_ro("flags", ", ".join(flags))
-                    if any(getattr(payload, f, None) is not None for f in ("area_border_width","area_border_line_width","area_border_line_color")):
-                        _add_ro("border", f"{payload.area_border_width or 0} {payload.area_border_line_width or 0} {payload.area_border_line_color or ''}")
-                    if getattr(payload, 'width_px', None) is not None:
-                        _add_ro("width", str(payload.width_px))
-                    if getattr(payload, 'height_px', None) is not None:
-                        _add_ro("height", str(payload.height_px))
-                    if getattr(payload, 'next_cmd', None):
-                        _add_ro("next", payload.next_cmd)
-                    if getattr(payload, 'prev_cmd', None):
-                        _add_ro("prev", payload.prev_cmd)
-                    if getattr(payload, 'cvar', None):
-                        _add_ro("cvar", payload.cvar)
-                    if getattr(payload, 'cvari', None):
-                        _add_ro("cvari", payload.cvari)
-                    if getattr(payload, 'inc', None):
-                        _add_ro("inc", payload.inc)
-                    if getattr(payload, 'mod', None):
-                        _add_ro("mod", payload.mod)
-                    if getattr(payload, 'xoff', None) is not None:
-                        _add_ro("xoff", str(payload.xoff))
-                    if getattr(payload, 'yoff', None) is not None:
-                        _add_ro("yoff", str(payload.yoff))
-                    if getattr(payload, 'tab', False):
-                        _add_ro("tab", "true")
-                    if getattr(payload, 'align', None):
-                        _add_ro("align", payload.align)
-                    # Also show resolved path (read-only) for debugging/path clarity
-                    try:
-                        resolved = getattr(self.renderer, "_resolve_image_path")(img_val) if img_val else None
-                    except Exception:
-                        resolved = None
-                    if resolved:
-                        full = resolved
-                        disp = (full if len(full) <= 64 else (full[:30] + "…" + full[-30:]))
-                        res_item = QTreeWidgetItem(["resolved", disp])
-                        # Show full path in tooltip for hover
-                        res_item.setToolTip(1, full)
-                        res_item.setFlags(res_item.flags() & ~Qt.ItemFlag.ItemIsEditable)
-                        self.props.addTopLevelItem(res_item)
-                if payload.name in {"bghoul", "ghoul"}:
-                    # Show model and common area attributes
-                    def _add_ro2(label: str, value: str | None) -> None:
-                        if not value:
-                            return
-                        it = QTreeWidgetItem([label, value])
-                        it.setFlags(it.flags() & ~Qt.ItemFlag.ItemIsEditable)
-                        self.props.addTopLevelItem(it)
-                    _add_ro2("model", getattr(payload, 'model_name', None))
-                    if getattr(payload, 'scale_val', None) is not None:
-                        _add_ro2("scale", str(payload.scale_val))
-                    if getattr(payload, 'time_val', None) is not None:
-                        _add_ro2("time", str(payload.time_val))
-                    # Common area attributes
-                    for lab in ("tint","atint","btint","ctint","dtint","bolt","bbolt","cvar","cvari","inc","mod","align"):
-                        _add_ro2(lab, getattr(payload, lab, None))
-                    if getattr(payload, 'key_name', None) or getattr(payload, 'key_command', None):
-                        _add_ro2("key", f"{payload.key_name or ''}")
-                        _add_ro2("command", f"{payload.key_command or ''}")
-                    if getattr(payload, 'ckey_var', None):
-                        _add_ro2("ckey", payload.ckey_var)
-                    if getattr(payload, 'ikey_action', None):
-                        _add_ro2("ikey", payload.ikey_action)
-                    _add_ro2("tip", getattr(payload, 'tip_text', None))
-                    flags = []
-                    if getattr(payload, 'noshade', False): flags.append('noshade')
-                    if getattr(payload, 'noscale', False): flags.append('noscale')
-                    if getattr(payload, 'noborder', False): flags.append('noborder')
-                    if flags:
-                        _add_ro2("flags", ", ".join(flags))
-                    if any(getattr(payload, f, None) is not None for f in ("area_border_width","area_border_line_width","area_border_line_color")):
-                        _add_ro2("border", f"{payload.area_border_width or 0} {payload.area_border_line_width or 0} {payload.area_border_line_color or ''}")
-                    if getattr(payload, 'width_px', None) is not None:
-                        _add_ro2("width", str(payload.width_px))
-                    if getattr(payload, 'height_px', None) is not None:
-                        _add_ro2("height", str(payload.height_px))
-                    if getattr(payload, 'xoff', None) is not None:
-                        _add_ro2("xoff", str(payload.xoff))
-                    if getattr(payload, 'yoff', None) is not None:
-                        _add_ro2("yoff", str(payload.yoff))
-            elif isinstance(payload, tuple) and payload[0] == "backdrop":
-                # Backdrop properties
-                mode_val = self.document.backdrop_mode or ""
-                mode_item = QTreeWidgetItem(["mode", mode_val])
-                mode_item.setFlags(mode_item.flags() | Qt.ItemFlag.ItemIsEditable)
-                mode_item.setData(0, Qt.ItemDataRole.UserRole, ("backdrop", "mode", None))
-
-                img_val = self.document.backdrop_image or ""
-                img_item = QTreeWidgetItem(["image", img_val])
-                img_item.setFlags(img_item.flags() | Qt.ItemFlag.ItemIsEditable)
-                img_item.setData(0, Qt.ItemDataRole.UserRole, ("backdrop", "image", None))
-
-                col_val = self.document.backdrop_bgcolor or ""
-                col_item = QTreeWidgetItem(["bgcolor", col_val])
-                col_item.setFlags(col_item.flags() | Qt.ItemFlag.ItemIsEditable)
-                col_item.setData(0, Qt.ItemDataRole.UserRole, ("backdrop", "bgcolor", None))
-
-                self.props.addTopLevelItem(mode_item)
-                self.props.addTopLevelItem(img_item)
-                self.props.addTopLevelItem(col_item)
+                    self.props.addTopLevelItems(items)
+                finally:
+                    self.props.setUpdatesEnabled(True)
             # After populating, keep props panel width stable; enable horizontal scroll
             try:
                 self.props.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAsNeeded)
@@ -3044,11 +2969,189 @@ class RfmEditorMainWindow(QMainWindow):
         except Exception:
             pass
 
+    def _release_prop_items(self) -> None:
+        # Detach current rows and keep them for reuse instead of letting clear() delete them
+        pool = self._prop_item_pool
+        take = self.props.takeTopLevelItem
+        for _ in range(self.props.topLevelItemCount()):
+            it = take(0)
+            if it is not None:
+                pool.append(it)
+
+    def _acquire_item(self, label: str, value: str, *, editable: bool = False, user_data: object = None) -> QTreeWidgetItem:
+        pool = self._prop_item_pool
+        if pool:
+            # Reset a pooled row so no tooltip or payload leaks from the previous selection
+            it = pool.pop()
+            it.setText(0, label)
+            it.setText(1, value)
+            it.setToolTip(1, "")
+            it.setData(0, Qt.ItemDataRole.UserRole, None)
+        else:
+            it = QTreeWidgetItem([label, value])
+        if editable:
+            it.setFlags(it.flags() | Qt.ItemFlag.ItemIsEditable)
+        else:
+            it.setFlags(it.flags() & ~Qt.ItemFlag.ItemIsEditable)
+        if user_data is not None:
+            it.setData(0, Qt.ItemDataRole.UserRole, user_data)
+        return it
+
+    def _add_ro_row(self, items: list[QTreeWidgetItem], label: str, value: str | None) -> None:
+        # Read-only row, skipped when the attribute is unset
+        if not value:
+            return
+        items.append(self._acquire_item(label, value))
+
+    def _props_for_frame(self, items: list[QTreeWidgetItem], payload: RfmFrame) -> None:
+        # Pseudo property: all (full raw tag for frame)
+        try:
+            full = payload.to_tag_str()
+            all_item = self._acquire_item("all", full[1:-1] if full[:1] == '<' and full[-1:] == '>' else full)
+            all_item.setToolTip(1, full)
+            items.append(all_item)
+        except Exception:
+            pass
+        items.append(self._acquire_item("name", payload.name, editable=True, user_data=("frame", "name", payload.name)))
+        items.append(self._acquire_item("width", str(payload.width), editable=True, user_data=("frame", "width", payload.name)))
+        items.append(self._acquire_item("height", str(payload.height), editable=True, user_data=("frame", "height", payload.name)))
+        items.append(self._acquire_item("tail", payload.raw_tail, editable=True, user_data=("frame", "tail", payload.name)))
+
+    def _props_for_element(self, items: list[QTreeWidgetItem], payload: RfmElement) -> None:
+        items.append(self._acquire_item("tag", payload.name))
+        # Pseudo property: all (full raw tag contents between < and >)
+        try:
+            raw_tag = getattr(payload, 'raw_tag', '')
+            raw_inner = ''
+            if isinstance(raw_tag, str) and raw_tag[:1] == '<' and raw_tag[-1:] == '>':
+                raw_inner = raw_tag[1:-1]
+            all_item = self._acquire_item("all", raw_inner)
+            # Show full string on hover
+            all_item.setToolTip(1, raw_inner)
+            items.append(all_item)
+        except Exception:
+            pass
+        # Editable properties based on element type
+        handler = self._ELEMENT_PROPS_BY_NAME.get(payload.name)
+        if handler is not None:
+            handler(self, items, payload)
+
+    def _props_for_text(self, items: list[QTreeWidgetItem], payload: RfmElement) -> None:
+        text_val = payload.text_content or ""
+        items.append(self._acquire_item("text", text_val, editable=True, user_data=("element", "text", payload.segment_index)))
+
+    def _props_for_image(self, items: list[QTreeWidgetItem], payload: RfmElement) -> None:
+        img_val = payload.image_path or ""
+        items.append(self._acquire_item("image", img_val, editable=True, user_data=("element", "image", payload.segment_index)))
+        # Image attributes
+        add_ro = self._add_ro_row
+        for lab, val in zip(_IMAGE_RO_FIELDS, _IMAGE_RO_GETTER(payload)):
+            add_ro(items, lab, val)
+        if payload.key_name or payload.key_command:
+            add_ro(items, "key", f"{payload.key_name or ''}")
+            add_ro(items, "command", f"{payload.key_command or ''}")
+        if payload.ckey_var:
+            add_ro(items, "ckey", f"{payload.ckey_var or ''}")
+            if payload.ckey_false_command:
+                add_ro(items, "false", f"{payload.ckey_false_command}")
+            if payload.ckey_true_command:
+                add_ro(items, "true", f"{payload.ckey_true_command}")
+        if payload.ikey_action:
+            add_ro(items, "ikey", f"{payload.ikey_action}")
+            if payload.ikey_command:
+                add_ro(items, "command", f"{payload.ikey_command}")
+        add_ro(items, "tip", payload.tip_text)
+        add_ro(items, "flags", payload._flags_str)
+        add_ro(items, "border", payload._border_str)
+        if payload.width_px is not None:
+            add_ro(items, "width", str(payload.width_px))
+        if payload.height_px is not None:
+            add_ro(items, "height", str(payload.height_px))
+        for lab, val in zip(_IMAGE_CMD_LABELS, _IMAGE_CMD_GETTER(payload)):
+            add_ro(items, lab, val)
+        if payload.xoff is not None:
+            add_ro(items, "xoff", str(payload.xoff))
+        if payload.yoff is not None:
+            add_ro(items, "yoff", str(payload.yoff))
+        if payload.tab:
+            add_ro(items, "tab", "true")
+        add_ro(items, "align", payload.align)
+        # Also show resolved path (read-only) for debugging/path clarity
+        resolved = self._cached_resolve_image(img_val) if img_val else None
+        if resolved:
+            full = resolved
+            disp = (full if len(full) <= 64 else (full[:30] + "…" + full[-30:]))
+            res_item = self._acquire_item("resolved", disp)
+            # Show full path in tooltip for hover
+            res_item.setToolTip(1, full)
+            items.append(res_item)
+
+    def _cached_resolve_image(self, img_val: str) -> Optional[str]:
+        cache = self._resolve_image_cache
+        if img_val in cache:
+            return cache[img_val]
+        try:
+            resolved = self._resolve_image(img_val)
+        except Exception:
+            resolved = None
+        cache[img_val] = resolved
+        return resolved
+
+    def _props_for_ghoul(self, items: list[QTreeWidgetItem], payload: RfmElement) -> None:
+        # Show model and common area attributes
+        add_ro = self._add_ro_row
+        add_ro(items, "model", payload.model_name)
+        if payload.scale_val is not None:
+            add_ro(items, "scale", str(payload.scale_val))
+        if payload.time_val is not None:
+            add_ro(items, "time", str(payload.time_val))
+        # Common area attributes
+        for lab, val in zip(_GHOUL_RO_FIELDS, _GHOUL_RO_GETTER(payload)):
+            add_ro(items, lab, val)
+        if payload.key_name or payload.key_command:
+            add_ro(items, "key", f"{payload.key_name or ''}")
+            add_ro(items, "command", f"{payload.key_command or ''}")
+        if payload.ckey_var:
+            add_ro(items, "ckey", payload.ckey_var)
+        if payload.ikey_action:
+            add_ro(items, "ikey", payload.ikey_action)
+        add_ro(items, "tip", payload.tip_text)
+        add_ro(items, "flags", payload._flags_str)
+        add_ro(items, "border", payload._border_str)
+        if payload.width_px is not None:
+            add_ro(items, "width", str(payload.width_px))
+        if payload.height_px is not None:
+            add_ro(items, "height", str(payload.height_px))
+        if payload.xoff is not None:
+            add_ro(items, "xoff", str(payload.xoff))
+        if payload.yoff is not None:
+            add_ro(items, "yoff", str(payload.yoff))
+
+    def _props_for_tuple(self, items: list[QTreeWidgetItem], payload: tuple) -> None:
+        if not (payload and payload[0] == "backdrop"):
+            return
+        # Backdrop properties
+        items.append(self._acquire_item("mode", self.document.backdrop_mode or "", editable=True, user_data=("backdrop", "mode", None)))
+        items.append(self._acquire_item("image", self.document.backdrop_image or "", editable=True, user_data=("backdrop", "image", None)))
+        items.append(self._acquire_item("bgcolor", self.document.backdrop_bgcolor or "", editable=True, user_data=("backdrop", "bgcolor", None)))
+
+    # Properties panel builders keyed by payload type, then by element tag name
+    _PROPS_BY_TYPE = {
+        RfmFrame: _props_for_frame,
+        RfmElement: _props_for_element,
+        tuple: _props_for_tuple,
+    }
+    _ELEMENT_PROPS_BY_NAME = {
+        "text": _props_for_text,
+        "image": _props_for_image,
+        "ghoul": _props_for_ghoul,
+        "bghoul": _props_for_ghoul,
+    }
+
     def _update_text_tag(self, raw_tag: str, new_text: str) -> str:
         # Replace first argument of <text ...> with quoted new_text
-        import re as _re
         inner = raw_tag[1:-1]
-        m = _re.match(r"\s*text(\s+)(\"[^\"]*\"|[^>\s]+)?(.*)$", inner, flags=_re.IGNORECASE)
+        m = _TEXT_TAG_ARG_RE.match(inner)
         if not m:
             return raw_tag
         space, first, rest = m.groups()
@@ -3057,9 +3160,8 @@ class RfmEditorMainWindow(QMainWindow):
         return rebuilt
 
     def _update_image_tag(self, raw_tag: str, new_path: str) -> str:
-        import re as _re
         inner = raw_tag[1:-1]
-        m = _re.match(r"\s*image(\s+)(\"[^\"]*\"|[^>\s]+)?(.*)$", inner, flags=_re.IGNORECASE)
+        m = _IMAGE_TAG_ARG_RE.match(inner)
         if not m:
             return raw_tag
         space, first, rest = m.groups()
@@ -3102,6 +3204,14 @@ class RfmEditorMainWindow(QMainWindow):
                 except ValueError:
                     return
             elif key == "tail":
+                # Edits confined to one parsed keyword only re-read that token span
+                if self._apply_tail_span_edit(frame, new_val):
+                    self.document._rev += 1
+                    self.dirty = True
+                    self.refresh_outline()
+                    self.refresh_scene()
+                    self._highlight_payload(frame)
+                    return
                 # Update raw tail and re-parse to refresh border/backfill/page fields
                 frame.raw_tail = new_val
                 # Reset structured fields
@@ -3112,54 +3222,11 @@ class RfmEditorMainWindow(QMainWindow):
                 frame.page = None
                 frame.cut_from = None
                 frame.cursor = None
-                frame.tail_extra = ""
-                # Simple whitespace tokenization (matches initial parse behavior)
-                tail_tokens = (new_val or "").split()
-                j = 0
-                consumed = [False] * len(tail_tokens)
-                while j < len(tail_tokens):
-                    tok = tail_tokens[j].lower()
-                    if tok == "border" and j + 3 < len(tail_tokens):
-                        try:
-                            frame.border_width = int(tail_tokens[j + 1])
-                            frame.border_line_width = int(tail_tokens[j + 2])
-                            frame.border_line_color = tail_tokens[j + 3]
-                            consumed[j] = consumed[j + 1] = consumed[j + 2] = consumed[j + 3] = True
-                            j += 4
-                            continue
-                        except ValueError:
-                            pass
-                    if tok == "backfill" and j + 1 < len(tail_tokens):
-                        frame.backfill_color = tail_tokens[j + 1]
-                        consumed[j] = consumed[j + 1] = True
-                        j += 2
-                        continue
-                    if tok == "cut" and j + 1 < len(tail_tokens):
-                        frame.cut_from = tail_tokens[j + 1]
-                        consumed[j] = consumed[j + 1] = True
-                        j += 2
-                        continue
-                    if tok == "cursor" and j + 1 < len(tail_tokens):
-                        try:
-                            frame.cursor = int(tail_tokens[j + 1])
-                            consumed[j] = consumed[j + 1] = True
-                            j += 2
-                            continue
-                        except ValueError:
-                            pass
-                    if tok == "page" and j + 1 < len(tail_tokens):
-                        frame.page = tail_tokens[j + 1].strip('"')
-                        consumed[j] = consumed[j + 1] = True
-                        j += 2
-                        continue
-                    if tok == "cpage" and j + 1 < len(tail_tokens):
-                        frame.cpage_cvar = tail_tokens[j + 1].strip('"')
-                        consumed[j] = consumed[j + 1] = True
-                        j += 2
-                        continue
-                    j += 1
-                extras = [t for t, c in zip(tail_tokens, consumed) if not c]
-                frame.tail_extra = " ".join(extras)
+                frame.cpage_cvar = None
+                frame._tail_token_spans = {}
+                # Same keyword handlers and whitespace tokenization as the initial parse
+                parse_frame_tail(frame, (new_val or "").split())
+            self.document._rev += 1
             self.dirty = True
             self.refresh_outline()
             self.refresh_scene()
@@ -3178,19 +3245,18 @@ class RfmEditorMainWindow(QMainWindow):
             # commit
             self.document.segments[seg_idx] = ("tag", new_tag)
             # also update element in memory
-            for el in self.document.elements:
-                if el.segment_index == seg_idx:
-                    el.raw_tag = new_tag
-                    if key == "text":
-                        el.text_content = new_val
-                    elif key == "image":
-                        el.image_path = new_val
-                    break
+            el = self.document._element_by_segment.get(seg_idx)
+            if el is not None:
+                el.raw_tag = new_tag
+                if key == "text":
+                    el.text_content = new_val
+                elif key == "image":
+                    el.image_path = new_val
+            self.document._rev += 1
             self.dirty = True
             self.refresh_outline()
             self.refresh_scene()
             # Reselect the same element by index if possible
-            from .rfm_model import RfmElement
             self._highlight_payload(RfmElement(name="", raw_tag="", segment_index=seg_idx))
             try:
                 self._autosize_props_panel()
@@ -3210,11 +3276,13 @@ class RfmEditorMainWindow(QMainWindow):
             # Rebuild segment if present
             if self.document.backdrop_segment_index is not None:
                 seg_idx = self.document.backdrop_segment_index
-                # Trigger a serialize-reparse style rebuild for consistency
-                from .rfm_serializer import serialize_rfm
-                from .rfm_parser import parse_rfm_content
-                text = serialize_rfm(self.document)
-                self.document = parse_rfm_content(text)
+                # Rewrite only the backdrop tag; frames/elements and their indices are untouched
+                self.document.segments[seg_idx] = ("tag", format_backdrop_tag(
+                    self.document.backdrop_mode,
+                    self.document.backdrop_image,
+                    self.document.backdrop_bgcolor,
+                ))
+            self.document._rev += 1
             self.dirty = True
             self.refresh_outline()
             self.refresh_scene()
@@ -3224,7 +3292,35 @@ class RfmEditorMainWindow(QMainWindow):
             except Exception:
                 pass
 
-    def _autosize_props_panel(self, min_floor: int = 240) -> None:
+    def _apply_tail_span_edit(self, frame: RfmFrame, new_val: str) -> bool:
+        # Returns True when the edit only touched tokens of a single parsed keyword
+        # (e.g. the color in 'border 40 0 clear'); the caller reparses the whole tail otherwise.
+        old_tokens = (frame.raw_tail or "").split()
+        new_tokens = (new_val or "").split()
+        if len(old_tokens) != len(new_tokens):
+            return False
+        changed = [i for i, (a, b) in enumerate(zip(old_tokens, new_tokens)) if a != b]
+        if not changed:
+            frame.raw_tail = new_val
+            return True
+        for kw, (start, end) in frame._tail_token_spans.items():
+            if changed[0] < start or changed[-1] >= end:
+                continue
+            # The keyword itself must be unchanged for the span to still mean the same field
+            if new_tokens[start].lower() != kw:
+                return False
+            # Re-read the span with the parser's handler; it must consume exactly the same tokens
+            if parse_tail_keyword(frame, new_tokens, start) != end:
+                return False
+            frame.raw_tail = new_val
+            return True
+        return False
+
+    def _autosize_props_panel(self) -> None:
+        # Coalesce bursts of property commits into a single column/width pass
+        self._autosize_timer.start(50)
+
+    def _autosize_props_panel_impl(self, min_floor: int = 240) -> None:
         # Compute needed width to fit "Property" and "Value" columns nicely, and
         # allow shrinking back down to a reasonable floor when content is smaller.
         try:
@@ -3272,16 +3368,40 @@ class RfmEditorMainWindow(QMainWindow):
         except Exception:
             pass
         self.selection_label_item = None
+        self._last_highlight_key = None
+        self._last_highlight_rect = None
+
+    def _highlight_key(self, payload: object) -> object:
+        # Elements are re-highlighted through fresh placeholder objects, so key them by segment
+        if isinstance(payload, RfmElement):
+            return ("element", id(self.document), payload.segment_index)
+        if isinstance(payload, RfmFrame):
+            # Backfill drives the label color, so a change must rebuild the overlay
+            return ("frame", id(payload), payload.backfill_color)
+        if isinstance(payload, tuple):
+            return ("backdrop",)
+        return id(payload)
 
     def _highlight_payload(self, payload: object) -> None:
-        self._clear_selection_overlay()
         if not self.document:
+            self._clear_selection_overlay()
             return
         rect = self.renderer.selection_rect_for(payload, self.document)
         if rect is None:
+            self._clear_selection_overlay()
             return
-        from PySide6.QtGui import QPen
-        from PySide6.QtCore import Qt
+        key = self._highlight_key(payload)
+        if key == self._last_highlight_key and rect == self._last_highlight_rect:
+            # Same selection and geometry: keep the existing overlay if a scene rebuild has not dropped it
+            try:
+                overlay = self.selection_overlay
+                if overlay is not None and overlay.scene() is not None:
+                    return
+            except Exception:
+                pass
+        self._clear_selection_overlay()
+        self._last_highlight_key = key
+        self._last_highlight_rect = rect
         pen = QPen(Qt.GlobalColor.yellow)
         pen.setWidth(2)
         pen.setCosmetic(True)
@@ -3295,9 +3415,8 @@ class RfmEditorMainWindow(QMainWindow):
                 inner = rect
             # Clamp to content area (screen) minus a 1px safety margin to avoid any bleed from AA
             try:
-                from PySide6.QtCore import QRectF as _QRectF
                 screen = getattr(self.renderer, 'content_rect', None)
-                if screen is not None and isinstance(screen, _QRectF):
+                if screen is not None and isinstance(screen, QRectF):
                     safe = screen.adjusted(1.0, 1.0, -1.0, -1.0)
                     inter = inner.intersected(safe)
                     if inter.width() > 0 and inter.height() > 0:
@@ -3306,37 +3425,59 @@ class RfmEditorMainWindow(QMainWindow):
                 pass
         except Exception:
             inner = rect
-        self.selection_overlay = self.scene.addRect(inner, pen)
+        # Configure overlay items before they join the scene and hold change signals until both are in,
+        # so the view sees one invalidation for the selection instead of one per item mutation
+        overlay = QGraphicsRectItem(inner)
+        overlay.setPen(pen)
         # Draw the selection border above frames but below text labels
-        self.selection_overlay.setZValue(100)
-
+        overlay.setZValue(100)
+        label = None
         # If highlighting a frame, overlay a label as a separate top-most item
         try:
-            from .rfm_model import RfmFrame
             if isinstance(payload, RfmFrame):
                 # Determine label text and color based on frame backfill
                 name = payload.name
                 text = f"frame {name}"
-                # Compute contrast color using renderer's token parser
-                from PySide6.QtGui import QColor
-                bg_token = getattr(payload, 'backfill_color', None)
-                if bg_token and str(bg_token).lower() != 'clear':
-                    bg = self.renderer._color_from_token(str(bg_token))
-                    r, g, b = bg.red(), bg.green(), bg.blue()
-                    luminance = 0.2126 * r + 0.7152 * g + 0.0722 * b
-                    color = QColor(0, 0, 0) if luminance >= 140 else QColor(255, 255, 255)
-                else:
-                    color = QColor(255, 255, 255)
-                label = self.scene.addSimpleText(text)
+                # Contrast color for the frame's backfill, cached per token
+                color = self._label_color_for(getattr(payload, 'backfill_color', None))
+                label = QGraphicsSimpleTextItem(text)
                 label.setBrush(color)
                 label.setPos(inner.left() + 4, inner.top() + 2)
-                try:
-                    label.setZValue(1000000)
-                except Exception:
-                    pass
-                self.selection_label_item = label
+                label.setZValue(1000000)
         except Exception:
-            pass
+            label = None
+        self.scene.blockSignals(True)
+        try:
+            self.scene.addItem(overlay)
+            self.selection_overlay = overlay
+            if label is not None:
+                self.scene.addItem(label)
+                self.selection_label_item = label
+        finally:
+            self.scene.blockSignals(False)
+        dirty = overlay.sceneBoundingRect()
+        if label is not None:
+            dirty = dirty.united(label.sceneBoundingRect())
+        self.scene.update(dirty)
+
+    def _label_color_for(self, bg_token: object) -> QColor:
+        tok = str(bg_token).lower() if bg_token else 'clear'
+        cache = self._label_color_cache
+        color = cache.get(tok)
+        if color is not None:
+            return color
+        if tok != 'clear':
+            # Compute contrast color using renderer's token parser
+            bg = self.renderer._color_from_token(str(bg_token))
+            luminance = 0.2126 * bg.red() + 0.7152 * bg.green() + 0.0722 * bg.blue()
+            color = QColor(0, 0, 0) if luminance >= 140 else QColor(255, 255, 255)
+        else:
+            color = QColor(255, 255, 255)
+        if len(cache) >= 128:
+            # Drop the oldest entry; backfill tokens come from a small vocabulary
+            cache.pop(next(iter(cache)))
+        cache[tok] = color
+        return color
 
     def on_save(self) -> None:
         if not self.document:
@@ -3345,8 +3486,8 @@ class RfmEditorMainWindow(QMainWindow):
         if not target:
             return self.on_save_as()
         try:
-            text = serialize_rfm(self.document)
-            Path(target).write_text(text, encoding="utf-8")
+            text = self._serialized(self.document)
+            _write_text_atomic(target, text)
         except Exception as e:  # noqa: BLE001
             QMessageBox.critical(self, "Save Error", f"Failed to save:\n{e}")
             return
@@ -3362,8 +3503,8 @@ class RfmEditorMainWindow(QMainWindow):
         start_dir = str(self.current_path.parent) if self.current_path else str(
             Path.cwd()
         )
-        out_path, _ = QFileDialog.getSaveFileName(
-            self,
+        out_path = self._file_dialog(
+            "save",
             "Save RFM as",
             start_dir,
             "Raven Menu Format (*.rmf);;All Files (*)",
@@ -3387,19 +3528,46 @@ class RfmEditorMainWindow(QMainWindow):
             QMessageBox.critical(self, "Export Error", f"Could not import RmfParser:\n{e}")
             return
 
-        text = serialize_rfm(self.document)
+        # One export at a time; the progress dialog is modal but a shortcut could still re-enter
+        if self._export_worker is not None:
+            return
+        text = self._serialized(self.document)
         seed_label = self.current_path.name if self.current_path else "untitled.rmf"
-        parser = RmfParser()
-        try:
-            cvars = parser.parse_and_pack(text, seed_label)
-            cfg_text = parser.generate_cfg_output(cvars)
-        except Exception as e:  # noqa: BLE001
-            QMessageBox.critical(self, "Export Error", f"Failed to export to cfg:\n{e}")
+        # Pack on the thread pool; the UI keeps painting behind a busy progress dialog
+        worker = _ExportWorker(RmfParser, text, seed_label)
+        progress = QProgressDialog("Exporting .cfg...", "Cancel", 0, 0, self)
+        progress.setWindowTitle("Export .cfg")
+        progress.setWindowModality(Qt.WindowModality.WindowModal)
+        progress.setMinimumDuration(300)
+        progress.canceled.connect(partial(self._on_export_canceled, worker))
+        worker.signals.finished.connect(partial(self._on_export_packed, worker, progress))
+        worker.signals.failed.connect(partial(self._on_export_failed, worker, progress))
+        self._export_worker = worker
+        QThreadPool.globalInstance().start(worker)
+
+    def _on_export_canceled(self, worker: _ExportWorker) -> None:
+        # The pack itself cannot be interrupted; its result is dropped when it arrives
+        worker.cancelled = True
+        if self._export_worker is worker:
+            self._export_worker = None
+
+    def _on_export_failed(self, worker: _ExportWorker, progress: QProgressDialog, message: str) -> None:
+        progress.reset()
+        progress.deleteLater()
+        if worker.cancelled or self._export_worker is not worker:
             return
+        self._export_worker = None
+        QMessageBox.critical(self, "Export Error", f"Failed to export to cfg:\n{message}")
 
+    def _on_export_packed(self, worker: _ExportWorker, progress: QProgressDialog, cfg_text: str) -> None:
+        progress.reset()
+        progress.deleteLater()
+        if worker.cancelled or self._export_worker is not worker:
+            return
+        self._export_worker = None
         start_dir = str(self.current_path.parent) if self.current_path else str(Path.cwd())
-        out_path, _ = QFileDialog.getSaveFileName(
-            self,
+        out_path = self._file_dialog(
+            "save",
             "Export .cfg",
             str(Path(start_dir) / (self.current_path.stem + ".cfg") if self.current_path else Path(start_dir) / "out.cfg"),
             "Config (*.cfg);;All Files (*)",
@@ -3407,7 +3575,7 @@ class RfmEditorMainWindow(QMainWindow):
         if not out_path:
             return
         try:
-            Path(out_path).write_text(cfg_text, encoding="utf-8")
+            _write_text_atomic(out_path, cfg_text)
         except Exception as e:  # noqa: BLE001
             QMessageBox.critical(self, "Export Error", f"Failed to write cfg:\n{e}")
             return
@@ -3426,18 +3594,27 @@ class RfmEditorMainWindow(QMainWindow):
         height, ok = QInputDialog.getInt(self, "Frame Height", "Height:", 480, 0, 4096, 1)
         if not ok:
             return
-        from .rfm_model import RfmFrame
         frame = RfmFrame(name=name.strip(), width=width, height=height)
         # Append to segments
         tag = frame.to_tag_str()
         self.document.segments.append(("tag", tag))
         self.document.frames[frame.name] = frame
         self.document.frame_segment_indices[frame.name] = len(self.document.segments) - 1
+        self.document._rev += 1
         self.dirty = True
-        self.refresh_outline()
-        self.refresh_scene()
+        self._schedule_refresh_outline()
+        self._schedule_refresh_scene()
 
     # Recent files helpers
+    @property
+    def recent_files(self) -> list[str]:
+        # Most-recent-first view over the ordered set of recent paths
+        return list(self._recent_od)
+
+    @recent_files.setter
+    def recent_files(self, files: list[str]) -> None:
+        self._recent_od = OrderedDict.fromkeys(files)
+
     def _load_recent_files(self) -> None:
         val = self.settings.value("recent_files", [], type=list)
         self.recent_files = list(val) if isinstance(val, list) else []
@@ -3446,82 +3623,123 @@ class RfmEditorMainWindow(QMainWindow):
         self.settings.setValue("recent_files", self.recent_files)
 
     def _ensure_recent_menu(self):
-        try:
-            if hasattr(self, 'recent_menu') and self.recent_menu is not None:
-                # If it is still valid, return it
-                return self.recent_menu
-        except RuntimeError:
-            # Wrapper exists but C++ object was deleted; fall through to recreate
-            pass
-        # Find or create File -> Open Recent submenu
-        file_menu = None
-        try:
-            for act in self.menuBar().actions():
-                m = act.menu()
-                if m is not None and m.title() == "File":
-                    file_menu = m
-                    break
-        except Exception:
-            file_menu = None
+        menu = getattr(self, 'recent_menu', None)
+        if menu is not None:
+            try:
+                # Touch the C++ object; a deleted wrapper raises RuntimeError
+                menu.isEmpty()
+                return menu
+            except RuntimeError:
+                self.recent_menu = None
+        file_menu = getattr(self, '_file_menu', None)
+        if file_menu is not None:
+            try:
+                file_menu.isEmpty()
+            except RuntimeError:
+                file_menu = None
         if file_menu is None:
-            file_menu = self.menuBar().addMenu("File")
-        # Try to find existing "Open Recent" submenu
-        try:
-            for act in file_menu.actions():
-                sm = act.menu()
-                if sm is not None and sm.title() == "Open Recent":
-                    self.recent_menu = sm
-                    return self.recent_menu
-        except Exception:
-            pass
+            # Cached handle is gone: find or create File menu once and cache it again
+            try:
+                for act in self.menuBar().actions():
+                    m = act.menu()
+                    if m is not None and m.title() == "File":
+                        file_menu = m
+                        break
+            except Exception:
+                file_menu = None
+            if file_menu is None:
+                file_menu = self.menuBar().addMenu("File")
+            self._file_menu = file_menu
+            # Try to find existing "Open Recent" submenu
+            try:
+                for act in file_menu.actions():
+                    sm = act.menu()
+                    if sm is not None and sm.title() == "Open Recent":
+                        self.recent_menu = sm
+                        return self.recent_menu
+            except Exception:
+                pass
         # Create a new submenu and keep reference
         self.recent_menu = file_menu.addMenu("Open Recent")
         return self.recent_menu
 
+    def _init_recent_actions(self, menu) -> None:
+        # Release actions built for a previous submenu; they are parented to the window, not the menu
+        for act in getattr(self, '_recent_actions', []) + [
+            getattr(self, '_recent_empty_action', None),
+            getattr(self, '_recent_clear_action', None),
+        ]:
+            if act is not None:
+                try:
+                    act.deleteLater()
+                except RuntimeError:
+                    pass
+        menu.clear()
+        # Fixed set of actions reused by every rebuild; only text/visibility change afterwards
+        self._recent_empty_action = QAction("No Recent Files", self)
+        self._recent_empty_action.setEnabled(False)
+        menu.addAction(self._recent_empty_action)
+        self._recent_actions: list[QAction] = []
+        for i in range(self.max_recent):
+            act = QAction(self)
+            act.triggered.connect(partial(self._open_recent_slot, i))
+            menu.addAction(act)
+            self._recent_actions.append(act)
+        self._recent_separator = menu.addSeparator()
+        self._recent_clear_action = QAction("Clear Recent", self)
+        self._recent_clear_action.triggered.connect(self._clear_recent)
+        menu.addAction(self._recent_clear_action)
+        self._recent_actions_menu = menu
+
     def _rebuild_recent_menu(self) -> None:
+        self._pending_recent = False
         menu = None
         try:
             menu = self._ensure_recent_menu()
-            menu.clear()
+            if getattr(self, '_recent_actions_menu', None) is not menu:
+                self._init_recent_actions(menu)
         except Exception:
             # Recreate and retry once
             try:
                 self.recent_menu = None
                 menu = self._ensure_recent_menu()
-                menu.clear()
+                self._init_recent_actions(menu)
             except Exception:
                 return
-        if not getattr(self, 'recent_files', None):
-            empty = QAction("No Recent Files", self)
-            empty.setEnabled(False)
-            menu.addAction(empty)
-            return
-        for p in self.recent_files:
-            act = QAction(p, self)
-            act.triggered.connect(lambda checked=False, path=p: self._open_recent(path))
-            menu.addAction(act)
-        menu.addSeparator()
-        clear_act = QAction("Clear Recent", self)
-        clear_act.triggered.connect(self._clear_recent)
-        menu.addAction(clear_act)
+        files = getattr(self, 'recent_files', None) or []
+        self._recent_empty_action.setVisible(not files)
+        for i, act in enumerate(self._recent_actions):
+            if i < len(files):
+                act.setText(files[i])
+                act.setVisible(True)
+            else:
+                act.setVisible(False)
+        self._recent_separator.setVisible(bool(files))
+        self._recent_clear_action.setVisible(bool(files))
+
+    def _open_recent_slot(self, slot_index: int, checked: bool = False) -> None:
+        # Pooled actions resolve their path at trigger time
+        files = getattr(self, 'recent_files', None) or []
+        if 0 <= slot_index < len(files):
+            self._open_recent(files[slot_index])
 
     def _add_to_recent(self, path: str) -> None:
-        if not hasattr(self, 'recent_files'):
-            self.recent_files = []
-        # Normalize and dedupe
-        try:
-            path = str(Path(path).resolve())
-        except Exception:
-            path = str(path)
-        self.recent_files = [p for p in self.recent_files if p != path]
-        self.recent_files.insert(0, path)
-        if len(self.recent_files) > self.max_recent:
-            self.recent_files = self.recent_files[: self.max_recent]
+        od = self._recent_od
+        # Known entries are stored resolved already; only new paths hit the filesystem
+        if path not in od:
+            try:
+                path = str(Path(path).resolve())
+            except Exception:
+                path = str(path)
+        # Already the most recent entry: nothing to reorder, save or rebuild
+        if od and next(iter(od)) == path:
+            return
+        od[path] = None
+        od.move_to_end(path, last=False)
+        while len(od) > self.max_recent:
+            od.popitem(last=True)
         self._save_recent_files()
-        try:
-            QTimer.singleShot(0, self._rebuild_recent_menu)
-        except Exception:
-            self._rebuild_recent_menu()
+        self._schedule_rebuild_recent_menu()
 
     def _open_recent(self, path: str) -> None:
         p = Path(path)
@@ -3534,12 +3752,9 @@ class RfmEditorMainWindow(QMainWindow):
                 QMessageBox.Yes,
             )
             if ret == QMessageBox.Yes:
-                self.recent_files = [x for x in self.recent_files if x != path]
+                self._recent_od.pop(path, None)
                 self._save_recent_files()
-                try:
-                    QTimer.singleShot(0, self._rebuild_recent_menu)
-                except Exception:
-                    self._rebuild_recent_menu()
+                self._schedule_rebuild_recent_menu()
             return
         if not self._maybe_save_changes():
             return
@@ -3550,30 +3765,33 @@ class RfmEditorMainWindow(QMainWindow):
     def _clear_recent(self) -> None:
         self.recent_files = []
         self._save_recent_files()
-        try:
-            QTimer.singleShot(0, self._rebuild_recent_menu)
-        except Exception:
-            self._rebuild_recent_menu()
+        self._schedule_rebuild_recent_menu()
 
     def on_insert_text(self) -> None:
         if not self.document:
             self.document = RfmDocument()
         text, ok = QInputDialog.getText(self, "New Text", "Text:")
-        if not ok:
+        # Blank text renders nothing; skip the insert and the refresh it would trigger
+        if not ok or not text.strip():
+            return
+        tag = f'<text "{text}">' if " " in text or '"' in text else f"<text {text}>"
+        # An identical tag right before is almost always an accidental repeat
+        if self.document.segments and self.document.segments[-1] == ("tag", tag):
             return
-        tag = f'<text "{text}">' if text and (" " in text or '"' in text) else f"<text {text}>"
         self.document.segments.append(("tag", tag))
-        from .rfm_model import RfmElement
-        self.document.elements.append(RfmElement(name="text", raw_tag=tag, segment_index=len(self.document.segments) - 1, text_content=text))
+        elem = RfmElement(name="text", raw_tag=tag, segment_index=len(self.document.segments) - 1, text_content=text)
+        self.document.elements.append(elem)
+        self.document._element_by_segment[elem.segment_index] = elem
+        self.document._rev += 1
         self.dirty = True
-        self.refresh_outline()
-        self.refresh_scene()
+        self._schedule_refresh_outline()
+        self._schedule_refresh_scene()
 
     def on_insert_image(self) -> None:
         if not self.document:
             self.document = RfmDocument()
-        img, _ = QFileDialog.getOpenFileName(
-            self,
+        img = self._file_dialog(
+            "open",
             "Choose Image",
             str(self.menu_root or (self.current_path.parent if self.current_path else Path.cwd())),
             "Images (*.png *.jpg *.jpeg *.bmp *.m32);;All Files (*)",
@@ -3583,22 +3801,29 @@ class RfmEditorMainWindow(QMainWindow):
         img_token = img if ' ' not in img else f'"{img}"'
         tag = f"<image {img_token}>"
         self.document.segments.append(("tag", tag))
-        from .rfm_model import RfmElement
-        self.document.elements.append(RfmElement(name="image", raw_tag=tag, segment_index=len(self.document.segments) - 1, image_path=img))
+        elem = RfmElement(name="image", raw_tag=tag, segment_index=len(self.document.segments) - 1, image_path=img)
+        self.document.elements.append(elem)
+        self.document._element_by_segment[elem.segment_index] = elem
+        self.document._rev += 1
         self.dirty = True
-        self.refresh_outline()
-        self.refresh_scene()
+        self._schedule_refresh_outline()
+        self._schedule_refresh_scene()
 
     def on_insert_hr(self) -> None:
         if not self.document:
             self.document = RfmDocument()
         tag = "<hr>"
+        # A second rule right after one is almost always a double-click
+        if self.document.segments and self.document.segments[-1] == ("tag", tag):
+            return
         self.document.segments.append(("tag", tag))
-        from .rfm_model import RfmElement
-        self.document.elements.append(RfmElement(name="hr", raw_tag=tag, segment_index=len(self.document.segments) - 1))
+        elem = RfmElement(name="hr", raw_tag=tag, segment_index=len(self.document.segments) - 1)
+        self.document.elements.append(elem)
+        self.document._element_by_segment[elem.segment_index] = elem
+        self.document._rev += 1
         self.dirty = True
-        self.refresh_outline()
-        self.refresh_scene()
+        self._schedule_refresh_outline()
+        self._schedule_refresh_scene()
 
     def on_insert_backdrop(self) -> None:
         if not self.document:
@@ -3611,8 +3836,8 @@ class RfmEditorMainWindow(QMainWindow):
         if mode == "(none)":
             mode = None
         # Ask optional image
-        img, _ = QFileDialog.getOpenFileName(
-            self,
+        img = self._file_dialog(
+            "open",
             "Optional Backdrop Image",
             str(self.menu_root or (self.current_path.parent if self.current_path else Path.cwd())),
             "Images (*.png *.jpg *.jpeg *.bmp *.m32);;All Files (*)",
@@ -3639,13 +3864,14 @@ class RfmEditorMainWindow(QMainWindow):
         self.document.backdrop_mode = mode
         self.document.backdrop_image = img if img else None
         self.document.backdrop_bgcolor = color
+        self.document._rev += 1
         self.dirty = True
-        self.refresh_outline()
-        self.refresh_scene()
+        self._schedule_refresh_outline()
+        self._schedule_refresh_scene()
 
     def on_set_menu_dir(self) -> None:
         start = str(self.menu_root or Path.cwd())
-        chosen = QFileDialog.getExistingDirectory(self, "Choose SOF Menu Directory", start)
+        chosen = self._file_dialog("dir", "Choose SOF Menu Directory", start)
         if not chosen:
             return
         self.menu_root = Path(chosen)
@@ -3655,10 +3881,11 @@ class RfmEditorMainWindow(QMainWindow):
             self.renderer.menu_root = str(self.menu_root)
         except Exception:
             pass
+        self._resolve_image_cache.clear()
 
     def on_set_resource_dir(self) -> None:
         start = str(self.resource_root or self.menu_root or Path.cwd())
-        chosen = QFileDialog.getExistingDirectory(self, "Choose Resource Directory (images, .m32, etc)", start)
+        chosen = self._file_dialog("dir", "Choose Resource Directory (images, .m32, etc)", start)
         if not chosen:
             return
         self.resource_root = Path(chosen)
@@ -3668,6 +3895,7 @@ class RfmEditorMainWindow(QMainWindow):
             self.renderer.resource_root = str(self.resource_root)
         except Exception:
             pass
+        self._resolve_image_cache.clear()
 
     def on_delete_selected(self) -> None:
         items = self.outline.selectedItems()
@@ -3676,26 +3904,11 @@ class RfmEditorMainWindow(QMainWindow):
         payload = items[0].data(0, Qt.ItemDataRole.UserRole)
         seg_idx: Optional[int] = None
         doc_key: Optional[str] = None
-        from .rfm_model import RfmFrame, RfmElement
         # Tuples from outline
         if isinstance(payload, tuple):
-            tag = payload[0] if payload else None
-            if tag == "element" and len(payload) >= 3:
-                _, doc_key, seg_idx_val = payload
-                doc_key = str(doc_key)
-                seg_idx = int(seg_idx_val)
-            elif tag == "frame" and len(payload) >= 3:
-                _, doc_key, frame_name = payload
-                d = self.documents_by_key.get(str(doc_key))
-                if d:
-                    seg_idx = d.frame_segment_indices.get(str(frame_name))
-                doc_key = str(doc_key)
-            elif tag == "doc-backdrop" and len(payload) >= 2:
-                _, doc_key = payload
-                d = self.documents_by_key.get(str(doc_key))
-                if d:
-                    seg_idx = d.backdrop_segment_index
-                doc_key = str(doc_key)
+            handler = self._DELETE_TARGET_BY_TAG.get(payload[0]) if payload else None
+            if handler is not None:
+                doc_key, seg_idx = handler(self, payload)
         # Legacy/object payloads
         elif isinstance(payload, RfmElement):
             seg_idx = payload.segment_index
@@ -3718,22 +3931,45 @@ class RfmEditorMainWindow(QMainWindow):
             del doc.segments[seg_idx]
         except Exception:
             return
-        # Re-serialize and re-parse to maintain indices
-        from .rfm_serializer import serialize_rfm
-        from .rfm_parser import parse_rfm_content
+        # Shift cached indices past the removed segment instead of re-serializing and re-parsing
+        removed = seg_idx
         try:
-            text = serialize_rfm(doc)
-            new_doc = parse_rfm_content(text, file_path=doc.file_path)
-            self.documents_by_key[doc_key] = new_doc
-            # If this was the active document, update pointer so preview updates
+            self._reindex_document(doc_key, doc, lambda i: None if i == removed else (i - 1 if i > removed else i))
+            # If the document was replaced by a fallback reparse, update the active pointer so preview updates
             if getattr(self, 'active_doc_key', None) == doc_key:
-                self.document = new_doc
+                self.document = self.documents_by_key.get(doc_key, doc)
         except Exception:
             pass
         self.dirty = True
-        self.props.clear()
-        self.refresh_outline()
-        self.refresh_scene()
+        self._release_prop_items()
+        self._schedule_refresh_outline()
+        self._schedule_refresh_scene()
+
+    def _delete_target_element(self, payload: tuple) -> tuple[Optional[str], Optional[int]]:
+        if len(payload) < 3:
+            return None, None
+        return str(payload[1]), int(payload[2])
+
+    def _delete_target_frame(self, payload: tuple) -> tuple[Optional[str], Optional[int]]:
+        if len(payload) < 3:
+            return None, None
+        doc_key = str(payload[1])
+        d = self.documents_by_key.get(doc_key)
+        return doc_key, (d.frame_segment_indices.get(str(payload[2])) if d else None)
+
+    def _delete_target_backdrop(self, payload: tuple) -> tuple[Optional[str], Optional[int]]:
+        if len(payload) < 2:
+            return None, None
+        doc_key = str(payload[1])
+        d = self.documents_by_key.get(doc_key)
+        return doc_key, (d.backdrop_segment_index if d else None)
+
+    # Outline payload tag -> (doc_key, segment index) resolver for deletion
+    _DELETE_TARGET_BY_TAG = {
+        "element": _delete_target_element,
+        "frame": _delete_target_frame,
+        "doc-backdrop": _delete_target_backdrop,
+    }
 
     def _on_outline_context_menu(self, pos) -> None:
         try:
@@ -3802,6 +4038,19 @@ class RfmEditorMainWindow(QMainWindow):
                                 order.append(int(p2[2]))
                         elements_order_by_doc[doc_key] = order
 
+            # Drop documents whose outline order already matches; a no-op drop leaves nothing to do
+            docs = self.documents_by_key
+            elements_order_by_doc = {
+                dk: order for dk, order in elements_order_by_doc.items()
+                if dk in docs and order != [e.segment_index for e in docs[dk].elements]
+            }
+            frames_layout_by_doc = {
+                dk: layout for dk, layout in frames_layout_by_doc.items()
+                if dk in docs and layout != self._frame_layout_of(dk, docs[dk])
+            }
+            if not elements_order_by_doc and not frames_layout_by_doc:
+                return
+
             # 2) Apply element reordering within each doc using current UI order
             changed_docs: set[str] = set()
             for doc_key, ordered_seg_indices in elements_order_by_doc.items():
@@ -3810,19 +4059,8 @@ class RfmEditorMainWindow(QMainWindow):
                 if self._reorder_elements_by_segment_indices_for_doc(doc_key, ordered_seg_indices):
                     changed_docs.add(doc_key)
 
-            # Reparse documents whose segments changed to keep indices and caches consistent
+            # Indices of changed documents were already shifted in place by the reorder helper
             if changed_docs:
-                from .rfm_serializer import serialize_rfm
-                from .rfm_parser import parse_rfm_content
-                for dk in list(changed_docs):
-                    doc = self.documents_by_key.get(dk)
-                    if not doc:
-                        continue
-                    try:
-                        text = serialize_rfm(doc)
-                        self.documents_by_key[dk] = parse_rfm_content(text, file_path=doc.file_path)
-                    except Exception:
-                        pass
                 # If the active document changed, update the pointer so the scene reflects the new order
                 try:
                     if getattr(self, 'active_doc_key', None) in changed_docs:
@@ -3832,16 +4070,39 @@ class RfmEditorMainWindow(QMainWindow):
                 except Exception:
                     pass
 
-            # 3) Apply cross-doc frame layout
+            # 3) Apply cross-doc frame layout; documents whose frame list is unchanged were dropped above
+            ak = getattr(self, 'active_doc_key', None)
+            # The preview only shows the active document; other docs changing needs just the outline
+            scene_dirty = ak in changed_docs or ak in frames_layout_by_doc
             self._apply_crossdoc_frame_layout(frames_layout_by_doc)
+            # Keep the active pointer valid in case a document was replaced by a reparse
+            try:
+                ak = getattr(self, 'active_doc_key', None)
+                if ak and ak in self.documents_by_key:
+                    self.document = self.documents_by_key[ak]
+            except Exception:
+                pass
 
             # Refresh UI
-            self.dirty = True
-            self.refresh_outline()
-            self.refresh_scene()
+            if changed_docs or frames_layout_by_doc:
+                self.dirty = True
+            self._schedule_refresh_outline()
+            if scene_dirty:
+                self._schedule_refresh_scene()
         except Exception:
             pass
 
+    def _frame_layout_of(self, doc_key: str, doc: RfmDocument) -> list[tuple[str, str]]:
+        # Current (doc_key, frame_name) order in segment order, comparable to the outline layout
+        return [(doc_key, name) for name, _ in sorted(doc.frame_segment_indices.items(), key=lambda kv: kv[1])]
+
+    def _element_idx_set(self, doc: RfmDocument) -> set[int]:
+        # Cached per document revision; repeated drags over an unchanged doc reuse the set
+        if doc._element_idx_set_rev != doc._rev:
+            doc._element_idx_set_cache = {e.segment_index for e in doc.elements}
+            doc._element_idx_set_rev = doc._rev
+        return doc._element_idx_set_cache
+
     def _reorder_elements_by_segment_indices_for_doc(self, doc_key: str, ordered_indices: list[int]) -> bool:
         """Reorder only element segments within a document to match ordered_indices exactly.
         Returns True if the document's segments changed.
@@ -3852,13 +4113,18 @@ class RfmEditorMainWindow(QMainWindow):
         try:
             segments = list(doc.segments)
             # Determine which indices correspond to elements in this document
-            element_idx_set = {e.segment_index for e in getattr(doc, 'elements', [])}
+            element_idx_set = self._element_idx_set(doc)
             if not element_idx_set:
                 return False
             # Build a full ordered list: UI order first, then any leftover element indices preserving original order
-            seen = set(int(x) for x in ordered_indices if int(x) in element_idx_set)
-            leftover = [i for i in sorted(element_idx_set) if i not in seen]
-            full_order = [int(x) for x in ordered_indices if int(x) in element_idx_set] + leftover
+            full_order: list[int] = []
+            seen: set[int] = set()
+            for x in ordered_indices:
+                xi = int(x)
+                if xi in element_idx_set and xi not in seen:
+                    full_order.append(xi)
+                    seen.add(xi)
+            full_order.extend(i for i in sorted(element_idx_set) if i not in seen)
             # Map indices to entries
             ordered_entries: list[tuple[str, str]] = []
             for idx in full_order:
@@ -3880,6 +4146,13 @@ class RfmEditorMainWindow(QMainWindow):
                     new_segments.append(entry)
             if changed:
                 doc.segments = new_segments
+                # Element i of full_order now sits in the i-th element slot
+                slots = [i for i in range(len(segments)) if i in element_idx_set]
+                moved = dict(zip((idx for idx in full_order if 0 <= idx < len(segments)), slots))
+                self._reindex_document(doc_key, doc, lambda i: moved.get(i, i))
+                # Elements only traded places, so the slot set is still valid for the new revision
+                if self.documents_by_key.get(doc_key) is doc:
+                    doc._element_idx_set_rev = doc._rev
             return changed
         except Exception:
             return False
@@ -3887,7 +4160,6 @@ class RfmEditorMainWindow(QMainWindow):
     def _apply_crossdoc_frame_layout(self, frames_layout_by_doc: dict[str, list[tuple[str, str]]]) -> None:
         if not frames_layout_by_doc:
             return
-        from .rfm_model import RfmFrame
         try:
             # Precompute current docs
             docs = self.documents_by_key
@@ -3932,28 +4204,42 @@ class RfmEditorMainWindow(QMainWindow):
                 dest_doc = docs.get(dest_key)
                 if not dest_doc:
                     continue
-                old_segments = list(dest_doc.segments)
-                kept: list[tuple[str, str]] = []
+                # Read-only pass; the segment list is replaced below, so no defensive copy is needed
+                old_segments = dest_doc.segments
+                # Pre-size the survivor lists (upper bound: every segment kept) and trim after the pass
+                kept: list = [None] * len(old_segments)
+                kept_old_idx: list = [None] * len(old_segments)
+                ki = 0
                 first_frame_insert_pos = None
+                # Frame tags are already known by index from the parse; no per-segment string work
+                frame_idx_set = set(dest_doc.frame_segment_indices.values())
                 # Remove existing frame tags and remember earliest frame position
-                for idx, (kind, val) in enumerate(old_segments):
-                    if kind == 'tag':
-                        inner = val[1:-1].strip().lower()
-                        if inner.startswith('frame '):
-                            if first_frame_insert_pos is None:
-                                first_frame_insert_pos = len(kept)
-                            continue
-                    kept.append((kind, val))
+                for idx, entry in enumerate(old_segments):
+                    if idx in frame_idx_set:
+                        if first_frame_insert_pos is None:
+                            first_frame_insert_pos = ki
+                        continue
+                    kept[ki] = entry
+                    kept_old_idx[ki] = idx
+                    ki += 1
+                del kept[ki:]
+                del kept_old_idx[ki:]
                 insert_pos = first_frame_insert_pos if first_frame_insert_pos is not None else len(kept)
-                # Insert frames in order
-                for offset, fr in enumerate(new_frames):
-                    kept.insert(insert_pos + offset, ('tag', fr.to_tag_str()))
-                # Commit and reparse to rebuild indices
-                dest_doc.segments = kept
-                from .rfm_serializer import serialize_rfm
-                from .rfm_parser import parse_rfm_content
-                text = serialize_rfm(dest_doc)
-                docs[dest_key] = parse_rfm_content(text, file_path=dest_doc.file_path)
+                # Splice frames in order with one concatenation rather than one list insert per frame
+                frame_segs = [('tag', fr.to_tag_str()) for fr in new_frames]
+                # Commit, then shift surviving indices past the inserted frame block
+                dest_doc.segments = kept[:insert_pos] + frame_segs + kept[insert_pos:]
+                n_new = len(new_frames)
+                old_to_new = {
+                    old: (pos if pos < insert_pos else pos + n_new) for pos, old in enumerate(kept_old_idx)
+                }
+                dest_doc.frames = {}
+                dest_doc.frame_segment_indices = {}
+                self._reindex_document(dest_key, dest_doc, old_to_new.get, verify=False)
+                dest_doc.frames = {fr.name: fr for fr in new_frames}
+                dest_doc.frame_segment_indices = {fr.name: insert_pos + offset for offset, fr in enumerate(new_frames)}
+                if self._VERIFY_REINDEX:
+                    self._verify_reindex(dest_key, dest_doc)
 
             # For source docs that lost frames but are not listed as dest, we must still purge frames moved out
             # Compute set of frames that remain per doc from layout
@@ -3970,17 +4256,87 @@ class RfmEditorMainWindow(QMainWindow):
         except Exception:
             pass
 
+    def _serialized(self, doc: RfmDocument) -> str:
+        # Reuse the last serialization until a mutating path bumps doc._rev
+        key = id(doc)
+        hit = self._serialize_cache.get(key)
+        if hit is not None and hit[0]() is doc and hit[1] == doc._rev:
+            return hit[2]
+        text = serialize_rfm(doc)
+        self._serialize_cache[key] = (weakref.ref(doc), doc._rev, text)
+        return text
+
+    def _reindex_document(self, doc_key: str, doc: RfmDocument, remap, *, verify: bool = True) -> None:
+        """Update cached segment indices after doc.segments was edited in place.
+        remap(old_index) returns the new index, or None when that segment was removed.
+        """
+        doc._rev += 1
+        if doc.backdrop_segment_index is not None and remap(doc.backdrop_segment_index) is None:
+            # An earlier backdrop may take over ("last takes precedence"); let the parser decide
+            self._reparse_document(doc_key, doc)
+            return
+        for name, idx in list(doc.frame_segment_indices.items()):
+            new_idx = remap(idx)
+            if new_idx is None:
+                del doc.frame_segment_indices[name]
+                doc.frames.pop(name, None)
+            else:
+                doc.frame_segment_indices[name] = new_idx
+        kept: list[RfmElement] = []
+        for el in doc.elements:
+            new_idx = remap(el.segment_index)
+            if new_idx is not None:
+                el.segment_index = new_idx
+                kept.append(el)
+        kept.sort(key=operator.attrgetter("segment_index"))
+        doc.elements = kept
+        doc._element_by_segment = {el.segment_index: el for el in kept}
+        if doc.backdrop_segment_index is not None:
+            doc.backdrop_segment_index = remap(doc.backdrop_segment_index)
+        if verify and self._VERIFY_REINDEX:
+            self._verify_reindex(doc_key, doc)
+
+    def _verify_reindex(self, doc_key: str, doc: RfmDocument) -> None:
+        # Debug cross-check against the full serialize/parse round-trip; the reparsed doc wins on mismatch.
+        # The <stm> wrapper pieces are dropped so the wrapper newlines do not shift the reference indices.
+        try:
+            ref = parse_rfm_content(list(serialize_rfm_iter(doc))[1:-1], file_path=doc.file_path)
+            if (
+                ref.frame_segment_indices != doc.frame_segment_indices
+                or [e.segment_index for e in ref.elements] != [e.segment_index for e in doc.elements]
+                or ref.backdrop_segment_index != doc.backdrop_segment_index
+            ):
+                self.statusBar().showMessage(f"Reindex mismatch in {doc_key}; reparsed", 5000)
+                self.documents_by_key[doc_key] = ref
+        except Exception:
+            pass
+
+    def _reparse_document(self, doc_key: str, doc: RfmDocument) -> None:
+        # Re-serialize and re-parse to rebuild every index from scratch
+        try:
+            self.documents_by_key[doc_key] = parse_rfm_content(serialize_rfm(doc), file_path=doc.file_path)
+        except Exception:
+            pass
+
     def _unique_frame_name(self, dest_doc: RfmDocument, base_name: str) -> str:  # type: ignore[name-defined]
         # Generate a unique frame name for the destination document
         name = base_name
         if name not in dest_doc.frames:
             return name
-        counter = 1
-        while True:
-            candidate = f"{base_name}_{counter}"
-            if candidate not in dest_doc.frames:
-                return candidate
-            counter += 1
+        # Scan existing "<base>_<N>" names once per revision, then hand out max+1 in O(1)
+        if dest_doc._max_suffix_rev != dest_doc._rev:
+            suffixes: dict[str, int] = {}
+            for existing in dest_doc.frames:
+                m = _FRAME_SUFFIX_RE.match(existing)
+                if m:
+                    base, n = m.group(1), int(m.group(2))
+                    if n > suffixes.get(base, 0):
+                        suffixes[base] = n
+            dest_doc._max_suffix_by_base = suffixes
+            dest_doc._max_suffix_rev = dest_doc._rev
+        n = dest_doc._max_suffix_by_base.get(base_name, 0) + 1
+        dest_doc._max_suffix_by_base[base_name] = n
+        return f"{base_name}_{n}"
 
 
 def main() -> None:
@@ -3988,19 +4344,25 @@ def main() -> None:
     win = RfmEditorMainWindow()
     win.show()
 
-    # Auto-open last-startup file if set and exists; otherwise start empty
-    try:
-        settings = QSettings("dynamic_sof_apps", "rfm_editor")
-        last = settings.value("last_startup_file", "")
-        if isinstance(last, str) and last:
-            p = Path(last)
-            if p.exists():
-                win.load_file(p)
-            else:
-                settings.setValue("last_startup_file", "")
-                settings.sync()
-    except Exception:
-        pass
+    # Auto-open last-startup file if set and exists; otherwise start empty.
+    # Reuse the window's settings object rather than opening the config store a second time.
+    def _restore() -> None:
+        try:
+            settings = win.settings
+            last = settings.value("last_startup_file", "")
+            if isinstance(last, str) and last:
+                # A direct stat; also rejects a stale entry that now names a directory
+                if os.path.isfile(last):
+                    win.load_file(Path(last))
+                else:
+                    settings.setValue("last_startup_file", "")
+                    settings.sync()
+        except Exception:
+            pass
+
+    # Run on the first event-loop tick so the empty window paints before the file is parsed
+    if "--no-restore" not in sys.argv:
+        QTimer.singleShot(0, _restore)
 
     sys.exit(app.exec())
 
@@ -1,10 +1,10 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, List, Optional, Set, Tuple
 
 
-@dataclass
+@dataclass(slots=True)
 class RfmFrame:
     name: str
     width: int
@@ -20,10 +20,23 @@ class RfmFrame:
     backfill_color: Optional[str] = None  # raw token (hex or name)
     cursor: Optional[int] = None  # 0 or 1
     tail_extra: str = ""  # tail minus parsed border/backfill
+    # Token ranges [start, end) in raw_tail.split() for each parsed tail keyword
+    _tail_token_spans: Dict[str, Tuple[int, int]] = field(default_factory=dict, repr=False, compare=False)
+    # Last to_tag_str() result and the field values it was built from
+    _tag_key: Optional[tuple] = field(default=None, repr=False, compare=False)
+    _tag_str: str = field(default="", repr=False, compare=False)
     # Ephemeral layout position for preview rendering only
     preview_pos: Tuple[int, int] = (0, 0)
 
     def to_tag_str(self) -> str:
+        # Serialization and preview refreshes call this repeatedly; rebuild only when a field changed
+        key = (
+            self.name, self.width, self.height, self.page, self.cpage_cvar, self.cut_from,
+            self.border_width, self.border_line_width, self.border_line_color,
+            self.backfill_color, self.cursor, self.tail_extra,
+        )
+        if key == self._tag_key:
+            return self._tag_str
         # Minimal normalized reconstruction preserving tail
         parts = []
         if self.page:
@@ -45,10 +58,12 @@ class RfmFrame:
             parts.append(self.tail_extra.strip())
         tail_combined = " ".join(p for p in parts if p)
         tail = f" {tail_combined}" if tail_combined else ""
-        return f"<frame {self.name} {self.width} {self.height}{tail}>"
+        self._tag_key = key
+        self._tag_str = f"<frame {self.name} {self.width} {self.height}{tail}>"
+        return self._tag_str
 
 
-@dataclass
+@dataclass(slots=True)
 class RfmElement:
     name: str
     raw_tag: str  # original tag including <>
@@ -87,6 +102,9 @@ class RfmElement:
     area_border_width: Optional[int] = None
     area_border_line_width: Optional[int] = None
     area_border_line_color: Optional[str] = None
+    # Display strings joined once at parse time ("noshade, noborder" / "2 1 0xff00ff00")
+    _flags_str: Optional[str] = field(default=None, repr=False, compare=False)
+    _border_str: Optional[str] = field(default=None, repr=False, compare=False)
     width_px: Optional[int] = None
     height_px: Optional[int] = None
     next_cmd: Optional[str] = None
@@ -120,6 +138,7 @@ class RfmElement:
         return self.raw_tag[1:-1][:80]
 
 
+# One per open file, so no slots: the editor's serialization cache also holds weak references to it
 @dataclass
 class RfmDocument:
     # in-order segments preserve raw formatting and unknown tags/text
@@ -132,6 +151,8 @@ class RfmDocument:
 
     # For updating tags during serialization
     frame_segment_indices: Dict[str, int] = field(default_factory=dict)
+    # Element lookup by segment index, kept in step with `elements`
+    _element_by_segment: Dict[int, RfmElement] = field(default_factory=dict, repr=False, compare=False)
 
     # Backdrop (single, last takes precedence)
     backdrop_segment_index: Optional[int] = None
@@ -143,4 +164,13 @@ class RfmDocument:
     file_path: Optional[str] = None  # absolute path
     doc_key: Optional[str] = None  # stable key (file_path or synthetic)
 
+    # Bumped by editor mutations so cached serializations can be reused until the next edit
+    _rev: int = field(default=0, repr=False, compare=False)
+    # Segment indices of `elements`, valid while _element_idx_set_rev == _rev
+    _element_idx_set_cache: Set[int] = field(default_factory=set, repr=False, compare=False)
+    _element_idx_set_rev: int = field(default=-1, repr=False, compare=False)
+    # Highest numeric "_N" suffix per frame base name, valid while _max_suffix_rev == _rev
+    _max_suffix_by_base: Dict[str, int] = field(default_factory=dict, repr=False, compare=False)
+    _max_suffix_rev: int = field(default=-1, repr=False, compare=False)
+
 
@@ -1,7 +1,8 @@
 from __future__ import annotations
 
 import re
-from typing import List, Tuple
+import sys
+from typing import Callable, Iterable, Iterator, List, Tuple
 from pathlib import Path
 
 from .rfm_model import RfmDocument, RfmElement, RfmFrame
@@ -13,50 +14,124 @@ FRAME_SCAN = re.compile(r"<\s*frame\s+(\S+)\s+(\d+)\s+(\d+)([^>]*)>", re.IGNOREC
 STM_OPEN = re.compile(r"<\s*stm(\s+[^>]*)?>", re.IGNORECASE)
 STM_CLOSE = re.compile(r"<\s*/\s*stm\s*>", re.IGNORECASE)
 
+# One token per match: a tag (a quoted '>' does not close it; an unterminated tag or quote
+# runs to the end of input) or a run of text up to the next '<'
+_TOKEN_RE = re.compile(r'<(?:[^">]+|"[^"]*")*(?:>|"[^"]*\Z|\Z)|[^<]+')
+# Tag head of an <stm ...> or </stm ...> wrapper, and the leading chars any such tag starts with
+_STM_HEAD = re.compile(r"</?stm", re.IGNORECASE)
+_STM_LEAD = ("<s", "<S", "</")
+# Cheap prefilter for <include ...>/<exinclude ...> tags; matches a superset of what gets expanded
+_INCLUDE_HEAD = re.compile(r"<\s*(?:ex)?include\s", re.IGNORECASE)
+
+# Tags kept as outline elements
+_OUTLINE_ELEMENT_TAGS = frozenset({
+    "text", "ctext", "image", "hr", "blank", "center", "left", "right", "normal", "font", "include", "ticker", "bghoul",
+})
+# Everything else is skipped by pass 1 without building an element
+_PASS1_TAGS = _OUTLINE_ELEMENT_TAGS | {"frame", "backdrop"}
+
+# Backdrop layout flags; any other bare word is taken as the image
+_BACKDROP_MODES = frozenset({"tile", "stretch", "center", "left", "right"})
+# Attribute keywords that end the bare words of an unquoted <text ...>
+_TEXT_STOP_ATTRS = frozenset({
+    "tint", "atint", "btint", "ctint", "dtint", "bolt", "bbolt", "key", "ckey", "ikey", "tip", "noshade",
+    "noscale", "noborder", "border", "width", "height", "next", "prev", "cvar", "cvari", "inc", "mod",
+    "xoff", "yoff", "tab", "align",
+})
+# Conditional area attributes: <op> <cvar> <value>
+_COND_OPS = frozenset({"iflt", "ifgt", "ifle", "ifge", "ifne", "ifeq", "ifset", "ifclr"})
+
+# Quoted-argument extractors used by parse pass 1
+# text and atext are searched independently: a quoted text value may swallow the atext keyword
+_TEXT_CONTENT_RE = re.compile(r'\btext\b\s+"([^"]*)"', re.IGNORECASE)
+_ATEXT_RE = re.compile(r'\batext\b\s+"([^"]*)"', re.IGNORECASE)
+_IMAGE_OVERLAY_RE = re.compile(r'\btext\b\s+"([^"]*)"\s+(-?\d+)\s+(-?\d+)', re.IGNORECASE)
+_CTEXT_RE = re.compile(r'\bctext\b\s+"([^"]*)"', re.IGNORECASE)
+_TICKER_RE = re.compile(r'\bticker\b\s+"([^"]*)"', re.IGNORECASE)
+# Whitespace runs collapsed in free text between tags
+_WS_RUN_RE = re.compile(r"\s+")
+
 
 def _tokenize(content: str, *, ignore_stm_wrappers: bool = False) -> List[Tuple[str, str]]:
-    tokens: List[Tuple[str, str]] = []
-    i = 0
-    n = len(content)
+    return list(_iter_tokens(content, ignore_stm_wrappers=ignore_stm_wrappers))
+
+
+def _iter_tokens(content: str, *, ignore_stm_wrappers: bool = False) -> Iterator[Tuple[str, str]]:
+    # Work on match offsets and slice only tokens that are kept; text outside <stm> never
+    # becomes a string, and stm detection matches in place instead of slicing the tag head
+    # One shared (kind, text) segment per distinct token text: separators like "\n" and tags
+    # like <br> repeat throughout a menu. Tags start with "<" and text never does, so one map
+    # serves both kinds; segments are only ever replaced, never mutated, so sharing is safe.
+    shared: dict[str, Tuple[str, str]] = {}
     stm_depth = 0
-    has_stm = bool(STM_OPEN.search(content)) and not ignore_stm_wrappers
-    while i < n:
-        if content[i] == "<":
-            j = i + 1
-            in_quote = False
-            while j < n:
-                c = content[j]
-                if c == '"':
-                    in_quote = not in_quote
-                if c == '>' and not in_quote:
-                    j += 1
-                    break
-                j += 1
-            tag = content[i:j]
-            low = tag.lower().strip()
-            is_stm_open = low.startswith("<stm") and not low.startswith("</stm")
-            is_stm_close = low.startswith("</stm")
-            if is_stm_open and not ignore_stm_wrappers:
-                stm_depth += 1
-            elif is_stm_close and not ignore_stm_wrappers:
-                stm_depth = max(0, stm_depth - 1)
-            else:
-                # Skip emitting stm wrappers when ignoring wrappers
-                if ignore_stm_wrappers and (is_stm_open or is_stm_close):
-                    pass
-                else:
-                    if stm_depth > 0 or not has_stm or ignore_stm_wrappers:
-                        tokens.append(("tag", tag))
-            i = j
+    # Whether the document has an <stm> wrapper at all is resolved lazily: a wrapped file opens
+    # with <stm>, which settles it without rescanning the whole buffer up front
+    has_stm: bool | None = False if ignore_stm_wrappers else None
+    stm_head = _STM_HEAD.match
+    for m in _TOKEN_RE.finditer(content):
+        a, b = m.span()
+        is_tag = content[a] == "<"
+        # Cheap C-level prefix test first; only tags that could be stm wrappers reach the regex
+        if is_tag and content.startswith(_STM_LEAD, a) and stm_head(content, a, b) is not None:
+            is_stm_close = content[a + 1] == "/"
+            is_stm_open = not is_stm_close
+            if is_stm_open and has_stm is None and STM_OPEN.match(content, a, b):
+                has_stm = True
         else:
-            j = i
-            while j < n and content[j] != "<":
-                j += 1
-            text = content[i:j]
-            if text and (stm_depth > 0 or not has_stm or ignore_stm_wrappers):
-                tokens.append(("text", text))
-            i = j
-    return tokens
+            is_stm_open = is_stm_close = False
+        if is_stm_open and not ignore_stm_wrappers:
+            stm_depth += 1
+        elif is_stm_close and not ignore_stm_wrappers:
+            stm_depth = max(0, stm_depth - 1)
+        elif ignore_stm_wrappers and (is_stm_open or is_stm_close):
+            # Skip emitting stm wrappers when ignoring wrappers
+            pass
+        else:
+            keep = stm_depth > 0 or ignore_stm_wrappers
+            if not keep:
+                if has_stm is None:
+                    has_stm = STM_OPEN.search(content) is not None
+                keep = not has_stm
+            if keep:
+                text = content[a:b]
+                seg = shared.get(text)
+                if seg is None:
+                    seg = shared[text] = ("tag" if is_tag else "text", text)
+                yield seg
+
+
+# Bound on entries kept in each include cache; the least recently used entry is evicted first
+_INCLUDE_CACHE_MAX = 256
+# Successful include resolutions keyed by (target, base_dir): the resolved path and the
+# higher-priority candidates that did not exist then (a bare "foo" resolved before "foo.rmf"
+# was created). Misses are not cached so a file created later is still found.
+_INCLUDE_PATH_CACHE: dict[tuple[str, str], tuple[Path, tuple[Path, ...]]] = {}
+# Tokens of included files keyed by (path, ignore_stm_wrappers), valid for the stored mtime
+_INCLUDE_TOKEN_CACHE: dict[tuple[Path, bool], tuple[int, List[Tuple[str, str]]]] = {}
+
+
+def _include_cache_get(cache: dict, key):
+    entry = cache.pop(key, None)
+    if entry is not None:
+        # Re-insert as most recently used (dicts keep insertion order)
+        cache[key] = entry
+    return entry
+
+
+def _include_cache_put(cache: dict, key, value) -> None:
+    cache.pop(key, None)
+    while cache and len(cache) >= _INCLUDE_CACHE_MAX:
+        # Evict the least recently used entry
+        del cache[next(iter(cache))]
+    cache[key] = value
+
+
+def _forget_include(path: Path) -> None:
+    """Drop every cached resolution to path and its tokens, e.g. after the file disappeared."""
+    _INCLUDE_TOKEN_CACHE.pop((path, False), None)
+    _INCLUDE_TOKEN_CACHE.pop((path, True), None)
+    for k in [k for k, v in _INCLUDE_PATH_CACHE.items() if v[0] == path]:
+        del _INCLUDE_PATH_CACHE[k]
 
 
 def _resolve_include_path(target: str, base_dir: Path) -> Path | None:
@@ -66,6 +141,14 @@ def _resolve_include_path(target: str, base_dir: Path) -> Path | None:
     - Absolute path as-is (with optional .rmf if no extension)
     - base_dir / target (with optional .rmf if no extension)
     """
+    key = (target, str(base_dir))
+    cached = _include_cache_get(_INCLUDE_PATH_CACHE, key)
+    if cached is not None:
+        resolved, skipped = cached
+        # A candidate that was missing at resolution time but exists now takes precedence
+        if not any(c.is_file() for c in skipped):
+            return resolved
+        del _INCLUDE_PATH_CACHE[key]
     t = target.strip().strip('"')
     raw = Path(t)
     candidates: List[Path] = []
@@ -81,59 +164,98 @@ def _resolve_include_path(target: str, base_dir: Path) -> Path | None:
         add_variants(raw)
     else:
         add_variants(base_dir / raw)
-    for c in candidates:
+    for i, c in enumerate(candidates):
         try:
             # Resolve symlinks and normalize
             rp = c.resolve()
             if rp.exists() and rp.is_file():
+                _include_cache_put(_INCLUDE_PATH_CACHE, key, (rp, tuple(candidates[:i])))
                 return rp
         except Exception:
             continue
     return None
 
 
+def _tokenize_include(path: Path, ignore_stm_wrappers: bool) -> List[Tuple[str, str]]:
+    """Tokenize an included file, reusing the previous result while its mtime is unchanged.
+
+    Token lists are shared between callers; they are only iterated, never mutated.
+    Raises OSError when the file cannot be read.
+    """
+    key = (path, ignore_stm_wrappers)
+    mtime = path.stat().st_mtime_ns
+    cached = _include_cache_get(_INCLUDE_TOKEN_CACHE, key)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+    text = path.read_text(encoding="utf-8", errors="ignore")
+    tokens = _tokenize(text, ignore_stm_wrappers=ignore_stm_wrappers)
+    _include_cache_put(_INCLUDE_TOKEN_CACHE, key, (mtime, tokens))
+    return tokens
+
+
+def _load_include(
+    target: str, base_dir: Path, seen: set[Path], ignore_stm_wrappers: bool
+) -> tuple[Path, List[Tuple[str, str]]] | None:
+    """Resolve and tokenize an include target.
+
+    Returns (path, tokens), or None when the target is missing, unreadable or already in seen.
+    A cached resolution whose file has since gone is forgotten and resolved again right away,
+    so the include still expands in this parse if the target now resolves elsewhere.
+    """
+    for _attempt in range(2):
+        resolved = _resolve_include_path(target, base_dir)
+        if resolved is None or resolved in seen:
+            return None
+        try:
+            return resolved, _tokenize_include(resolved, ignore_stm_wrappers)
+        except OSError:
+            _forget_include(resolved)
+        except Exception:
+            return None
+    return None
+
+
 def _expand_includes(
-    tokens: List[Tuple[str, str]],
+    tokens: Iterable[Tuple[str, str]],
     base_dir: Path,
     seen: set[Path] | None = None,
     *,
     expand_exinclude: bool = False,
     exinclude_mode: str = "zero",
     ignore_stm_wrappers: bool = False,
-) -> List[Tuple[str, str]]:
+) -> Iterator[Tuple[str, str]]:
     """Inline <include target> by replacing the tag with the referenced file's tokens.
 
+    Streams: tokens are consumed and yielded one at a time, so the tokenizer output can be fed
+    straight in without an intermediate list.
+
     - Recurses into nested includes
     - Skips expansion on cycles (already-seen paths)
     - Leaves the original <include> tag untouched if resolution or read fails
     """
     seen = seen or set()
-    out: List[Tuple[str, str]] = []
-    for kind, value in tokens:
-        if kind == "tag":
+    include_head = _INCLUDE_HEAD.match
+    for tok in tokens:
+        kind, value = tok
+        # Only tags that can be <include>/<exinclude> are split; everything else passes through as-is
+        if kind == "tag" and include_head(value):
             inner = value[1:-1].strip()
             if inner:
                 parts = inner.split()
                 if parts and parts[0].lower() == "include" and len(parts) >= 2:
                     target = parts[1].strip('"')
-                    resolved = _resolve_include_path(target, base_dir)
-                    if resolved and resolved not in seen:
-                        try:
-                            text = resolved.read_text(encoding="utf-8", errors="ignore")
-                            sub_tokens = _tokenize(text, ignore_stm_wrappers=ignore_stm_wrappers)
-                            # Recurse with the included file's directory and updated seen set
-                            out.extend(
-                                _expand_includes(
-                                    sub_tokens,
-                                    resolved.parent,
-                                    seen | {resolved},
-                                    expand_exinclude=expand_exinclude,
-                                    exinclude_mode=exinclude_mode,
-                                )
-                            )
-                            continue  # replaced this <include> tag
-                        except Exception:
-                            pass
+                    loaded = _load_include(target, base_dir, seen, ignore_stm_wrappers)
+                    if loaded is not None:
+                        resolved, sub_tokens = loaded
+                        # Recurse with the included file's directory and updated seen set
+                        yield from _expand_includes(
+                            sub_tokens,
+                            resolved.parent,
+                            seen | {resolved},
+                            expand_exinclude=expand_exinclude,
+                            exinclude_mode=exinclude_mode,
+                        )
+                        continue  # replaced this <include> tag
                 # Conditional include: <exinclude cvar page_if_zero page_if_nonzero>
                 # Only expand during rendering (expand_exinclude=True). Otherwise keep the tag intact
                 # so the base document preserves authoring intent and allows toggling later.
@@ -147,31 +269,365 @@ def _expand_includes(
                                 target = parts[3].strip('"')
                         except Exception:
                             target = parts[2].strip('"')
-                        resolved = _resolve_include_path(target, base_dir)
-                        if resolved and resolved not in seen:
-                            try:
-                                text = resolved.read_text(encoding="utf-8", errors="ignore")
-                                sub_tokens = _tokenize(text, ignore_stm_wrappers=ignore_stm_wrappers)
-                                out.extend(
-                                    _expand_includes(
-                                        sub_tokens,
-                                        resolved.parent,
-                                        seen | {resolved},
-                                        expand_exinclude=expand_exinclude,
-                                        exinclude_mode=exinclude_mode,
-                                        ignore_stm_wrappers=ignore_stm_wrappers,
-                                    )
-                                )
-                                continue
-                            except Exception:
-                                pass
+                        loaded = _load_include(target, base_dir, seen, ignore_stm_wrappers)
+                        if loaded is not None:
+                            resolved, sub_tokens = loaded
+                            yield from _expand_includes(
+                                sub_tokens,
+                                resolved.parent,
+                                seen | {resolved},
+                                expand_exinclude=expand_exinclude,
+                                exinclude_mode=exinclude_mode,
+                                ignore_stm_wrappers=ignore_stm_wrappers,
+                            )
+                            continue
                     # Not expanding: fall-through to keep original tag
-        out.append((kind, value))
-    return out
+        yield tok
+
+
+# Frame tail keyword handlers: each consumes its arguments from tokens[j] onward and returns
+# the index past them, or -1 when the keyword is incomplete or malformed (kept as an extra).
+# Quotes around names and page values are tolerated.
+def _tail_border(frame: RfmFrame, tokens: List[str], j: int) -> int:
+    if j + 3 >= len(tokens):
+        return -1
+    try:
+        frame.border_width = int(tokens[j + 1])
+        frame.border_line_width = int(tokens[j + 2])
+    except ValueError:
+        return -1
+    frame.border_line_color = sys.intern(tokens[j + 3])
+    return j + 4
+
+
+def _tail_backfill(frame: RfmFrame, tokens: List[str], j: int) -> int:
+    if j + 1 >= len(tokens):
+        return -1
+    frame.backfill_color = tokens[j + 1]
+    return j + 2
+
+
+def _tail_cut(frame: RfmFrame, tokens: List[str], j: int) -> int:
+    if j + 1 >= len(tokens):
+        return -1
+    frame.cut_from = tokens[j + 1].strip('"')
+    return j + 2
+
+
+def _tail_cursor(frame: RfmFrame, tokens: List[str], j: int) -> int:
+    if j + 1 >= len(tokens):
+        return -1
+    try:
+        frame.cursor = int(tokens[j + 1])
+    except ValueError:
+        return -1
+    return j + 2
+
+
+def _tail_page(frame: RfmFrame, tokens: List[str], j: int) -> int:
+    if j + 1 >= len(tokens):
+        return -1
+    frame.page = tokens[j + 1].strip('"')
+    return j + 2
+
+
+def _tail_cpage(frame: RfmFrame, tokens: List[str], j: int) -> int:
+    if j + 1 >= len(tokens):
+        return -1
+    frame.cpage_cvar = tokens[j + 1].strip('"')
+    return j + 2
+
+
+_TAIL_HANDLERS = {
+    "border": _tail_border,
+    "backfill": _tail_backfill,
+    "cut": _tail_cut,
+    "cursor": _tail_cursor,
+    "page": _tail_page,
+    "cpage": _tail_cpage,
+}
+
+
+def parse_tail_keyword(frame: RfmFrame, tokens: List[str], j: int) -> int:
+    """Apply the frame tail keyword at tokens[j] to frame.
+
+    Returns the index past its arguments, or -1 when tokens[j] is not a tail keyword or its
+    arguments are incomplete or malformed.
+    """
+    handler = _TAIL_HANDLERS.get(tokens[j].lower())
+    return handler(frame, tokens, j) if handler is not None else -1
+
+
+def parse_frame_tail(frame: RfmFrame, tail_tokens: List[str], extras: List[str] | None = None) -> None:
+    """Fill frame's page/border/backfill/cut/cursor fields, token spans and tail_extra from tail_tokens.
+
+    extras is an optional scratch list for the unrecognized words; it is cleared first.
+    """
+    if extras is None:
+        extras = []
+    else:
+        extras.clear()
+    spans = frame._tail_token_spans
+    j = 0
+    while j < len(tail_tokens):
+        nj = parse_tail_keyword(frame, tail_tokens, j)
+        if nj >= 0:
+            spans[tail_tokens[j].lower()] = (j, nj)
+            j = nj
+            continue
+        # Unrecognized words are kept verbatim as tail extras
+        extras.append(tail_tokens[j])
+        j += 1
+    frame.tail_extra = " ".join(extras)
+
+
+# Area attribute handlers, same contract as the frame tail handlers: consume the keyword's
+# arguments from tokens[k] onward and return the index past them, or -1 to skip the word.
+def _attr_value(field_name: str, unquote: bool = False) -> Callable[[RfmElement, List[str], int], int]:
+    def handler(elem: RfmElement, tokens: List[str], k: int) -> int:
+        if k + 1 >= len(tokens):
+            return -1
+        v = tokens[k + 1]
+        setattr(elem, field_name, v.strip('"') if unquote else v)
+        return k + 2
+    return handler
+
+
+def _attr_int(field_name: str) -> Callable[[RfmElement, List[str], int], int]:
+    def handler(elem: RfmElement, tokens: List[str], k: int) -> int:
+        if k + 1 >= len(tokens):
+            return -1
+        try:
+            setattr(elem, field_name, int(tokens[k + 1]))
+        except ValueError:
+            return -1
+        return k + 2
+    return handler
+
+
+def _attr_flag(field_name: str) -> Callable[[RfmElement, List[str], int], int]:
+    def handler(elem: RfmElement, tokens: List[str], k: int) -> int:
+        setattr(elem, field_name, True)
+        return k + 1
+    return handler
+
+
+def _attr_condition(cond: str) -> Callable[[RfmElement, List[str], int], int]:
+    # Conditional flags always consume the keyword; the value is optional at the end of the tag
+    def handler(elem: RfmElement, tokens: List[str], k: int) -> int:
+        vals = elem.conditions.setdefault(cond, [])
+        if k + 1 < len(tokens):
+            vals.append(tokens[k + 1])
+            return k + 2
+        return k + 1
+    return handler
+
+
+def _attr_key(elem: RfmElement, tokens: List[str], k: int) -> int:
+    if k + 2 >= len(tokens):
+        return -1
+    elem.key_name = tokens[k + 1]
+    elem.key_command = tokens[k + 2].strip('"')
+    return k + 3
+
+
+def _attr_ckey(elem: RfmElement, tokens: List[str], k: int) -> int:
+    if k + 3 >= len(tokens):
+        return -1
+    elem.ckey_var = tokens[k + 1]
+    elem.ckey_false_command = tokens[k + 2].strip('"')
+    elem.ckey_true_command = tokens[k + 3].strip('"')
+    return k + 4
+
+
+def _attr_ikey(elem: RfmElement, tokens: List[str], k: int) -> int:
+    if k + 2 >= len(tokens):
+        return -1
+    elem.ikey_action = tokens[k + 1]
+    elem.ikey_command = tokens[k + 2].strip('"')
+    return k + 3
+
+
+def _attr_border(elem: RfmElement, tokens: List[str], k: int) -> int:
+    if k + 3 >= len(tokens):
+        return -1
+    try:
+        elem.area_border_width = int(tokens[k + 1])
+        elem.area_border_line_width = int(tokens[k + 2])
+    except ValueError:
+        return -1
+    elem.area_border_line_color = sys.intern(tokens[k + 3])
+    return k + 4
+
+
+def _attr_align(elem: RfmElement, tokens: List[str], k: int) -> int:
+    if k + 1 >= len(tokens):
+        return -1
+    elem.align = sys.intern(tokens[k + 1].lower())
+    return k + 2
+
+
+_ATTR_HANDLERS: dict[str, Callable[[RfmElement, List[str], int], int]] = {
+    "tint": _attr_value("tint"),
+    "atint": _attr_value("atint"),
+    "btint": _attr_value("btint"),
+    "ctint": _attr_value("ctint"),
+    "dtint": _attr_value("dtint"),
+    "bolt": _attr_value("bolt", unquote=True),
+    "bbolt": _attr_value("bbolt", unquote=True),
+    "key": _attr_key,
+    "ckey": _attr_ckey,
+    "ikey": _attr_ikey,
+    "tip": _attr_value("tip_text", unquote=True),
+    "noshade": _attr_flag("noshade"),
+    "noscale": _attr_flag("noscale"),
+    "noborder": _attr_flag("noborder"),
+    "border": _attr_border,
+    "width": _attr_int("width_px"),
+    "height": _attr_int("height_px"),
+    "next": _attr_value("next_cmd", unquote=True),
+    "prev": _attr_value("prev_cmd", unquote=True),
+    "cvar": _attr_value("cvar"),
+    "cvari": _attr_value("cvari"),
+    "inc": _attr_value("inc"),
+    "mod": _attr_value("mod"),
+    "xoff": _attr_int("xoff"),
+    "yoff": _attr_int("yoff"),
+    "tab": _attr_flag("tab"),
+    "align": _attr_align,
+}
+_ATTR_HANDLERS.update((cond, _attr_condition(cond)) for cond in _COND_OPS)
+
+
+def _split_tag(value: str) -> tuple[str, str, List[str], List[str]]:
+    """Split a raw tag into (lname, inner, rest, rest_lower) for pass 1.
+
+    Tags that pass 1 ignores are rejected on the name alone, without splitting the tail.
+    Element words are lowercased here once, for the attribute parser and the keyword scans.
+    The lists are shared between identical tags and only ever read.
+    """
+    inner = value[1:-1].strip()
+    if not inner:
+        return "", "", [], []
+    head = inner.split(None, 1)
+    # Interned: names come from a small vocabulary and are compared against literals throughout
+    lname = sys.intern(head[0].lower())
+    if lname not in _PASS1_TAGS or len(head) < 2:
+        return lname, inner, [], []
+    # Split only the remainder; the name is not split twice and no [1:] copy is made
+    rest = head[1].split()
+    rest_lower = [t.lower() for t in rest] if lname in _OUTLINE_ELEMENT_TAGS else []
+    return lname, inner, rest, rest_lower
+
+
+def _apply_common_area_attrs(elem: RfmElement, tokens: List[str], lowered: List[str], s: int) -> None:
+    """Parse common area attributes from tokens[s:] into elem; lowered[i] is tokens[i].lower()."""
+    k2 = s
+    n = len(tokens)
+    while k2 < n:
+        handler = _ATTR_HANDLERS.get(lowered[k2])
+        nk = handler(elem, tokens, k2) if handler is not None else -1
+        k2 = nk if nk >= 0 else k2 + 1
+    # Join flag/border display strings once for the Properties panel
+    flags = [f for f, on in (("noshade", elem.noshade), ("noscale", elem.noscale), ("noborder", elem.noborder)) if on]
+    elem._flags_str = ", ".join(flags) or None
+    bw, blw, blc = elem.area_border_width, elem.area_border_line_width, elem.area_border_line_color
+    if bw is not None or blw is not None or blc is not None:
+        elem._border_str = f"{bw or 0} {blw or 0} {blc or ''}"
+
+
+# Element parsers for pass 1, keyed by tag name. Each fills elem from the words after the name
+# (rest, never empty; rest_lower[i] is rest[i].lower()) and the stripped tag text (inner).
+def _parse_text(elem: RfmElement, rest: List[str], rest_lower: List[str], inner: str) -> None:
+    # Bare words consumed as the text value; attributes start after them
+    collected: list[str] = []
+    # capture quoted or bare
+    m = _TEXT_CONTENT_RE.search(inner)
+    if m:
+        elem.text_content = m.group(1)
+    else:
+        # For bare text until a known attribute keyword, join tokens up to first recognized attr
+        for tok, tok_lower in zip(rest, rest_lower):
+            if tok_lower in _TEXT_STOP_ATTRS:
+                break
+            collected.append(tok)
+        elem.text_content = " ".join(s.strip('"') for s in collected) if collected else rest[0].strip('"')
+    # Support atext as prefix text
+    m2 = _ATEXT_RE.search(inner)
+    if m2:
+        elem.atext = m2.group(1)
+    # Apply common attributes, skipping the text value
+    _apply_common_area_attrs(elem, rest, rest_lower, max(1, len(collected)))
+
+
+def _parse_image(elem: RfmElement, rest: List[str], rest_lower: List[str], inner: str) -> None:
+    # first arg could be quoted or bare; allow missing extension (e.g., weapons/w_shotgun)
+    elem.image_path = rest[0].strip('"')
+    # Parse common attributes in a simple sequential pass (applies to most area types)
+    _apply_common_area_attrs(elem, rest, rest_lower, 1)
+    # Parse overlay text on images: text <string> <xoff> <yoff>
+    mimg = _IMAGE_OVERLAY_RE.search(inner)
+    if mimg:
+        elem.overlay_text = mimg.group(1)
+        try:
+            elem.overlay_xoff = int(mimg.group(2))
+            elem.overlay_yoff = int(mimg.group(3))
+        except ValueError:
+            pass
+
+
+def _parse_ctext(elem: RfmElement, rest: List[str], rest_lower: List[str], inner: str) -> None:
+    # First argument is a cvar name (not a literal text)
+    m = _CTEXT_RE.search(inner)
+    elem.cvar = m.group(1) if m else rest[0].strip('"')
+    _apply_common_area_attrs(elem, rest, rest_lower, 1)
+
+
+def _parse_ticker(elem: RfmElement, rest: List[str], rest_lower: List[str], inner: str) -> None:
+    # Try to read quoted text for ticker
+    m = _TICKER_RE.search(inner)
+    elem.text_content = m.group(1) if m else rest[0].strip('"')
+    _apply_common_area_attrs(elem, rest, rest_lower, 1)
+
+
+def _parse_plain_area(elem: RfmElement, rest: List[str], rest_lower: List[str], inner: str) -> None:
+    # Parse common attributes for areas without a leading value
+    _apply_common_area_attrs(elem, rest, rest_lower, 0)
+
+
+def _parse_ghoul(elem: RfmElement, rest: List[str], rest_lower: List[str], inner: str) -> None:
+    _apply_common_area_attrs(elem, rest, rest_lower, 0)
+    # First token after name is model (quoted or bare)
+    elem.model_name = rest[0].strip('"')
+    # Scan for scale/time
+    for i in range(1, len(rest) - 1):
+        t = rest_lower[i]
+        if t == "scale":
+            try:
+                elem.scale_val = float(rest[i + 1])
+            except ValueError:
+                pass
+        elif t == "time":
+            try:
+                elem.time_val = float(rest[i + 1])
+            except ValueError:
+                pass
+
+
+# Only _OUTLINE_ELEMENT_TAGS reach these; other tags are dropped before an element is built
+_ELEMENT_PARSERS: dict[str, Callable[[RfmElement, List[str], List[str], str], None]] = {
+    "text": _parse_text,
+    "image": _parse_image,
+    "ctext": _parse_ctext,
+    "ticker": _parse_ticker,
+    "hr": _parse_plain_area,
+    "blank": _parse_plain_area,
+    "bghoul": _parse_ghoul,
+}
 
 
 def parse_rfm_content(
-    content: str,
+    content: str | Iterable[str],
     file_path: str | None = None,
     *,
     expand_include: bool = True,
@@ -179,30 +635,52 @@ def parse_rfm_content(
     exinclude_mode: str = "zero",
     ignore_stm_wrappers: bool = False,
 ) -> RfmDocument:
-    tokens = _tokenize(content, ignore_stm_wrappers=ignore_stm_wrappers)
+    # Accept serializer output pieces directly; the scanner and fallbacks need the joined text
+    if not isinstance(content, str):
+        content = "".join(content)
     # Expand <include> tags in-place before building the model
     try:
         base_dir = Path(file_path).parent if file_path else Path.cwd()
     except Exception:
         base_dir = Path.cwd()
     if expand_include or expand_exinclude:
-        tokens = _expand_includes(
-            tokens,
+        # Seed the cycle guard with this file so A -> B -> A stops at B instead of re-inlining A
+        seen: set[Path] = set()
+        if file_path:
+            try:
+                seen.add(Path(file_path).resolve())
+            except Exception:
+                pass
+        # Tokenize and expand in one streaming pass; the segment list is materialized once
+        tokens = list(_expand_includes(
+            _iter_tokens(content, ignore_stm_wrappers=ignore_stm_wrappers),
             base_dir,
+            seen,
             expand_exinclude=expand_exinclude,
             exinclude_mode=exinclude_mode,
             ignore_stm_wrappers=ignore_stm_wrappers,
-        )
+        ))
+    else:
+        tokens = _tokenize(content, ignore_stm_wrappers=ignore_stm_wrappers)
     doc = RfmDocument(segments=tokens, file_path=file_path, doc_key=file_path or "<memory>")
+    # Scratch list for unrecognized frame tail words, cleared per frame instead of reallocated
+    extras: list[str] = []
+    # Split tag heads keyed by raw tag text; repeated tags reuse the words of the first
+    tag_heads: dict[str, tuple[str, str, List[str], List[str]]] = {}
 
     # Pass 1: collect frames and simple elements for outline/preview
     for idx, (kind, value) in enumerate(tokens):
         # Allow free text between tags to behave like <text ...>
         if kind == "text":
             try:
-                s = value
-                # Collapse whitespace (including newlines) and strip
-                s = re.sub(r"\s+", " ", s).strip()
+                # Whitespace-only separators (the bulk of text tokens) end here without the regex
+                s = value.strip()
+                if not s:
+                    continue
+                # Collapse whitespace (including newlines) only when there is a run or a non-space
+                # whitespace char; isprintable() is False for every whitespace char except " "
+                if "  " in s or not s.isprintable():
+                    s = _WS_RUN_RE.sub(" ", s)
                 # Remove surrounding quotes if the whole token is quoted
                 if len(s) >= 2 and s[0] == '"' and s[-1] == '"':
                     s = s[1:-1]
@@ -210,16 +688,19 @@ def parse_rfm_content(
                     elem = RfmElement(name="text", raw_tag=value, segment_index=idx)
                     elem.text_content = s
                     doc.elements.append(elem)
+                    doc._element_by_segment[idx] = elem
             except Exception:
                 pass
             continue
         if kind != "tag":
             continue
-        inner = value[1:-1].strip()
-        if not inner:
+        # Identical tags (shared segment tuples) are stripped and split once per parse
+        head = tag_heads.get(value)
+        if head is None:
+            head = tag_heads[value] = _split_tag(value)
+        lname, inner, rest, rest_lower = head
+        if lname not in _PASS1_TAGS:
             continue
-        name, *rest = inner.split()
-        lname = name.lower()
 
         if lname == "frame" and len(rest) >= 3:
             frame_name = rest[0]
@@ -231,295 +712,58 @@ def parse_rfm_content(
             tail_tokens = rest[3:]
             frame = RfmFrame(name=frame_name, width=width, height=height)
             # Parse supported tail bits: page/border/backfill/cut/cursor
-            j = 0
-            consumed = [False] * len(tail_tokens)
-            while j < len(tail_tokens):
-                tok = tail_tokens[j].lower()
-                # tolerate quotes around names and page values
-                if tok == "border" and j + 3 < len(tail_tokens):
-                    try:
-                        frame.border_width = int(tail_tokens[j + 1])
-                        frame.border_line_width = int(tail_tokens[j + 2])
-                        frame.border_line_color = tail_tokens[j + 3]
-                        consumed[j] = consumed[j + 1] = consumed[j + 2] = consumed[j + 3] = True
-                        j += 4
-                        continue
-                    except ValueError:
-                        pass
-                if tok == "backfill" and j + 1 < len(tail_tokens):
-                    frame.backfill_color = tail_tokens[j + 1]
-                    consumed[j] = consumed[j + 1] = True
-                    j += 2
-                    continue
-                if tok == "cut" and j + 1 < len(tail_tokens):
-                    frame.cut_from = tail_tokens[j + 1].strip('"')
-                    consumed[j] = consumed[j + 1] = True
-                    j += 2
-                    continue
-                if tok == "cursor" and j + 1 < len(tail_tokens):
-                    try:
-                        frame.cursor = int(tail_tokens[j + 1])
-                        consumed[j] = consumed[j + 1] = True
-                        j += 2
-                        continue
-                    except ValueError:
-                        pass
-                if tok == "page" and j + 1 < len(tail_tokens):
-                    frame.page = tail_tokens[j + 1].strip('"')
-                    consumed[j] = consumed[j + 1] = True
-                    j += 2
-                    continue
-                if tok == "cpage" and j + 1 < len(tail_tokens):
-                    frame.cpage_cvar = tail_tokens[j + 1].strip('"')
-                    consumed[j] = consumed[j + 1] = True
-                    j += 2
-                    continue
-                j += 1
+            parse_frame_tail(frame, tail_tokens, extras)
             frame.raw_tail = " ".join(tail_tokens)
-            extras = [t for t, c in zip(tail_tokens, consumed) if not c]
-            frame.tail_extra = " ".join(extras)
             doc.frames[frame_name] = frame
             doc.frame_segment_indices[frame_name] = idx
             continue
 
-        # Small subset of elements for preview + capture basic layout state changes
-        elem = RfmElement(name=lname, raw_tag=value, segment_index=idx)
-
-        # Helper to parse common area attributes from a token list starting at index s
-        def _apply_common_area_attrs(elem: RfmElement, tokens: list[str], s: int) -> None:
-            k2 = s
-            while k2 < len(tokens):
-                t2 = tokens[k2].lower()
-                if t2 == "tint" and k2 + 1 < len(tokens):
-                    elem.tint = tokens[k2 + 1]
-                    k2 += 2; continue
-                if t2 == "atint" and k2 + 1 < len(tokens):
-                    elem.atint = tokens[k2 + 1]
-                    k2 += 2; continue
-                if t2 == "btint" and k2 + 1 < len(tokens):
-                    elem.btint = tokens[k2 + 1]
-                    k2 += 2; continue
-                if t2 == "ctint" and k2 + 1 < len(tokens):
-                    elem.ctint = tokens[k2 + 1]
-                    k2 += 2; continue
-                if t2 == "dtint" and k2 + 1 < len(tokens):
-                    elem.dtint = tokens[k2 + 1]
-                    k2 += 2; continue
-                if t2 == "bolt" and k2 + 1 < len(tokens):
-                    elem.bolt = tokens[k2 + 1].strip('"')
-                    k2 += 2; continue
-                if t2 == "bbolt" and k2 + 1 < len(tokens):
-                    elem.bbolt = tokens[k2 + 1].strip('"')
-                    k2 += 2; continue
-                if t2 == "key" and k2 + 2 < len(tokens):
-                    elem.key_name = tokens[k2 + 1]
-                    elem.key_command = tokens[k2 + 2].strip('"')
-                    k2 += 3; continue
-                if t2 == "ckey" and k2 + 3 < len(tokens):
-                    elem.ckey_var = tokens[k2 + 1]
-                    elem.ckey_false_command = tokens[k2 + 2].strip('"')
-                    elem.ckey_true_command = tokens[k2 + 3].strip('"')
-                    k2 += 4; continue
-                if t2 == "ikey" and k2 + 2 < len(tokens):
-                    elem.ikey_action = tokens[k2 + 1]
-                    elem.ikey_command = tokens[k2 + 2].strip('"')
-                    k2 += 3; continue
-                if t2 == "tip" and k2 + 1 < len(tokens):
-                    elem.tip_text = tokens[k2 + 1].strip('"')
-                    k2 += 2; continue
-                if t2 == "noshade":
-                    elem.noshade = True; k2 += 1; continue
-                if t2 == "noscale":
-                    elem.noscale = True; k2 += 1; continue
-                if t2 == "noborder":
-                    elem.noborder = True; k2 += 1; continue
-                if t2 == "border" and k2 + 3 < len(tokens):
-                    try:
-                        elem.area_border_width = int(tokens[k2 + 1])
-                        elem.area_border_line_width = int(tokens[k2 + 2])
-                        elem.area_border_line_color = tokens[k2 + 3]
-                        k2 += 4; continue
-                    except ValueError:
-                        pass
-                if t2 == "width" and k2 + 1 < len(tokens):
-                    try:
-                        elem.width_px = int(tokens[k2 + 1]); k2 += 2; continue
-                    except ValueError:
-                        pass
-                if t2 == "height" and k2 + 1 < len(tokens):
-                    try:
-                        elem.height_px = int(tokens[k2 + 1]); k2 += 2; continue
-                    except ValueError:
-                        pass
-                if t2 == "next" and k2 + 1 < len(tokens):
-                    elem.next_cmd = tokens[k2 + 1].strip('"'); k2 += 2; continue
-                if t2 == "prev" and k2 + 1 < len(tokens):
-                    elem.prev_cmd = tokens[k2 + 1].strip('"'); k2 += 2; continue
-                if t2 == "cvar" and k2 + 1 < len(tokens):
-                    elem.cvar = tokens[k2 + 1]; k2 += 2; continue
-                if t2 == "cvari" and k2 + 1 < len(tokens):
-                    elem.cvari = tokens[k2 + 1]; k2 += 2; continue
-                if t2 == "inc" and k2 + 1 < len(tokens):
-                    elem.inc = tokens[k2 + 1]; k2 += 2; continue
-                if t2 == "mod" and k2 + 1 < len(tokens):
-                    elem.mod = tokens[k2 + 1]; k2 += 2; continue
-                if t2 == "xoff" and k2 + 1 < len(tokens):
-                    try:
-                        elem.xoff = int(tokens[k2 + 1]); k2 += 2; continue
-                    except ValueError:
-                        pass
-                if t2 == "yoff" and k2 + 1 < len(tokens):
-                    try:
-                        elem.yoff = int(tokens[k2 + 1]); k2 += 2; continue
-                    except ValueError:
-                        pass
-                if t2 == "tab": elem.tab = True; k2 += 1; continue
-                if t2 == "align" and k2 + 1 < len(tokens):
-                    elem.align = tokens[k2 + 1].lower(); k2 += 2; continue
-                if t2 in {"iflt","ifgt","ifle","ifge","ifne","ifeq","ifset","ifclr"}:
-                    vals: list[str] = []
-                    if k2 + 1 < len(tokens):
-                        vals.append(tokens[k2 + 1]); k2 += 2
-                    else:
-                        k2 += 1
-                    elem.conditions.setdefault(t2, []).extend(vals)
-                    continue
-                k2 += 1
-        if lname == "text" and len(rest) >= 1:
-            # capture quoted or bare
-            m = re.search(r'\btext\b\s+"([^"]*)"', inner, flags=re.IGNORECASE)
-            if m:
-                elem.text_content = m.group(1)
-            else:
-                # try first token after name
-                if rest:
-                    # For bare text until a known attribute keyword, join tokens up to first recognized attr
-                    stop_at = {"tint","atint","btint","ctint","dtint","bolt","bbolt","key","ckey","ikey","tip","noshade","noscale","noborder","border","width","height","next","prev","cvar","cvari","inc","mod","xoff","yoff","tab","align"}
-                    collected: list[str] = []
-                    for tok in rest:
-                        if tok.lower() in stop_at:
-                            break
-                        collected.append(tok)
-                    elem.text_content = " ".join(s.strip('"') for s in collected) if collected else rest[0].strip('"')
-            # Support atext as prefix text
-            m2 = re.search(r'\batext\b\s+"([^"]*)"', inner, flags=re.IGNORECASE)
-            if m2:
-                elem.atext = m2.group(1)
-            # Apply common attributes (skip text value)
-            # Shift index by number of consumed value tokens (collected)
-            consumed = 1
-            try:
-                consumed = max(1, len(collected))
-            except Exception:
-                consumed = 1
-            _apply_common_area_attrs(elem, rest, consumed)
-        elif lname == "image" and len(rest) >= 1:
-            # first arg could be quoted or bare; allow missing extension (e.g., weapons/w_shotgun)
-            arg0 = rest[0].strip('"')
-            elem.image_path = arg0
-            # Parse common attributes in a simple sequential pass (applies to most area types)
-            _apply_common_area_attrs(elem, rest, 1)
-            # Parse overlay text on images: text <string> <xoff> <yoff>
-            mimg = re.search(r'\btext\b\s+"([^"]*)"\s+(-?\d+)\s+(-?\d+)', inner, flags=re.IGNORECASE)
-            if mimg:
-                elem.overlay_text = mimg.group(1)
-                try:
-                    elem.overlay_xoff = int(mimg.group(2))
-                    elem.overlay_yoff = int(mimg.group(3))
-                except ValueError:
-                    pass
-        elif lname == "ctext" and len(rest) >= 1:
-            # First argument is a cvar name (not a literal text)
-            m = re.search(r'\bctext\b\s+"([^"]*)"', inner, flags=re.IGNORECASE)
-            if m:
-                elem.cvar = m.group(1)
-            else:
-                elem.cvar = rest[0].strip('"')
-            _apply_common_area_attrs(elem, rest, 1)
-        elif lname == "ticker" and len(rest) >= 1:
-            # Try to read quoted text for ticker
-            m = re.search(r'\bticker\b\s+"([^"]*)"', inner, flags=re.IGNORECASE)
-            if m:
-                elem.text_content = m.group(1)
-            else:
-                if rest:
-                    elem.text_content = rest[0].strip('"')
-            _apply_common_area_attrs(elem, rest, 1)
-        elif lname in {"hr", "hbr", "br", "blank", "list", "slider", "input", "setkey", "popup", "selection", "ghoul", "gpm", "filebox", "filereq", "loadbox", "serverbox", "serverdetail", "players", "listfile", "users", "chat", "rooms", "bghoul"}:
-            # Parse common attributes for these areas
-            _apply_common_area_attrs(elem, rest, 0)
-            # Capture minimal model props for ghoul/bghoul
-            if lname in {"ghoul", "bghoul"} and rest:
-                # First token after name is model (quoted or bare)
-                elem.model_name = rest[0].strip('"')
-                # Scan for scale/time
-                for i in range(1, len(rest)):
-                    t = rest[i].lower()
-                    if t == "scale" and i + 1 < len(rest):
-                        try:
-                            elem.scale_val = float(rest[i + 1])
-                        except ValueError:
-                            pass
-                    if t == "time" and i + 1 < len(rest):
-                        try:
-                            elem.time_val = float(rest[i + 1])
-                        except ValueError:
-                            pass
-            # list specifics
-            if lname == "list" and rest:
-                # items list may be quoted and comma separated
-                mlist = re.search(r'\blist\b\s+"([^"]*)"', inner, flags=re.IGNORECASE)
-                if mlist:
-                    elem.list_items = [s.strip() for s in mlist.group(1).split(',')]
-                # match list
-                mmatch = re.search(r'\bmatch\b\s+"([^"]*)"', inner, flags=re.IGNORECASE)
-                if mmatch:
-                    elem.list_match = [s.strip() for s in mmatch.group(1).split(',')]
-                # bitmask
-                mbit = re.search(r'\bbitmask\b\s+(\d+)', inner, flags=re.IGNORECASE)
-                if mbit:
-                    try:
-                        elem.list_bitmask = int(mbit.group(1))
-                    except ValueError:
-                        pass
-                # files root base ext
-                mfiles = re.search(r'\bfiles\b\s+"([^"]*)"\s+"([^"]*)"\s+"([^"]*)"', inner, flags=re.IGNORECASE)
-                if mfiles:
-                    elem.list_files_root = mfiles.group(1)
-                    elem.list_files_base = mfiles.group(2)
-                    elem.list_files_ext = mfiles.group(3)
-
-        # Extend: include center/left/right/normal (layout), ctext, font (as a mode marker), include, ticker, bghoul
-        # For now these are displayed in the outline and minimally rendered where applicable
-        if lname in {"text", "ctext", "image", "hr", "blank", "center", "left", "right", "normal", "font", "include", "ticker", "bghoul"}:
-            doc.elements.append(elem)
-
         # Backdrop
         if lname == "backdrop":
             # Simplified parse: a sequence of tokens, modes are flags until a non-flag = image
-            tokens = rest[:]
+            # Read-only walk over the tag words; no copy, and the outer token list is not shadowed
+            btoks = rest
             mode = None
             image = None
             bgcolor = None
             k = 0
-            while k < len(tokens):
-                t = tokens[k].lower()
-                if t in {"tile", "stretch", "center", "left", "right"}:
-                    mode = t
+            while k < len(btoks):
+                t = btoks[k].lower()
+                if t in _BACKDROP_MODES:
+                    mode = sys.intern(t)
                     k += 1
                     continue
-                if t == "bgcolor" and k + 1 < len(tokens):
-                    bgcolor = tokens[k + 1]
+                if t == "bgcolor" and k + 1 < len(btoks):
+                    bgcolor = btoks[k + 1]
                     k += 2
                     continue
                 # First non-flag token is image path (optional)
                 if image is None:
-                    image = tokens[k].strip('"')
+                    image = btoks[k].strip('"')
                 k += 1
             doc.backdrop_segment_index = idx
             doc.backdrop_mode = mode
             doc.backdrop_image = image
             doc.backdrop_bgcolor = bgcolor
+            continue
+
+        # Malformed frame tags are dropped like any other non-element tag
+        if lname not in _OUTLINE_ELEMENT_TAGS:
+            continue
+
+        # Small subset of elements for preview + capture basic layout state changes.
+        # Only outline tags get this far, so no RfmElement is built for tags that are dropped.
+        elem = RfmElement(name=lname, raw_tag=value, segment_index=idx)
+
+        # Type-specific fields; layout markers (center/left/font/...) have no parser
+        parse_elem = _ELEMENT_PARSERS.get(lname)
+        if parse_elem is not None and rest:
+            parse_elem(elem, rest, rest_lower, inner)
+
+        # Extend: include center/left/right/normal (layout), ctext, font (as a mode marker), include, ticker, bghoul
+        # For now these are displayed in the outline and minimally rendered where applicable
+        doc.elements.append(elem)
+        doc._element_by_segment[idx] = elem
 
     # Fallback: if no frames were detected but content clearly contains frame tags, retry with STM wrappers ignored
     try:
@@ -584,31 +828,10 @@ def parse_rfm_content(
     # If segments are empty (tokenizer failed), synthesize a minimal segmentation so raw view isn't blank
     if not doc.segments:
         try:
-            parts: list[tuple[str, str]] = []
-            i = 0
-            n = len(content)
-            while i < n:
-                if content[i] == '<':
-                    j = i + 1
-                    in_q = False
-                    while j < n:
-                        c = content[j]
-                        if c == '"':
-                            in_q = not in_q
-                        if c == '>' and not in_q:
-                            j += 1
-                            break
-                        j += 1
-                    parts.append(("tag", content[i:j]))
-                    i = j
-                else:
-                    j = i
-                    while j < n and content[j] != '<':
-                        j += 1
-                    txt = content[i:j]
-                    if txt:
-                        parts.append(("text", txt))
-                    i = j
+            # Same tag/text split as _tokenize, without the stm gating
+            parts: list[tuple[str, str]] = [
+                ("tag" if tok[0] == "<" else "text", tok) for tok in _TOKEN_RE.findall(content)
+            ]
             if parts:
                 doc.segments = parts
         except Exception:
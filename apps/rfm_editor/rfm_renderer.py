@@ -1,11 +1,14 @@
 from __future__ import annotations
 
+import operator
+import os
 from typing import Tuple, Callable, Optional
 from pathlib import Path
 
 from PySide6.QtCore import QPointF, QRectF, Qt
-from PySide6.QtGui import QBrush, QColor, QPen
+from PySide6.QtGui import QBrush, QColor, QLinearGradient, QPen, QPixmap
 from PySide6.QtWidgets import (
+    QGraphicsItem,
     QGraphicsLineItem,
     QGraphicsPixmapItem,
     QGraphicsRectItem,
@@ -14,6 +17,58 @@ from PySide6.QtWidgets import (
 )
 
 from .rfm_model import RfmDocument, RfmElement, RfmFrame
+from .rfm_serializer import serialize_rfm
+
+
+# Element and frame fields the preview draws from; part of RfmRenderer's render signature
+_ELEMENT_RENDER_FIELDS = operator.attrgetter(
+    "segment_index", "name", "text_content", "atext", "image_path",
+    "overlay_text", "overlay_xoff", "overlay_yoff", "bolt", "bbolt",
+)
+_FRAME_RENDER_FIELDS = operator.attrgetter(
+    "name", "width", "height", "page", "cut_from",
+    "border_width", "border_line_width", "border_line_color", "backfill_color",
+)
+
+# Bound on distinct color tokens remembered by RfmRenderer._color_from_token
+_COLOR_CACHE_MAX = 256
+# Bound on decoded and stretched backdrop pixmaps kept by RfmRenderer
+_BACKDROP_CACHE_MAX = 8
+
+
+class _ItemRecorder:
+    """Scene stand-in for the draw helpers that also records every item they add."""
+
+    def __init__(self, scene: QGraphicsScene, items: list[QGraphicsItem]) -> None:
+        self._scene = scene
+        self._items = items
+
+    def addRect(self, *args):
+        item = self._scene.addRect(*args)
+        self._items.append(item)
+        return item
+
+    def addLine(self, *args):
+        item = self._scene.addLine(*args)
+        self._items.append(item)
+        return item
+
+    def addSimpleText(self, *args):
+        item = self._scene.addSimpleText(*args)
+        self._items.append(item)
+        return item
+
+    def addPixmap(self, *args):
+        item = self._scene.addPixmap(*args)
+        self._items.append(item)
+        return item
+
+    def addItem(self, item: QGraphicsItem) -> None:
+        self._scene.addItem(item)
+        self._items.append(item)
+
+    def __getattr__(self, name: str):
+        return getattr(self._scene, name)
 
 
 class RfmRenderer:
@@ -21,6 +76,26 @@ class RfmRenderer:
         self.frame_pen = QPen(QColor(80, 160, 255, 255))
         self.frame_brush = QBrush(QColor(80, 160, 255, 40))
         self.content_pen = QPen(QColor(240, 240, 240, 255))
+        # Fixed pens and brushes shared by every draw call (Qt copies them into each item)
+        self._no_pen = QPen(Qt.PenStyle.NoPen)
+        self._outline_pen = QPen(QColor(120, 160, 220, 180))
+        self._outline_pen.setWidth(1)
+        self._outline_pen.setCosmetic(True)
+        self._dashed_outline_pen = QPen(QColor(120, 160, 220, 110))
+        self._dashed_outline_pen.setCosmetic(True)
+        self._dashed_outline_pen.setWidth(1)
+        self._dashed_outline_pen.setStyle(Qt.PenStyle.DashLine)
+        self._rule_pen = QPen(QColor(180, 180, 180, 200))
+        self._rule_pen.setWidth(1)
+        self._placeholder_pen = QPen(QColor(140, 140, 140))
+        self._placeholder_brush = QBrush(QColor(90, 90, 90))
+        self._text_brush = QBrush(QColor(240, 240, 240))
+        self._ticker_brush = QBrush(QColor(240, 200, 120))
+        self._label_brush = QBrush(QColor(210, 210, 210))
+        self._bolt_brush = QBrush(QColor(255, 200, 0))
+        # Overflow fade brush, rebuilt only when the screen geometry it spans changes
+        self._fade_brush: QBrush | None = None
+        self._fade_rect: QRectF | None = None
         # Legacy maps (name/segment_index) kept for backward compatibility
         self.frame_rects: dict[str, QRectF] = {}
         self.element_rects: dict[int, QRectF] = {}
@@ -44,6 +119,67 @@ class RfmRenderer:
         # Exinclude render mode and resolver for dynamic expansion
         self.exinclude_mode: str = "zero"  # or "nonzero"
         self.exinclude_parser: Optional[Callable[[str, Optional[str], str], Optional[RfmDocument]]] = None
+        # Items kept across renders for incremental redraw. Backdrop and frame items are reused
+        # while their inputs are unchanged; element flow, fade and sub-pages are rebuilt each time.
+        self._render_scene: QGraphicsScene | None = None
+        self._backdrop_sig: tuple | None = None
+        self._backdrop_items: list[QGraphicsItem] = []
+        # (frame name, signature, items) in draw order
+        self._frame_items: list[tuple[str, tuple, list[QGraphicsItem]]] = []
+        self._flow_items: list[QGraphicsItem] = []
+        # Signature of the document and settings behind the current scene contents
+        self._render_sig: tuple | None = None
+        # selection_rect_for handlers keyed by exact payload type
+        self._selection_dispatch = {
+            RfmFrame: self._frame_selection_rect,
+            RfmElement: self._element_selection_rect,
+        }
+        # Parsed color tokens; menus reuse a small palette across frames and redraws
+        self._color_cache: dict[str, QColor] = {}
+        # Decoded backdrop pixmaps keyed by (path, resource_root, menu_root) -> (file, mtime_ns, pixmap),
+        # and stretched variants keyed by (file, mtime_ns, width, height)
+        self._backdrop_cache: dict[tuple, tuple[str, int, QPixmap]] = {}
+        self._backdrop_scaled_cache: dict[tuple[str, int, int, int], QPixmap] = {}
+
+    def clear_scene(self, scene: QGraphicsScene) -> None:
+        """Clear the scene and drop the items kept for incremental redraw."""
+        scene.clear()
+        self._forget_scene_items()
+
+    def _forget_scene_items(self) -> None:
+        self._render_scene = None
+        self._render_sig = None
+        self._backdrop_sig = None
+        self._backdrop_items = []
+        self._frame_items = []
+        self._flow_items = []
+
+    def _scene_items_alive(self, scene: QGraphicsScene) -> bool:
+        # Kept items are gone if the scene was cleared behind our back (their C++ side is deleted)
+        try:
+            for items in [self._backdrop_items, self._flow_items, *(e[2] for e in self._frame_items)]:
+                if items and items[0].scene() is not scene:
+                    return False
+        except RuntimeError:
+            return False
+        return True
+
+    def _remove_items(self, scene: QGraphicsScene, items: list[QGraphicsItem]) -> None:
+        for item in items:
+            try:
+                if item.scene() is scene:
+                    scene.removeItem(item)
+            except RuntimeError:
+                pass
+        items.clear()
+
+    @staticmethod
+    def _frame_signature(rect: QRectF, frame: RfmFrame) -> tuple:
+        # Everything _draw_frame reads
+        return (
+            rect.x(), rect.y(), rect.width(), rect.height(),
+            frame.border_width, frame.border_line_width, frame.border_line_color, frame.backfill_color,
+        )
 
     def _doc_key_of(self, doc: RfmDocument) -> str:
         try:
@@ -141,13 +277,53 @@ class RfmRenderer:
                         return str(found)
         return None
 
+    def _render_signature(self, doc: RfmDocument) -> tuple | None:
+        """Snapshot of everything a render of doc reads, or None when it cannot be captured.
+
+        Sub-page rendering pulls in other documents through page_resolver, so it is not covered.
+        """
+        if self.subframe_rendering_enabled:
+            return None
+        return (
+            self._doc_key_of(doc),
+            tuple(doc.segments),
+            tuple(_ELEMENT_RENDER_FIELDS(e) + (tuple(e.list_items or ()),) for e in doc.elements),
+            tuple(_FRAME_RENDER_FIELDS(f) for f in doc.frames.values()),
+            doc.backdrop_bgcolor, doc.backdrop_image, doc.backdrop_mode,
+            self.max_screen_width, self.max_screen_height, self.menu_root, self.resource_root,
+            self.exinclude_mode, self.exinclude_parser,
+        )
+
     def render_document(self, doc: RfmDocument, scene: QGraphicsScene) -> None:
+        # Re-render of an unchanged document into the same, intact scene: it already shows it
+        sig = self._render_signature(doc)
+        if (
+            sig is not None
+            and sig == self._render_sig
+            and self._render_scene is scene
+            and self._scene_items_alive(scene)
+        ):
+            return
+        self._render_sig = None
+        # Build with the BSP index off and change signals blocked: every add would otherwise update
+        # the index and queue a change notification. The index is rebuilt once when restored.
+        prev_index = scene.itemIndexMethod()
+        scene.setItemIndexMethod(QGraphicsScene.ItemIndexMethod.NoIndex)
+        scene.blockSignals(True)
+        try:
+            self._render_document(doc, scene)
+        finally:
+            scene.blockSignals(False)
+            scene.setItemIndexMethod(prev_index)
+        scene.update()
+        self._render_sig = sig
+
+    def _render_document(self, doc: RfmDocument, scene: QGraphicsScene) -> None:
         # If the document contains exinclude tags and a parser is provided, create a transient doc expanded for current mode
         try:
             expanded_doc = None
             if self.exinclude_parser and doc and getattr(doc, 'file_path', None):
                 # Re-read from serialized current doc to keep edits
-                from .rfm_serializer import serialize_rfm
                 serialized = serialize_rfm(doc)
                 expanded_doc = self.exinclude_parser(serialized, getattr(doc, 'file_path', None), self.exinclude_mode)
             # Fallback if expansion produced an empty/invalid document
@@ -177,14 +353,18 @@ class RfmRenderer:
         # Arrange top-level frames in a vertical stack; nested frames inside their parent's inner rect
         y_cursor = 0.0
         margin = 0.0
-        frame_rects: list[tuple[QRectF, RfmFrame]] = []
+        # Laid-out frames in draw order, as parallel lists (rects[i] belongs to frames[i])
+        rects: list[QRectF] = []
+        frames: list[RfmFrame] = []
 
         def clamp_dims_for_border(w: float, h: float, f: RfmFrame) -> tuple[float, float]:
-            bw = float(f.border_width or 0)
-            if bw * 2 >= w:
-                w = max(1.0, w)
-            if bw * 2 >= h:
-                h = max(1.0, h)
+            # Only sub-pixel sizes inside a border are bumped to one pixel; everything else passes
+            if w < 1.0 or h < 1.0:
+                bw2 = float(f.border_width or 0) * 2
+                if w < 1.0 and bw2 >= w:
+                    w = 1.0
+                if h < 1.0 and bw2 >= h:
+                    h = 1.0
             return w, h
 
         def inner_rect_of(rect: QRectF, f: RfmFrame) -> QRectF:
@@ -195,52 +375,87 @@ class RfmRenderer:
             return inner
 
         top_level_rects: dict[str, QRectF] = {}
+        max_w = float(self.max_screen_width)
+        max_h = float(self.max_screen_height)
         for f in top_level_frames:
-            w_val = float(self.max_screen_width if f.width == 0 else min(f.width, self.max_screen_width))
-            h_val = float(self.max_screen_height if f.height == 0 else min(f.height, self.max_screen_height))
+            # 0 means fill the screen; larger sizes are clamped to it
+            fw = f.width
+            fh = f.height
+            w_val = max_w if fw == 0 or fw > max_w else float(fw)
+            h_val = max_h if fh == 0 or fh > max_h else float(fh)
             w_val, h_val = clamp_dims_for_border(w_val, h_val, f)
             rect = QRectF(0.0, y_cursor, w_val, h_val)
-            f.preview_pos = (int(rect.x()), int(rect.y()))
-            frame_rects.append((rect, f))
+            f.preview_pos = (0, int(y_cursor))
+            rects.append(rect)
+            frames.append(f)
             top_level_rects[f.name] = rect
-            y_cursor += rect.height() + margin
+            y_cursor += h_val + margin
 
         def layout_children(parent: RfmFrame, parent_rect: QRectF) -> None:
             # Place children left-to-right within parent's inner rect (normal layout)
             container = inner_rect_of(parent_rect, parent)
             x_cursor = float(container.left())
-            children = list(children_by_parent.get(parent.name, []) or [])
-            for ch in children:
+            right = float(container.right())
+            top = float(container.top())
+            avail_h = float(container.height())
+            for ch in children_by_parent.get(parent.name, ()):
                 # Remaining width from current cursor
-                available_w = float(container.right() - x_cursor)
+                available_w = right - x_cursor
                 if available_w <= 0:
                     break
                 # Width/height rules: 0 means fill remaining/parent respectively
-                w_target = available_w if int(getattr(ch, 'width', 0) or 0) == 0 else float(min(int(ch.width), available_w))
-                h_target = float(container.height()) if int(getattr(ch, 'height', 0) or 0) == 0 else float(min(int(ch.height), container.height()))
-                w_val, h_val = clamp_dims_for_border(max(1.0, w_target), max(1.0, h_target), ch)
-                rect = QRectF(x_cursor, float(container.top()), w_val, h_val)
-                ch.preview_pos = (int(rect.x()), int(rect.y()))
-                frame_rects.append((rect, ch))
+                cw = ch.width or 0
+                ch_h = ch.height or 0
+                w_target = available_w if cw == 0 or cw > available_w else float(cw)
+                h_target = avail_h if ch_h == 0 or ch_h > avail_h else float(ch_h)
+                w_val, h_val = clamp_dims_for_border(
+                    w_target if w_target > 1.0 else 1.0, h_target if h_target > 1.0 else 1.0, ch
+                )
+                rect = QRectF(x_cursor, top, w_val, h_val)
+                ch.preview_pos = (int(x_cursor), int(top))
+                rects.append(rect)
+                frames.append(ch)
                 # Recurse for deeper nesting
                 layout_children(ch, rect)
                 # Advance cursor for next sibling
-                x_cursor = float(rect.right())
+                x_cursor += w_val
 
-        for f in top_level_frames:
-            layout_children(f, top_level_rects[f.name])
+        # Nothing is cut from another frame in single-frame and flat documents
+        if children_by_parent:
+            for f in top_level_frames:
+                layout_children(f, top_level_rects[f.name])
 
         # Fixed screen content area: always exactly one screen per selected ratio
         screen_rect = QRectF(0, 0, float(self.max_screen_width), float(self.max_screen_height))
         self.content_rect = screen_rect
 
+        # Incremental redraw: start over if the scene changed or was cleared elsewhere
+        if self._render_scene is not scene or not self._scene_items_alive(scene):
+            self._forget_scene_items()
+            self._render_scene = scene
+        # Element flow positions depend on every preceding element, so that layer is always rebuilt
+        self._remove_items(scene, self._flow_items)
+        flow = _ItemRecorder(scene, self._flow_items)
+
         # Draw backdrop behind frames
-        if working_doc.backdrop_bgcolor:
-            bg = self._color_from_token(working_doc.backdrop_bgcolor)
-            bg_item = scene.addRect(screen_rect, QPen(Qt.NoPen), QBrush(bg))
-            bg_item.setZValue(-100)
-        if working_doc.backdrop_image:
-            self._draw_backdrop_image(scene, screen_rect, working_doc.backdrop_image, working_doc.backdrop_mode)
+        backdrop_sig = (
+            working_doc.backdrop_bgcolor, working_doc.backdrop_image, working_doc.backdrop_mode,
+            screen_rect.width(), screen_rect.height(), self.resource_root, self.menu_root,
+        )
+        if backdrop_sig != self._backdrop_sig:
+            # Frames share z-values with the backdrop image and rely on being added after it
+            self._remove_items(scene, self._backdrop_items)
+            for _name, _sig, items in self._frame_items:
+                self._remove_items(scene, items)
+            self._frame_items.clear()
+            self._backdrop_sig = backdrop_sig
+            backdrop = _ItemRecorder(scene, self._backdrop_items)
+            if working_doc.backdrop_bgcolor:
+                bg = self._color_from_token(working_doc.backdrop_bgcolor)
+                bg_item = backdrop.addRect(screen_rect, self._no_pen, QBrush(bg))
+                bg_item.setZValue(-100)
+            if working_doc.backdrop_image:
+                self._draw_backdrop_image(backdrop, screen_rect, working_doc.backdrop_image, working_doc.backdrop_mode)
 
         # Now draw frames on top
         # Reset rect caches for a fresh top-level render
@@ -248,41 +463,38 @@ class RfmRenderer:
         self.element_rects.clear()
         self.frame_rects_by_doc.clear()
         self.element_rects_by_doc.clear()
-        for rect, frame in frame_rects:
+        # Reuse the longest unchanged run of frames; nested frames stack on equal z-values by
+        # insertion order, so everything after the first change is redrawn in order
+        frame_sigs = [self._frame_signature(rect, frame) for rect, frame in zip(rects, frames)]
+        keep = 0
+        for frame, sig, (name, prev_sig, _items) in zip(frames, frame_sigs, self._frame_items):
+            if name != frame.name or sig != prev_sig:
+                break
+            keep += 1
+        for _name, _sig, items in self._frame_items[keep:]:
+            self._remove_items(scene, items)
+        del self._frame_items[keep:]
+        for i in range(keep, len(frames)):
             # Draw full frame rect; items outside the screen are naturally clipped by the scene rect
-            self._draw_frame(scene, rect, frame)
-            self.frame_rects[frame.name] = rect
-            try:
-                dk = self._doc_key_of(working_doc)
-                self.frame_rects_by_doc.setdefault(dk, {})[frame.name] = rect
-            except Exception:
-                pass
-
-        # If any frame extends beyond the visible screen bottom, draw a stronger bottom fade as a hint
+            items: list[QGraphicsItem] = []
+            self._draw_frame(_ItemRecorder(scene, items), rects[i], frames[i])
+            self._frame_items.append((frames[i].name, frame_sigs[i], items))
+        by_name = dict(zip([f.name for f in frames], rects))
+        self.frame_rects.update(by_name)
         try:
-            extends_below = any(r.bottom() > screen_rect.bottom() for r, _ in frame_rects)
-            if extends_below:
-                from PySide6.QtGui import QLinearGradient
-                fade_h = 28.0
-                fade_rect = QRectF(
-                    screen_rect.left(),
-                    screen_rect.bottom() - fade_h,
-                    screen_rect.width(),
-                    fade_h,
-                )
-                grad = QLinearGradient(fade_rect.left(), fade_rect.top(), fade_rect.left(), fade_rect.bottom())
-                # Transparent to a stronger dark overlay for clearer indication
-                grad.setColorAt(0.0, QColor(0, 0, 0, 0))
-                grad.setColorAt(0.5, QColor(0, 0, 0, 140))
-                grad.setColorAt(1.0, QColor(0, 0, 0, 220))
-                fade_item = scene.addRect(fade_rect, QPen(Qt.NoPen), QBrush(grad))
-                fade_item.setZValue(9000)
+            self.frame_rects_by_doc.setdefault(self._doc_key_of(working_doc), {}).update(by_name)
         except Exception:
             pass
 
+        # Checked per laid-out rect: negative sizes and children bumped to one pixel can end below
+        # the stack, so neither the stack height nor the frame count decides it
+        screen_bottom = screen_rect.bottom()
+        if any(r.bottom() > screen_bottom for r in rects):
+            self._draw_overflow_fade(flow, screen_rect)
+
         # Simple content renderer: lay out elements within the first frame rect
-        host_rect = frame_rects[0][0] if frame_rects else screen_rect
-        self._draw_elements(scene, working_doc, host_rect)
+        host_rect = rects[0] if rects else screen_rect
+        self._draw_elements(flow, working_doc, host_rect, screen_rect)
 
         # Optionally render sub-documents referenced by frame.page into each frame's inner area
         if self.subframe_rendering_enabled:
@@ -291,7 +503,7 @@ class RfmRenderer:
                 base_key: Optional[str] = getattr(working_doc, 'file_path', None)
                 if isinstance(base_key, str) and base_key:
                     visited.add(base_key)
-                for rect, frame in frame_rects:
+                for rect, frame in zip(rects, frames):
                     page_name = getattr(frame, 'page', None)
                     if not page_name:
                         continue
@@ -310,10 +522,36 @@ class RfmRenderer:
                     inner = self._inner_rect_of(rect, frame)
                     if inner.width() <= 0 or inner.height() <= 0:
                         continue
-                    self._render_document_into(subdoc, scene, inner, visited | ({sub_key} if isinstance(sub_key, str) and sub_key else set()))
+                    self._render_document_into(subdoc, flow, inner, visited | ({sub_key} if isinstance(sub_key, str) and sub_key else set()))
             except Exception:
                 pass
 
+        # Rasterize each caption once: later repaints (selection overlay, scene updates) blit the
+        # cached pixmap instead of laying out and drawing the glyphs again
+        for item in self._flow_items:
+            if isinstance(item, QGraphicsSimpleTextItem):
+                item.setCacheMode(QGraphicsItem.CacheMode.DeviceCoordinateCache)
+
+    def _draw_overflow_fade(self, scene: QGraphicsScene, screen_rect: QRectF) -> None:
+        # Frames extend beyond the visible screen bottom: draw a stronger bottom fade as a hint
+        fade_h = 28.0
+        fade_rect = QRectF(
+            screen_rect.left(),
+            screen_rect.bottom() - fade_h,
+            screen_rect.width(),
+            fade_h,
+        )
+        if self._fade_brush is None or self._fade_rect != fade_rect:
+            grad = QLinearGradient(fade_rect.left(), fade_rect.top(), fade_rect.left(), fade_rect.bottom())
+            # Transparent to a stronger dark overlay for clearer indication
+            grad.setColorAt(0.0, QColor(0, 0, 0, 0))
+            grad.setColorAt(0.5, QColor(0, 0, 0, 140))
+            grad.setColorAt(1.0, QColor(0, 0, 0, 220))
+            self._fade_brush = QBrush(grad)
+            self._fade_rect = fade_rect
+        fade_item = scene.addRect(fade_rect, self._no_pen, self._fade_brush)
+        fade_item.setZValue(9000)
+
     def _draw_frame(self, scene: QGraphicsScene, rect: QRectF, frame: RfmFrame) -> None:
         # Preview outline: only draw when an actual border is present (non-zero, non-clear)
         draw_preview_outline = (
@@ -324,13 +562,10 @@ class RfmRenderer:
             and str(frame.border_line_color).lower() != "clear"
         )
         if draw_preview_outline:
-            outer_pen = QPen(QColor(120, 160, 220, 180))
-            outer_pen.setWidth(1)
-            outer_pen.setCosmetic(True)
-            outline_inset = outer_pen.widthF() / 2.0
-            outline_rect = rect.adjusted(outline_inset, outline_inset, -outline_inset, -outline_inset)
+            # Half of the shared 1px cosmetic outline pen, keeping the stroke inside rect
+            outline_rect = rect.adjusted(0.5, 0.5, -0.5, -0.5)
             if outline_rect.width() > 0 and outline_rect.height() > 0:
-                oitem = scene.addRect(outline_rect, outer_pen)
+                oitem = scene.addRect(outline_rect, self._outline_pen)
                 try:
                     oitem.setZValue(-50)
                 except Exception:
@@ -338,10 +573,7 @@ class RfmRenderer:
         else:
             # Fallback: draw a subtle dashed outline so frames are visible even without border/backfill
             try:
-                pen = QPen(QColor(120, 160, 220, 110))
-                pen.setCosmetic(True)
-                pen.setWidth(1)
-                pen.setStyle(Qt.PenStyle.DashLine)
+                pen = self._dashed_outline_pen
                 orect = rect.adjusted(0.5, 0.5, -0.5, -0.5)
                 if orect.width() > 0 and orect.height() > 0:
                     oitem = scene.addRect(orect, pen)
@@ -360,7 +592,7 @@ class RfmRenderer:
                 # Backfill: inside the border region
                 if frame.backfill_color:
                     fill_color = self._color_from_token(frame.backfill_color)
-                    bitem = scene.addRect(inner, QPen(Qt.NoPen), QBrush(fill_color))
+                    bitem = scene.addRect(inner, self._no_pen, QBrush(fill_color))
                     try:
                         bitem.setZValue(-60)
                     except Exception:
@@ -383,7 +615,7 @@ class RfmRenderer:
             if getattr(frame, 'backfill_color', None):
                 fill_color = self._color_from_token(frame.backfill_color)
                 if rect.width() > 0 and rect.height() > 0:
-                    bitem = scene.addRect(rect, QPen(Qt.NoPen), QBrush(fill_color))
+                    bitem = scene.addRect(rect, self._no_pen, QBrush(fill_color))
                     try:
                         bitem.setZValue(-60)
                     except Exception:
@@ -391,8 +623,20 @@ class RfmRenderer:
 
         # Frame label is drawn by the main window as a top-most overlay; do not draw it here to avoid duplicates
 
-    def _draw_elements(self, scene: QGraphicsScene, doc: RfmDocument, host_rect: QRectF) -> None:
+    def _draw_elements(
+        self,
+        scene: QGraphicsScene,
+        doc: RfmDocument,
+        host_rect: QRectF,
+        exposed: QRectF | None = None,
+    ) -> None:
+        """Lay out and draw doc's elements inside host_rect.
+
+        Elements flow strictly downward, so once the line cursor passes the bottom of the
+        exposed rect nothing further can be visible and the rest are not built.
+        """
         dk = self._doc_key_of(doc)
+        exposed_bottom = exposed.bottom() if exposed is not None else None
         # Layout state
         mode = "normal"  # normal | left | right | center
         cursor_x = host_rect.x() + 12
@@ -432,7 +676,7 @@ class RfmRenderer:
                     except Exception:
                         pass
                     item.setPos(QPointF(x, cursor_y))
-                    rect = item.mapRectToScene(item.boundingRect())
+                    rect = item.boundingRect().translated(x, cursor_y)
                     if seg_idx is not None:
                         self.element_rects[int(seg_idx)] = rect
                         try:
@@ -447,12 +691,12 @@ class RfmRenderer:
                         pm_item.setTransformationMode(Qt.TransformationMode.FastTransformation)
                     except Exception:
                         pass
-                    draw_rect = pm_item.mapRectToScene(pm_item.boundingRect())
+                    draw_rect = pm_item.boundingRect()
                     # Overlay text if any
                     ov_text = it.get("overlay_text")
                     if ov_text:
                         t_item = QGraphicsSimpleTextItem(str(ov_text))
-                        t_item.setBrush(QColor(210, 210, 210))
+                        t_item.setBrush(self._label_brush)
                         ox = int(it.get("overlay_xoff") or 0)
                         oy = int(it.get("overlay_yoff") or 0)
                         t_item.setPos(QPointF(x + ox, cursor_y + oy))
@@ -465,7 +709,7 @@ class RfmRenderer:
                     try:
                         if bool(it.get("bolt")):
                             b_item = QGraphicsSimpleTextItem("B")
-                            b_item.setBrush(QColor(255, 200, 0))
+                            b_item.setBrush(self._bolt_brush)
                             iw = float(it.get("width", pm.width()))
                             bx = x + max(0.0, iw - b_item.boundingRect().width() - 3.0)
                             by = cursor_y + 2.0
@@ -487,11 +731,11 @@ class RfmRenderer:
                 elif kind == "image_placeholder":
                     w = float(it.get("width", 80.0))
                     h = float(it.get("height", 32.0))
-                    rect_item = scene.addRect(QRectF(x, cursor_y, w, h), QPen(QColor(140, 140, 140)), QBrush(QColor(90, 90, 90)))
+                    rect_item = scene.addRect(QRectF(x, cursor_y, w, h), self._placeholder_pen, self._placeholder_brush)
                     from pathlib import Path as _P
                     pth = it.get("path") or ""
                     label = scene.addSimpleText((_P(pth).name if pth else "<image>"))
-                    label.setBrush(QColor(210, 210, 210))
+                    label.setBrush(self._label_brush)
                     label.setPos(QPointF(x + 6, cursor_y + 6))
                     try:
                         label.setZValue(20000)
@@ -501,7 +745,7 @@ class RfmRenderer:
                     try:
                         if bool(it.get("bolt")):
                             b_item = QGraphicsSimpleTextItem("B")
-                            b_item.setBrush(QColor(255, 200, 0))
+                            b_item.setBrush(self._bolt_brush)
                             bx = x + max(0.0, w - b_item.boundingRect().width() - 3.0)
                             by = cursor_y + 2.0
                             b_item.setPos(QPointF(bx, by))
@@ -512,7 +756,7 @@ class RfmRenderer:
                             scene.addItem(b_item)
                     except Exception:
                         pass
-                    draw_rect = rect_item.mapRectToScene(rect_item.rect())
+                    draw_rect = rect_item.rect()
                     if seg_idx is not None:
                         self.element_rects[int(seg_idx)] = draw_rect
                 x += float(it.get("width", 0.0)) + spacing
@@ -535,6 +779,9 @@ class RfmRenderer:
 
         self.element_rects.clear()
         for elem in doc.elements:
+            # Below the visible area: skip the remaining elements (and any pending centered row)
+            if exposed_bottom is not None and cursor_y > exposed_bottom:
+                return
             # Handle layout commands that affect following elements
             if elem.name in {"center", "left", "right", "normal"}:
                 # If exiting center mode, flush any pending row first
@@ -559,7 +806,7 @@ class RfmRenderer:
                 content = (elem.atext + " " if getattr(elem, 'atext', None) else "") + base_text
                 if mode == "center":
                     item: QGraphicsSimpleTextItem = scene.addSimpleText(content)
-                    item.setBrush(QColor(240, 240, 240))
+                    item.setBrush(self._text_brush)
                     rect_local = item.boundingRect()
                     w = float(rect_local.width()); h = float(rect_local.height())
                     available_w = float(line_end_x - line_start_x)
@@ -573,7 +820,7 @@ class RfmRenderer:
                         item.setZValue(20000)
                     except Exception:
                         pass
-                    rect = item.mapRectToScene(item.boundingRect())
+                    rect = rect_local.translated(cx, cursor_y)
                     self.element_rects[elem.segment_index] = rect
                     try:
                         self.element_rects_by_doc.setdefault(dk, {})[int(elem.segment_index)] = rect
@@ -583,7 +830,7 @@ class RfmRenderer:
                     try:
                         if getattr(elem, 'bolt', None) or getattr(elem, 'bbolt', None):
                             b_item = QGraphicsSimpleTextItem("B")
-                            b_item.setBrush(QColor(255, 200, 0))
+                            b_item.setBrush(self._bolt_brush)
                             bx = rect.right() - b_item.boundingRect().width() - 3.0
                             by = rect.top() + 2.0
                             b_item.setPos(QPointF(bx, by))
@@ -598,7 +845,7 @@ class RfmRenderer:
                     new_line()
                 else:
                     item: QGraphicsSimpleTextItem = scene.addSimpleText(content)
-                    item.setBrush(QColor(240, 240, 240))
+                    item.setBrush(self._text_brush)
                     # Measure
                     rect_local = item.boundingRect()
                     w = rect_local.width()
@@ -613,7 +860,7 @@ class RfmRenderer:
                         item.setZValue(20000)
                     except Exception:
                         pass
-                    rect = item.mapRectToScene(item.boundingRect())
+                    rect = rect_local.translated(x, cursor_y)
                     self.element_rects[elem.segment_index] = rect
                     try:
                         self.element_rects_by_doc.setdefault(dk, {})[int(elem.segment_index)] = rect
@@ -623,7 +870,7 @@ class RfmRenderer:
                     try:
                         if getattr(elem, 'bolt', None) or getattr(elem, 'bbolt', None):
                             b_item = QGraphicsSimpleTextItem("B")
-                            b_item.setBrush(QColor(255, 200, 0))
+                            b_item.setBrush(self._bolt_brush)
                             bx = rect.right() - b_item.boundingRect().width() - 3.0
                             by = rect.top() + 2.0
                             b_item.setPos(QPointF(bx, by))
@@ -646,8 +893,7 @@ class RfmRenderer:
                 if mode == "center" and center_row_items:
                     flush_center_row()
                 width = host_rect.width() - 24
-                pen = QPen(QColor(180, 180, 180, 200))
-                pen.setWidth(1)
+                pen = self._rule_pen
                 # Compute start X based on mode for br/hbr/hr
                 start_x = line_start_x
                 if mode == "right":
@@ -655,7 +901,7 @@ class RfmRenderer:
                 elif mode == "center":
                     start_x = (line_start_x + line_end_x - max(10.0, width)) / 2.0
                 line: QGraphicsLineItem = scene.addLine(start_x, cursor_y + 4, start_x + max(10.0, width), cursor_y + 4, pen)
-                rect = line.mapRectToScene(line.boundingRect())
+                rect = line.boundingRect()
                 self.element_rects[elem.segment_index] = rect
                 try:
                     self.element_rects_by_doc.setdefault(dk, {})[int(elem.segment_index)] = rect
@@ -665,7 +911,7 @@ class RfmRenderer:
                 try:
                     if getattr(elem, 'bolt', None) or getattr(elem, 'bbolt', None):
                         b_item = QGraphicsSimpleTextItem("B")
-                        b_item.setBrush(QColor(255, 200, 0))
+                        b_item.setBrush(self._bolt_brush)
                         bx = rect.right() - b_item.boundingRect().width() - 3.0
                         by = rect.top() + 2.0
                         b_item.setPos(QPointF(bx, by))
@@ -694,7 +940,7 @@ class RfmRenderer:
                 content = (atext + " " if atext else "") + display
                 if mode == "center":
                     item: QGraphicsSimpleTextItem = scene.addSimpleText(content)
-                    item.setBrush(QColor(240, 240, 240))
+                    item.setBrush(self._text_brush)
                     rect_local = item.boundingRect()
                     w = float(rect_local.width()); h = float(rect_local.height())
                     available_w = float(line_end_x - line_start_x)
@@ -708,7 +954,7 @@ class RfmRenderer:
                         item.setZValue(20000)
                     except Exception:
                         pass
-                    rect = item.mapRectToScene(item.boundingRect())
+                    rect = rect_local.translated(cx, cursor_y)
                     self.element_rects[elem.segment_index] = rect
                     try:
                         self.element_rects_by_doc.setdefault(dk, {})[int(elem.segment_index)] = rect
@@ -718,7 +964,7 @@ class RfmRenderer:
                     try:
                         if getattr(elem, 'bolt', None) or getattr(elem, 'bbolt', None):
                             b_item = QGraphicsSimpleTextItem("B")
-                            b_item.setBrush(QColor(255, 200, 0))
+                            b_item.setBrush(self._bolt_brush)
                             bx = rect.right() - b_item.boundingRect().width() - 3.0
                             by = rect.top() + 2.0
                             b_item.setPos(QPointF(bx, by))
@@ -733,7 +979,7 @@ class RfmRenderer:
                     new_line()
                 else:
                     item: QGraphicsSimpleTextItem = scene.addSimpleText(content)
-                    item.setBrush(QColor(240, 240, 240))
+                    item.setBrush(self._text_brush)
                     rect_local = item.boundingRect()
                     w = rect_local.width(); h = rect_local.height()
                     if mode == "right":
@@ -745,7 +991,7 @@ class RfmRenderer:
                         item.setZValue(20000)
                     except Exception:
                         pass
-                    rect = item.mapRectToScene(item.boundingRect())
+                    rect = rect_local.translated(x, cursor_y)
                     self.element_rects[elem.segment_index] = rect
                     try:
                         self.element_rects_by_doc.setdefault(dk, {})[int(elem.segment_index)] = rect
@@ -755,7 +1001,7 @@ class RfmRenderer:
                     try:
                         if getattr(elem, 'bolt', None) or getattr(elem, 'bbolt', None):
                             b_item = QGraphicsSimpleTextItem("B")
-                            b_item.setBrush(QColor(255, 200, 0))
+                            b_item.setBrush(self._bolt_brush)
                             bx = rect.right() - b_item.boundingRect().width() - 3.0
                             by = rect.top() + 2.0
                             b_item.setPos(QPointF(bx, by))
@@ -779,7 +1025,7 @@ class RfmRenderer:
                 # Minimal ticker: draw text once, same as text, but with wider default width
                 if mode == "center":
                     item: QGraphicsSimpleTextItem = scene.addSimpleText(elem.text_content)
-                    item.setBrush(QColor(240, 200, 120))
+                    item.setBrush(self._ticker_brush)
                     rect_local = item.boundingRect()
                     w = float(rect_local.width())
                     h = float(rect_local.height())
@@ -794,13 +1040,13 @@ class RfmRenderer:
                         item.setZValue(20000)
                     except Exception:
                         pass
-                    rect = item.mapRectToScene(item.boundingRect())
+                    rect = rect_local.translated(cx, cursor_y)
                     self.element_rects[elem.segment_index] = rect
                     # Bolt marker for ticker (center)
                     try:
                         if getattr(elem, 'bolt', None) or getattr(elem, 'bbolt', None):
                             b_item = QGraphicsSimpleTextItem("B")
-                            b_item.setBrush(QColor(255, 200, 0))
+                            b_item.setBrush(self._bolt_brush)
                             bx = rect.right() - b_item.boundingRect().width() - 3.0
                             by = rect.top() + 2.0
                             b_item.setPos(QPointF(bx, by))
@@ -815,7 +1061,7 @@ class RfmRenderer:
                     new_line()
                 else:
                     item: QGraphicsSimpleTextItem = scene.addSimpleText(elem.text_content)
-                    item.setBrush(QColor(240, 200, 120))
+                    item.setBrush(self._ticker_brush)
                     rect_local = item.boundingRect()
                     w = rect_local.width()
                     h = rect_local.height()
@@ -828,13 +1074,13 @@ class RfmRenderer:
                         item.setZValue(20000)
                     except Exception:
                         pass
-                    rect = item.mapRectToScene(item.boundingRect())
+                    rect = rect_local.translated(x, cursor_y)
                     self.element_rects[elem.segment_index] = rect
                     # Bolt marker for ticker
                     try:
                         if getattr(elem, 'bolt', None) or getattr(elem, 'bbolt', None):
                             b_item = QGraphicsSimpleTextItem("B")
-                            b_item.setBrush(QColor(255, 200, 0))
+                            b_item.setBrush(self._bolt_brush)
                             bx = rect.right() - b_item.boundingRect().width() - 3.0
                             by = rect.top() + 2.0
                             b_item.setPos(QPointF(bx, by))
@@ -867,7 +1113,7 @@ class RfmRenderer:
                 try:
                     if getattr(elem, 'bolt', None) or getattr(elem, 'bbolt', None):
                         b_item = QGraphicsSimpleTextItem("B")
-                        b_item.setBrush(QColor(255, 200, 0))
+                        b_item.setBrush(self._bolt_brush)
                         bx = rect_blank.right() - b_item.boundingRect().width() - 3.0
                         by = rect_blank.top() + 2.0
                         b_item.setPos(QPointF(bx, by))
@@ -888,7 +1134,6 @@ class RfmRenderer:
                     # Place a single centered image per line
                     try:
                         from .m32lib import qpixmap_from_m32_file
-                        from PySide6.QtGui import QPixmap
                         pm: QPixmap | None = None
                         resolved = self._resolve_image_path(path) if path else None
                         if resolved and resolved.lower().endswith(".m32"):
@@ -911,13 +1156,13 @@ class RfmRenderer:
                             pm_item.setTransformationMode(Qt.TransformationMode.FastTransformation)
                         except Exception:
                             pass
-                        draw_rect = pm_item.mapRectToScene(pm_item.boundingRect())
+                        draw_rect = pm_item.boundingRect()
                         # Overlay text
                         if getattr(elem, 'overlay_text', None) and draw_rect is not None:
                             ox = (elem.overlay_xoff or 0)
                             oy = (elem.overlay_yoff or 0)
                             t_item = scene.addSimpleText(elem.overlay_text)
-                            t_item.setBrush(QColor(210, 210, 210))
+                            t_item.setBrush(self._label_brush)
                             t_item.setPos(QPointF(cx + ox, cursor_y + oy))
                             try:
                                 t_item.setZValue(20000)
@@ -927,7 +1172,7 @@ class RfmRenderer:
                         try:
                             if getattr(elem, 'bolt', None) or getattr(elem, 'bbolt', None):
                                 b_item = QGraphicsSimpleTextItem("B")
-                                b_item.setBrush(QColor(255, 200, 0))
+                                b_item.setBrush(self._bolt_brush)
                                 bx = cx + max(0.0, iw - b_item.boundingRect().width() - 3.0)
                                 by = cursor_y + 2.0
                                 b_item.setPos(QPointF(bx, by))
@@ -955,10 +1200,10 @@ class RfmRenderer:
                             cx = float(int(round(start_x_f)))
                         except Exception:
                             cx = start_x_f
-                        rect_item = scene.addRect(QRectF(cx, cursor_y, w_pl, h_pl), QPen(QColor(140, 140, 140)), QBrush(QColor(90, 90, 90)))
+                        rect_item = scene.addRect(QRectF(cx, cursor_y, w_pl, h_pl), self._placeholder_pen, self._placeholder_brush)
                         from pathlib import Path as _P
                         label = scene.addSimpleText((_P(path).name if path else "<image>"))
-                        label.setBrush(QColor(210, 210, 210))
+                        label.setBrush(self._label_brush)
                         label.setPos(QPointF(cx + 6, cursor_y + 6))
                         try:
                             label.setZValue(20000)
@@ -967,7 +1212,7 @@ class RfmRenderer:
                         try:
                             if getattr(elem, 'bolt', None) or getattr(elem, 'bbolt', None):
                                 b_item = QGraphicsSimpleTextItem("B")
-                                b_item.setBrush(QColor(255, 200, 0))
+                                b_item.setBrush(self._bolt_brush)
                                 bx = cx + max(0.0, w_pl - b_item.boundingRect().width() - 3.0)
                                 by = cursor_y + 2.0
                                 b_item.setPos(QPointF(bx, by))
@@ -978,14 +1223,13 @@ class RfmRenderer:
                                 scene.addItem(b_item)
                         except Exception:
                             pass
-                        draw_rect = rect_item.mapRectToScene(rect_item.rect())
+                        draw_rect = rect_item.rect()
                         self.element_rects[elem.segment_index] = draw_rect
                         line_height = max(line_height, h_pl)
                         new_line()
                 else:
                     try:
                         from .m32lib import qpixmap_from_m32_file
-                        from PySide6.QtGui import QPixmap
                         pm: QPixmap | None = None
                         resolved = self._resolve_image_path(path) if path else None
                         if resolved and resolved.lower().endswith(".m32"):
@@ -1007,13 +1251,13 @@ class RfmRenderer:
                                 pm_item.setTransformationMode(Qt.TransformationMode.FastTransformation)
                             except Exception:
                                 pass
-                            draw_rect = pm_item.mapRectToScene(pm_item.boundingRect())
+                            draw_rect = pm_item.boundingRect()
                             # Draw overlay text if specified
                             if getattr(elem, 'overlay_text', None) and draw_rect is not None:
                                 ox = (elem.overlay_xoff or 0)
                                 oy = (elem.overlay_yoff or 0)
                                 t_item = scene.addSimpleText(elem.overlay_text)
-                                t_item.setBrush(QColor(210, 210, 210))
+                                t_item.setBrush(self._label_brush)
                                 t_item.setPos(QPointF(x + ox, cursor_y + oy))
                                 try:
                                     t_item.setZValue(20000)
@@ -1023,7 +1267,7 @@ class RfmRenderer:
                             try:
                                 if getattr(elem, 'bolt', None) or getattr(elem, 'bbolt', None):
                                     b_item = QGraphicsSimpleTextItem("B")
-                                    b_item.setBrush(QColor(255, 200, 0))
+                                    b_item.setBrush(self._bolt_brush)
                                     bx = x + max(0.0, float(iw) - b_item.boundingRect().width() - 3.0)
                                     by = cursor_y + 2.0
                                     b_item.setPos(QPointF(bx, by))
@@ -1045,11 +1289,11 @@ class RfmRenderer:
                             px = cursor_x - w
                         else:
                             px = cursor_x
-                        rect_item = scene.addRect(QRectF(px, cursor_y, w, h), QPen(QColor(140, 140, 140)), QBrush(QColor(90, 90, 90)))
+                        rect_item = scene.addRect(QRectF(px, cursor_y, w, h), self._placeholder_pen, self._placeholder_brush)
                         # Only show filename to reduce clutter
                         from pathlib import Path as _P
                         label = scene.addSimpleText((_P(path).name if path else "<image>"))
-                        label.setBrush(QColor(210, 210, 210))
+                        label.setBrush(self._label_brush)
                         label.setPos(QPointF(px + 6, cursor_y + 6))
                         try:
                             label.setZValue(20000)
@@ -1059,7 +1303,7 @@ class RfmRenderer:
                         try:
                             if getattr(elem, 'bolt', None) or getattr(elem, 'bbolt', None):
                                 b_item = QGraphicsSimpleTextItem("B")
-                                b_item.setBrush(QColor(255, 200, 0))
+                                b_item.setBrush(self._bolt_brush)
                                 bx = px + max(0.0, w - b_item.boundingRect().width() - 3.0)
                                 by = cursor_y + 2.0
                                 b_item.setPos(QPointF(bx, by))
@@ -1070,7 +1314,7 @@ class RfmRenderer:
                                 scene.addItem(b_item)
                         except Exception:
                             pass
-                        draw_rect = rect_item.mapRectToScene(rect_item.rect())
+                        draw_rect = rect_item.rect()
                         # Advance based on mode
                         if mode in {"normal", "left"}:
                             cursor_x = px + w + spacing
@@ -1094,26 +1338,37 @@ class RfmRenderer:
             flush_center_row()
 
     def _color_from_token(self, token: str) -> QColor:
-        t = token.strip()
+        cached = self._color_cache.get(token)
+        if cached is not None:
+            # Hand out a copy so callers can adjust it without touching the cache
+            return QColor(cached)
+        color = self._parse_color_token(token)
+        if len(self._color_cache) >= _COLOR_CACHE_MAX:
+            # Evict the oldest entry (dicts keep insertion order)
+            del self._color_cache[next(iter(self._color_cache))]
+        self._color_cache[token] = QColor(color)
+        return color
+
+    @staticmethod
+    def _parse_color_token(token: str) -> QColor:
+        t = token
+        # Tokens come from split tag words; only strip when there is whitespace to remove
+        if t and (t[0].isspace() or t[-1].isspace()):
+            t = t.strip()
+        n = len(t)
+        c0 = t[0] if n else ""
         # Treat common 'clear' value as fully transparent
-        if t.lower() == "clear":
+        if n == 5 and c0 in "cC" and t.lower() == "clear":
             return QColor(0, 0, 0, 0)
-        # Accept forms: 0xAARRGGBB or #AARRGGBB
+        # Accept forms: 0xAARRGGBB or #AARRGGBB, dispatched on the first character
         try:
-            if t.startswith("0x") or t.startswith("0X"):
+            val = None
+            if c0 == "0" and n > 1 and t[1] in "xX":
                 val = int(t, 16)
-                a = (val >> 24) & 0xFF
-                r = (val >> 16) & 0xFF
-                g = (val >> 8) & 0xFF
-                b = (val >> 0) & 0xFF
-                return QColor(r, g, b, a)
-            if t.startswith("#") and len(t) == 9:
+            elif c0 == "#" and n == 9:
                 val = int(t[1:], 16)
-                a = (val >> 24) & 0xFF
-                r = (val >> 16) & 0xFF
-                g = (val >> 8) & 0xFF
-                b = (val >> 0) & 0xFF
-                return QColor(r, g, b, a)
+            if val is not None:
+                return QColor((val >> 16) & 0xFF, (val >> 8) & 0xFF, val & 0xFF, (val >> 24) & 0xFF)
         except ValueError:
             pass
         # Fallback to a named color or default gray
@@ -1122,9 +1377,26 @@ class RfmRenderer:
             c = QColor(32, 32, 32)
         return c
 
-    def _draw_backdrop_image(self, scene: QGraphicsScene, rect: QRectF, path: str, mode: str | None) -> None:
-        from PySide6.QtGui import QPixmap
+    @staticmethod
+    def _cache_put(cache: dict, key, value) -> None:
+        if len(cache) >= _BACKDROP_CACHE_MAX:
+            # Evict the oldest entry (dicts keep insertion order)
+            del cache[next(iter(cache))]
+        cache[key] = value
+
+    def _load_backdrop_pixmap(self, path: str) -> tuple[str, int, QPixmap]:
+        """Return (source file, mtime_ns, pixmap) for a backdrop, decoding it only when the file changed."""
+        key = (path, self.resource_root, self.menu_root)
+        cached = self._backdrop_cache.get(key)
+        if cached is not None:
+            try:
+                if os.stat(cached[0]).st_mtime_ns == cached[1]:
+                    return cached
+            except OSError:
+                pass
+            del self._backdrop_cache[key]
         pm = None
+        source = path
         try:
             from .m32lib import qpixmap_from_m32_file
             if path.lower().endswith(".m32"):
@@ -1133,9 +1405,20 @@ class RfmRenderer:
             pm = None
         if pm is None:
             # Attempt resource/menu root resolution for relative paths (with .m32 default)
-            resolved = self._resolve_image_path(path) or path
-            from PySide6.QtGui import QPixmap
-            pm = QPixmap(resolved)
+            source = self._resolve_image_path(path) or path
+            pm = QPixmap(source)
+        try:
+            mtime = os.stat(source).st_mtime_ns
+        except OSError:
+            # Nothing on disk to validate against; load again next time
+            return source, -1, pm
+        entry = (source, mtime, pm)
+        if not pm.isNull():
+            self._cache_put(self._backdrop_cache, key, entry)
+        return entry
+
+    def _draw_backdrop_image(self, scene: QGraphicsScene, rect: QRectF, path: str, mode: str | None) -> None:
+        source, mtime, pm = self._load_backdrop_pixmap(path)
         if pm.isNull():
             # Fallback: indicate missing image with hatched box
             hatch = QBrush(QColor(60, 60, 60))
@@ -1146,10 +1429,16 @@ class RfmRenderer:
         if mode == "tile":
             brush = QBrush(pm)
             brush.setStyle(Qt.BrushStyle.TexturePattern)
-            item = scene.addRect(rect, QPen(Qt.NoPen), brush)
+            item = scene.addRect(rect, self._no_pen, brush)
             item.setZValue(-50)
         elif mode == "stretch":
-            scaled = pm.scaled(int(rect.width()), int(rect.height()), Qt.IgnoreAspectRatio, Qt.SmoothTransformation)
+            # The smooth resample is the expensive part; keep it for the same file and size
+            skey = (source, mtime, int(rect.width()), int(rect.height()))
+            scaled = self._backdrop_scaled_cache.get(skey)
+            if scaled is None:
+                scaled = pm.scaled(skey[2], skey[3], Qt.IgnoreAspectRatio, Qt.SmoothTransformation)
+                if mtime >= 0:
+                    self._cache_put(self._backdrop_scaled_cache, skey, scaled)
             item = scene.addPixmap(scaled)
             item.setOffset(rect.x(), rect.y())
             item.setZValue(-50)
@@ -1179,41 +1468,39 @@ class RfmRenderer:
             item.setZValue(-50)
 
     def selection_rect_for(self, payload, doc: RfmDocument) -> QRectF | None:
-        # Late import to avoid circular types in signatures
-        from .rfm_model import RfmFrame, RfmElement
-        dk = self._doc_key_of(doc)
-        if isinstance(payload, RfmFrame):
-            # Resolve rect within the current document context first
-            base = None
-            try:
-                base = self.frame_rects_by_doc.get(dk, {}).get(payload.name)
-            except Exception:
-                base = None
-            if base is None:
-                base = self.frame_rects.get(payload.name)
-            if base is None:
-                return None
-            inner = QRectF(base)
-            # Shrink by frame border width to move inside the decorative border region
-            bw = payload.border_width or 0
-            if bw > 0 and inner.width() > bw * 2 and inner.height() > bw * 2:
-                inner = inner.adjusted(bw, bw, -bw, -bw)
-            # Fallback if degenerate
-            if inner.width() <= 0 or inner.height() <= 0:
-                return base
-            return inner
-        if isinstance(payload, RfmElement):
-            try:
-                rect = self.element_rects_by_doc.get(dk, {}).get(int(payload.segment_index))
-            except Exception:
-                rect = None
-            if rect is not None:
-                return rect
-            return self.element_rects.get(payload.segment_index)
+        handler = self._selection_dispatch.get(type(payload))
+        if handler is not None:
+            return handler(payload, self._doc_key_of(doc))
         if isinstance(payload, tuple) and payload and payload[0] == "backdrop":
             return self.content_rect
         return None
 
+    def _frame_selection_rect(self, payload: RfmFrame, dk: str) -> QRectF | None:
+        # Resolve rect within the current document context first
+        base = None
+        try:
+            base = self.frame_rects_by_doc.get(dk, {}).get(payload.name)
+        except Exception:
+            base = None
+        if base is None:
+            base = self.frame_rects.get(payload.name)
+        if base is None:
+            return None
+        # Shrink by frame border width to move inside the decorative border region
+        bw = payload.border_width or 0
+        if bw > 0 and base.width() > bw * 2 and base.height() > bw * 2:
+            return base.adjusted(bw, bw, -bw, -bw)
+        return base
+
+    def _element_selection_rect(self, payload: RfmElement, dk: str) -> QRectF | None:
+        try:
+            rect = self.element_rects_by_doc.get(dk, {}).get(int(payload.segment_index))
+        except Exception:
+            rect = None
+        if rect is not None:
+            return rect
+        return self.element_rects.get(payload.segment_index)
+
     def _inner_rect_of(self, rect: QRectF, f: RfmFrame) -> QRectF:
         bw = float(getattr(f, 'border_width', 0) or 0)
         inner = rect.adjusted(bw, bw, -bw, -bw)
@@ -1303,7 +1590,7 @@ class RfmRenderer:
 
             # Elements: draw within the first frame rect (same simplified behavior as top-level)
             host_rect = frame_rects[0][0] if frame_rects else QRectF(0, 0, float(self.max_screen_width), float(self.max_screen_height))
-            self._draw_elements(scene, doc, host_rect.translated(container.left(), container.top()))
+            self._draw_elements(scene, doc, host_rect.translated(container.left(), container.top()), self.content_rect)
 
             # Recurse into sub-pages if enabled
             if self.subframe_rendering_enabled and self.page_resolver:
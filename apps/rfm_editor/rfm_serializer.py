@@ -1,17 +1,31 @@
 from __future__ import annotations
 
-from typing import List
+from typing import Iterator, List, Optional
 
 from .rfm_model import RfmDocument
 
 
-def serialize_rfm(doc: RfmDocument) -> str:
-    # Re-emit tokens, with any edited frame tags normalized to include width/height changes
-    output_parts: List[str] = []
+def format_backdrop_tag(mode: Optional[str], image: Optional[str], bgcolor: Optional[str]) -> str:
+    # Build a <backdrop ...> tag from model fields; unset fields are omitted
+    parts: List[str] = ["<backdrop"]
+    if mode:
+        parts.append(mode)
+    if image:
+        parts.append(image if ' ' not in image else f'"{image}"')
+    if bgcolor:
+        parts.append("bgcolor")
+        parts.append(bgcolor)
+    parts.append(">")
+    return " ".join(parts)
+
 
+def serialize_rfm_iter(doc: RfmDocument) -> Iterator[str]:
+    # Yield the serialized document piece by piece, with any edited frame tags normalized to include width/height changes
+    # Wrap inside <stm>..</stm> since tokenizer dropped the wrappers for logical editing
+    yield "<stm>\n"
     for idx, (kind, value) in enumerate(doc.segments):
         if kind == "text":
-            output_parts.append(value)
+            yield value
             continue
         # kind == 'tag'
         inner = value[1:-1].strip()
@@ -24,26 +38,16 @@ def serialize_rfm(doc: RfmDocument) -> str:
                     frame_obj = doc.frames.get(name)
                     break
             if frame_obj is not None:
-                output_parts.append(frame_obj.to_tag_str())
+                yield frame_obj.to_tag_str()
                 continue
         if low.startswith("backdrop") and doc.backdrop_segment_index == idx:
             # Rebuild backdrop from model
-            parts: List[str] = ["<backdrop"]
-            if doc.backdrop_mode:
-                parts.append(doc.backdrop_mode)
-            if doc.backdrop_image:
-                img = doc.backdrop_image
-                parts.append(img if (img and ' ' not in img) else f'"{img}"')
-            if doc.backdrop_bgcolor:
-                parts.append("bgcolor")
-                parts.append(doc.backdrop_bgcolor)
-            parts.append(">")
-            output_parts.append(" ".join(parts))
+            yield format_backdrop_tag(doc.backdrop_mode, doc.backdrop_image, doc.backdrop_bgcolor)
             continue
         # default: original (preserve exinclude and include tags as-is)
-        output_parts.append(value)
-
-    # Wrap inside <stm>..</stm> since tokenizer dropped the wrappers for logical editing
-    return "<stm>\n" + "".join(output_parts) + "\n</stm>\n"
+        yield value
+    yield "\n</stm>\n"
 
 
+def serialize_rfm(doc: RfmDocument) -> str:
+    return "".join(serialize_rfm_iter(doc))
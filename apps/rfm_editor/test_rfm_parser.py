@@ -0,0 +1,138 @@
+from __future__ import annotations
+
+from apps.rfm_editor import rfm_parser
+from apps.rfm_editor.rfm_model import RfmFrame
+from apps.rfm_editor.rfm_parser import _tokenize, parse_frame_tail, parse_rfm_content, parse_tail_keyword
+from apps.rfm_editor.rfm_serializer import serialize_rfm
+
+
+def test_frame_tail_fields_and_spans() -> None:
+    doc = parse_rfm_content('<frame a 10 20 page x cut "b" border 4 1 0xff00ff00 backfill red junk cpage v>')
+    f = doc.frames["a"]
+    assert (f.page, f.cut_from, f.cpage_cvar) == ("x", "b", "v")
+    assert (f.border_width, f.border_line_width, f.border_line_color) == (4, 1, "0xff00ff00")
+    assert f.backfill_color == "red"
+    assert f.tail_extra == "junk"
+    assert f._tail_token_spans == {"page": (0, 2), "cut": (2, 4), "border": (4, 8), "backfill": (8, 10), "cpage": (11, 13)}
+
+
+def test_parse_frame_tail_matches_initial_parse() -> None:
+    tail = 'page x cut "b" border 4 1 0xff00ff00 backfill red junk cpage v'
+    parsed = parse_rfm_content(f"<frame a 10 20 {tail}>").frames["a"]
+    f = RfmFrame(name="a", width=10, height=20)
+    parse_frame_tail(f, tail.split())
+    assert f.to_tag_str() == parsed.to_tag_str()
+    assert f._tail_token_spans == parsed._tail_token_spans
+
+
+def test_parse_tail_keyword_rejects_malformed() -> None:
+    f = RfmFrame(name="a", width=10, height=20)
+    assert parse_tail_keyword(f, ["border", "4", "x", "red"], 0) == -1
+    assert parse_tail_keyword(f, ["cursor"], 0) == -1
+    assert parse_tail_keyword(f, ["bogus", "1"], 0) == -1
+    assert parse_tail_keyword(f, ["cursor", "3"], 0) == 2
+    assert f.cursor == 3
+
+
+def test_tokenize_unterminated_tag_at_eof() -> None:
+    assert _tokenize("a<b c") == [("text", "a"), ("tag", "<b c")]
+
+
+def test_tokenize_quoted_gt_does_not_close_tag() -> None:
+    assert _tokenize('<image x tip "a>b"> y') == [("tag", '<image x tip "a>b">'), ("text", " y")]
+
+
+def test_tokenize_unterminated_quote_at_eof() -> None:
+    assert _tokenize('x <text "abc> z') == [("text", "x "), ("tag", '<text "abc> z')]
+
+
+def test_include_cycle_is_inlined_once(tmp_path) -> None:
+    a = tmp_path / "a.rmf"
+    b = tmp_path / "b.rmf"
+    a.write_text("<text A><include b>")
+    b.write_text("<text B><include a>")
+    doc = parse_rfm_content(a.read_text(), file_path=str(a))
+    assert doc.segments == [("tag", "<text A>"), ("tag", "<text B>"), ("tag", "<include a>")]
+    assert [e.text_content for e in doc.elements if e.name == "text"] == ["A", "B"]
+
+
+def test_tail_span_edit_round_trips_through_serializer() -> None:
+    doc = parse_rfm_content("<stm><frame a 10 20 border 4 1 red backfill blue extra></stm>")
+    f = doc.frames["a"]
+    start, end = f._tail_token_spans["border"]
+    new_tokens = f.raw_tail.split()
+    new_tokens[start + 3] = "0xff00ff00"
+    # What the properties panel does for an edit confined to one keyword span
+    assert parse_tail_keyword(f, new_tokens, start) == end
+    f.raw_tail = " ".join(new_tokens)
+    again = parse_rfm_content(serialize_rfm(doc)).frames["a"]
+    assert (again.border_width, again.border_line_width, again.border_line_color) == (4, 1, "0xff00ff00")
+    assert again.backfill_color == "blue"
+    assert again.tail_extra == "extra"
+
+
+def test_deleted_cached_include_resolves_again_in_same_parse(tmp_path) -> None:
+    (tmp_path / "b.rmf").write_text("<text RMF>")
+    (tmp_path / "b").write_text("<text BARE>")
+    main = str(tmp_path / "main.rmf")
+    assert parse_rfm_content("<include b>", file_path=main).segments == [("tag", "<text RMF>")]
+    (tmp_path / "b.rmf").unlink()
+    assert parse_rfm_content("<include b>", file_path=main).segments == [("tag", "<text BARE>")]
+
+
+def test_later_rmf_file_shadows_cached_bare_include(tmp_path) -> None:
+    (tmp_path / "b").write_text("<text BARE>")
+    main = str(tmp_path / "main.rmf")
+    assert parse_rfm_content("<include b>", file_path=main).segments == [("tag", "<text BARE>")]
+    (tmp_path / "b.rmf").write_text("<text RMF>")
+    assert parse_rfm_content("<include b>", file_path=main).segments == [("tag", "<text RMF>")]
+
+
+def test_include_caches_are_bounded(tmp_path, monkeypatch) -> None:
+    monkeypatch.setattr(rfm_parser, "_INCLUDE_CACHE_MAX", 2)
+    monkeypatch.setattr(rfm_parser, "_INCLUDE_PATH_CACHE", {})
+    monkeypatch.setattr(rfm_parser, "_INCLUDE_TOKEN_CACHE", {})
+    for name in ("x", "y", "z"):
+        (tmp_path / f"{name}.rmf").write_text(f"<text {name}>")
+    doc = parse_rfm_content("<include x><include y><include z>", file_path=str(tmp_path / "main.rmf"))
+    assert [e.text_content for e in doc.elements] == ["x", "y", "z"]
+    assert len(rfm_parser._INCLUDE_PATH_CACHE) <= 2
+    assert len(rfm_parser._INCLUDE_TOKEN_CACHE) <= 2
+
+
+def test_text_value_does_not_swallow_atext() -> None:
+    elem = parse_rfm_content('<text "q noshade hr atext "a b">').elements[0]
+    assert elem.atext == "a b"
+
+
+def test_element_parsers_only_cover_outline_tags() -> None:
+    assert rfm_parser._ELEMENT_PARSERS.keys() <= rfm_parser._OUTLINE_ELEMENT_TAGS
+
+
+def test_one_tag_of_each_parsed_kind() -> None:
+    doc = parse_rfm_content(
+        '<text "hi" tint ff0000>'
+        '<image pics/a tip "t" text "ov" 3 4>'
+        '<ctext menu_name noshade>'
+        '<ticker "news" width 80>'
+        "<hr width 30>"
+        "<blank height 12>"
+        "<bghoul models/m scale 1.5 time 2>"
+        "<center>"
+        '<list "a, b" noborder>'
+    )
+    by_name = {e.name: e for e in doc.elements}
+    assert (by_name["text"].text_content, by_name["text"].tint) == ("hi", "ff0000")
+    image = by_name["image"]
+    assert (image.image_path, image.tip_text, image.overlay_text, image.overlay_xoff, image.overlay_yoff) == (
+        "pics/a", "t", "ov", 3, 4,
+    )
+    assert (by_name["ctext"].cvar, by_name["ctext"].noshade) == ("menu_name", True)
+    assert (by_name["ticker"].text_content, by_name["ticker"].width_px) == ("news", 80)
+    assert by_name["hr"].width_px == 30
+    assert by_name["blank"].height_px == 12
+    bghoul = by_name["bghoul"]
+    assert (bghoul.model_name, bghoul.scale_val, bghoul.time_val) == ("models/m", 1.5, 2.0)
+    assert "center" in by_name
+    # Non-outline tags such as <list> stay in the segments but build no element
+    assert "list" not in by_name